@@ -29,6 +29,14 @@ def main():
     if not run_command('python tests/test_bitboard_book.py', 'Bitboard Implementation Tests'):
         all_passed = False
     
+    # Run bitboard core tests
+    if not run_command('python tests/test_bitboard_core.py', 'Bitboard Core Tests'):
+        all_passed = False
+    
+    # Run search engine tests
+    if not run_command('python tests/test_search_engines.py', 'Search Engine Tests'):
+        all_passed = False
+    
     # Run parallel engine tests
     if not run_command('python tests/test_parallel_engine.py', 'Parallel Engine Tests'):
         all_passed = False
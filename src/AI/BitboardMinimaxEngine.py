@@ -4,67 +4,112 @@
 #------------------------------------------------------------------------
 
 from AI.GameEngine import GameEngine
-from Reversi.BitboardGame import BitboardGame
+from Reversi.BitboardGame import BitboardGame, squares
 from Reversi.Game import Move
+from AI.TranspositionTable import TranspositionTable, TT_EXACT, TT_LOWER, TT_UPPER, NO_MOVE
+from AI.ProbCut import load_probcut, PROBCUT_FILE, PROBCUT_MIN_DEPTH, PROBCUT_VALUE_LIMIT
+from AI.LateMoveReductions import reduction_schedule, UNREDUCED_SQUARES
+from itertools import chain
 import time
 
 INFINITY = 10000
 
+# Default transposition table budget per engine (MB)
+DEFAULT_TT_MB = 16
+
+# Iterative deepening: deepest iteration when only a time/node budget is
+# given, and the share of the time budget after which no new iteration
+# is started (the next one would take several times longer)
+MAX_SEARCH_DEPTH = 60
+NEXT_ITERATION_TIME_SHARE = 0.4
+
+# Nodes between two budget checks (power of two minus one, used as a mask)
+BUDGET_CHECK_MASK = 255
+
+# Internal iterative deepening: PV nodes (open window) at least
+# IID_MIN_DEPTH deep without a hash move first search IID_REDUCTION plies
+# shallower to find one
+IID_MIN_DEPTH = 4
+IID_REDUCTION = 2
+
+# Enhanced transposition cutoffs: nodes at least this deep probe their
+# children's table entries for a refutation before searching any move
+ETC_MIN_DEPTH = 4
+
+# Static move order by square class, used with late move reductions (the
+# reduced tail are then X- and C-squares, rarely good): corners, edges
+# without C-squares, interior without X-squares, C-squares, X-squares
+X_SQUARES_MASK = 0x0042000000004200
+C_SQUARES_MASK = 0x4281000000008142
+ORDER_CLASS_MASKS = (
+    0x8100000000000081,
+    0x3C0081818181003C,
+    0x007E7E7E7E7E7E00 & ~X_SQUARES_MASK,
+    C_SQUARES_MASK,
+    X_SQUARES_MASK,
+)
+
 class BitboardMinimaxEngine(GameEngine):
     """
     Minimax engine optimized for bitboard representation.
     
     Features:
     - Bitboard-based move generation (ultra-fast)
-    - Zobrist hashing for transposition table
+    - Bounded transposition table (Zobrist keys), kept across moves
     - Optimized evaluation function
     - 50-100x faster than array-based version
     """
     
-    def __init__(self, evaluator=None):
+    def __init__(self, evaluator=None, tt_size_mb=DEFAULT_TT_MB):
         super().__init__("BitboardMinimax", evaluator)
         
-        # Transposition table with Zobrist hashing
-        self.transposition_table = {}
+        # Fixed-size transposition table, persistent across moves
+        self.transposition_table = TranspositionTable(tt_size_mb)
+        
+        # Search budget (iterative deepening); stopped aborts the search.
+        # stop_flag is an optional shared flag (multiprocessing.Value)
+        # raised by another process, e.g. the Lazy SMP main search, or
+        # the stop signal of a background search.
+        self.deadline = None
+        self.node_limit = None
+        self.stop_flag = None
+        self.stopped = False
+        self.completed_depth = 0
+        
+        # Optional callback receiving the best move so far (see report_progress)
+        self.progress = None
+        
+        # Multi-ProbCut selective search (see set_selectivity); off by default
+        self.selectivity = None
+        self.probcut = None
+        self.in_probcut = False
+        
+        # Late move reductions (see set_reductions); off by default.
+        # reduced / re_searches count the reduced searches of the last
+        # search and those re-searched at full depth.
+        self.reductions = None
+        self.reduced = 0
+        self.re_searches = 0
         
         # Move ordering heuristics (bit positions)
         self.corner_bits = {0, 7, 56, 63}  # a1, h1, a8, h8
         self.edge_bits = set(range(0, 8)) | set(range(56, 64)) | \
                         {8, 16, 24, 32, 40, 48} | {15, 23, 31, 39, 47, 55}
-        
-        # Zobrist hashing table (for position hashing)
-        import random
-        random.seed(42)  # Deterministic
-        self.zobrist_table = [[random.getrandbits(64) for _ in range(64)] for _ in range(2)]
-        self.zobrist_black_to_move = random.getrandbits(64)
     
     def get_zobrist_hash(self, game):
-        """Calculate Zobrist hash for position"""
-        h = 0
-        
-        # Hash black pieces
-        black_board = game.black
-        bit = 0
-        while black_board:
-            if black_board & 1:
-                h ^= self.zobrist_table[0][bit]
-            black_board >>= 1
-            bit += 1
-        
-        # Hash white pieces
-        white_board = game.white
-        bit = 0
-        while white_board:
-            if white_board & 1:
-                h ^= self.zobrist_table[1][bit]
-            white_board >>= 1
-            bit += 1
-        
-        # Hash turn
-        if game.turn == 'B':
-            h ^= self.zobrist_black_to_move
-        
-        return h
+        """Zobrist hash for position (maintained incrementally by BitboardGame)"""
+        return game.zobrist
+    
+    def terminal_value(self, game):
+        """Score of a finished game from the side to move's perspective"""
+        player, opponent = game._get_player_boards()
+        player_cnt = game._count_bits(player)
+        opponent_cnt = game._count_bits(opponent)
+        if player_cnt > opponent_cnt:
+            return INFINITY
+        if player_cnt < opponent_cnt:
+            return -INFINITY
+        return 0
     
     def evaluate_bitboard(self, game):
         """
@@ -109,79 +154,261 @@ class BitboardMinimaxEngine(GameEngine):
         
         return mobility * 3 + corner_score + edge_score
     
+    def start_budget(self, time_ms=None, node_limit=None):
+        """Arm (or disarm, without arguments) the time and node budget"""
+        self.deadline = time.perf_counter() + time_ms / 1000.0 if time_ms else None
+        self.node_limit = node_limit
+        self.stopped = False
+    
+    def check_budget(self):
+        """Flag the search as stopped once its time or node budget is spent"""
+        if ((self.deadline is not None and time.perf_counter() >= self.deadline) or
+                (self.node_limit is not None and self.nodes >= self.node_limit) or
+                (self.stop_flag is not None and self.stop_flag.value)):
+            self.stopped = True
+        return self.stopped
+    
+    def report_progress(self, game, depth, square, value):
+        """Pass the best move so far (and its depth) to the progress callback, if any"""
+        if self.progress is not None:
+            self.progress({'depth': depth, 'move': game.square_to_move(square),
+                           'value': value, 'nodes': self.nodes})
+    
+    def hash_move(self, game, table=None):
+        """
+        Best move stored for the position in the transposition table
+        (default: the engine's own), or NO_MOVE if none or not legal.
+        After a search it predicts the opponent's reply to our move.
+        """
+        table = table if table is not None else self.transposition_table
+        entry = table.probe(game.zobrist)
+        if entry is None or entry[3] == NO_MOVE or not game.get_valid_moves() >> entry[3] & 1:
+            return NO_MOVE
+        return entry[3]
+    
+    def evaluation_profile(self):
+        """Name of the evaluation function, selecting its ProbCut calibration"""
+        return type(self.evaluator).__name__ if self.evaluator else 'builtin'
+    
+    def new_root(self, root):
+        """
+        Search from a new root position (black, white, turn): the table
+        ages once per root, however many tasks of the search share it.
+        """
+        self.transposition_table.new_root(root)
+    
+    def set_selectivity(self, selectivity, path=PROBCUT_FILE):
+        """
+        Switch Multi-ProbCut on (selectivity: cut threshold in standard
+        deviations, lower = more selective) or off (None or 0), with the
+        calibration of this engine's evaluation from `path`.
+        """
+        self.selectivity = selectivity or None
+        self.probcut = None
+        if self.selectivity:
+            self.probcut = load_probcut(self.evaluation_profile(), self.selectivity, path)
+    
+    def set_reductions(self, schedule):
+        """
+        Switch late move reductions on with a schedule (a name of
+        AI.LateMoveReductions.LMR_SCHEDULES, a dict of ReductionSchedule
+        arguments or a ReductionSchedule) or off (None).
+        """
+        self.reductions = reduction_schedule(schedule)
+    
+    def late_move_reduction(self, depth, index, square, hash_square):
+        """Plies to reduce a move (0 = full depth): late, non-corner, non-hash moves only"""
+        if (self.reductions is None or square == hash_square or
+                UNREDUCED_SQUARES >> square & 1):
+            return 0
+        return self.reductions.reduction(depth, index)
+    
+    def try_probcut(self, game, depth, alpha, beta):
+        """
+        Multi-ProbCut test of a node: beta (alpha) if a null window
+        shallow search predicts the deep value at or above beta (at or
+        below alpha) with the configured confidence, otherwise None.
+        """
+        windows = self.probcut.windows(depth, 64 - game.black_cnt - game.white_cnt, alpha, beta)
+        if windows is None:
+            return None
+        shallow, high, low = windows
+        self.in_probcut = True
+        try:
+            if high < PROBCUT_VALUE_LIMIT and self.alphabeta(game, shallow, high - 1, high) >= high:
+                return beta
+            if low > -PROBCUT_VALUE_LIMIT and self.alphabeta(game, shallow, low, low + 1) <= low:
+                return alpha
+        finally:
+            self.in_probcut = False
+        return None
+    
+    def enhanced_cutoff(self, game, moves, depth, beta):
+        """
+        Enhanced transposition cutoff: a move whose child position is
+        already in the table, deep enough, with a value proving the
+        move >= beta (an upper or exact bound <= -beta for the opponent).
+        
+        Returns:
+            The refuting move's square, or NO_MOVE
+        """
+        table = self.transposition_table
+        for square in squares(moves):
+            flips = game.make(square)
+            entry = table.probe(game.zobrist)
+            game.unmake(square, flips)
+            if (entry is not None and entry[0] >= depth - 1 and entry[2] != TT_LOWER
+                    and -entry[1] >= beta):
+                return square
+        return NO_MOVE
+    
+    def internal_iterative_deepening(self, game, depth, alpha, beta):
+        """Hash move for a PV node without one, from a shallower search of the node"""
+        self.alphabeta(game, depth - IID_REDUCTION, alpha, beta)
+        return self.hash_move(game)
+    
     def alphabeta(self, game, depth, alpha, beta):
-        """Alpha-beta search optimized for bitboards"""
+        """
+        Alpha-beta search optimized for bitboards.
+        
+        The hash move (found by internal iterative deepening at PV nodes
+        without one) is searched first; enhanced transposition cutoffs
+        check the children's table entries before any move is searched.
+        With late move reductions, late moves are first searched
+        shallower with a null window and re-searched at full depth only
+        if they beat alpha.
+        """
         self.nodes += 1
+        if not self.nodes & BUDGET_CHECK_MASK and self.check_budget():
+            return 0
         
         # Transposition table lookup
-        pos_hash = self.get_zobrist_hash(game)
-        if pos_hash in self.transposition_table:
-            stored_depth, stored_value, stored_type = self.transposition_table[pos_hash]
+        pos_hash = game.zobrist
+        entry = self.transposition_table.probe(pos_hash)
+        hash_square = NO_MOVE
+        if entry is not None:
+            stored_depth, stored_value, stored_type, hash_square = entry
             if stored_depth >= depth:
-                if stored_type == 'exact':
+                if stored_type == TT_EXACT:
                     return stored_value
-                elif stored_type == 'lower' and stored_value >= beta:
+                elif stored_type == TT_LOWER and stored_value >= beta:
                     return stored_value
-                elif stored_type == 'upper' and stored_value <= alpha:
+                elif stored_type == TT_UPPER and stored_value <= alpha:
                     return stored_value
         
+        # Move generation, once per node: terminal detection, pass handling,
+        # move iteration and mobility evaluation all reuse the memoized
+        # move bitboards of this position
+        moves = game.get_valid_moves()
+        
         # Terminal conditions
-        if game.check_lost():
-            return -INFINITY
-        if game.check_win():
-            return INFINITY
+        if not moves and not game.get_opponent_moves():
+            return self.terminal_value(game)
         if depth == 0:
             return self.evaluate_bitboard(game)
         
-        # Get moves (ultra-fast with bitboards)
-        move_list = game.get_move_list()
-        
         # Handle pass
-        if len(move_list) == 0:
-            game.pass_turn()
+        if not moves:
+            game.make_pass()
             value = -self.alphabeta(game, depth - 1, -beta, -alpha)
-            game.undo_move()
+            game.unmake_pass()
             return value
         
-        # Search moves
+        # Multi-ProbCut: shallow searches predict the deep result
+        if self.probcut is not None and depth >= PROBCUT_MIN_DEPTH and not self.in_probcut:
+            value = self.try_probcut(game, depth, alpha, beta)
+            if value is not None:
+                return value
+        
+        # Enhanced transposition cutoff: a child's entry refutes the node
+        if depth >= ETC_MIN_DEPTH:
+            square = self.enhanced_cutoff(game, moves, depth, beta)
+            if square != NO_MOVE:
+                self.pruning += 1
+                self.transposition_table.store(pos_hash, depth, beta, TT_LOWER, square)
+                return beta
+        
+        # Hash move first (by internal iterative deepening at PV nodes)
+        if hash_square == NO_MOVE and beta - alpha > 1 and depth >= IID_MIN_DEPTH:
+            hash_square = self.internal_iterative_deepening(game, depth, alpha, beta)
+            if self.stopped:
+                return 0
+        if hash_square != NO_MOVE and moves >> hash_square & 1:
+            others = moves ^ (1 << hash_square)
+            first = (hash_square,)
+        else:
+            others = moves
+            first = ()
+        if self.reductions is None:
+            move_order = chain(first, squares(others))
+        else:
+            move_order = chain(first, *(squares(others & mask) for mask in ORDER_CLASS_MASKS))
+        
+        # Search moves (integer squares, no Move objects)
         best_value = -INFINITY
+        best_square = NO_MOVE
         original_alpha = alpha
         
-        for move in move_list:
-            game.move(move)
-            value = -self.alphabeta(game, depth - 1, -beta, -alpha)
-            game.undo_move()
+        for index, square in enumerate(move_order):
+            flips = game.make(square)
+            reduction = self.late_move_reduction(depth, index, square, hash_square)
+            if reduction:
+                self.reduced += 1
+                value = -self.alphabeta(game, depth - 1 - reduction, -alpha - 1, -alpha)
+                if value > alpha and not self.stopped:
+                    # Verification: beats alpha, re-search at full depth
+                    self.re_searches += 1
+                    value = -self.alphabeta(game, depth - 1, -beta, -alpha)
+            else:
+                value = -self.alphabeta(game, depth - 1, -beta, -alpha)
+            game.unmake(square, flips)
+            if self.stopped:
+                return 0
             
             if value > best_value:
                 best_value = value
+                best_square = square
             if value > alpha:
                 alpha = value
             if alpha >= beta:
+                # Fail soft: the value found is a tighter lower bound
+                # than beta (MTD(f) converges on it)
                 self.pruning += 1
-                self.transposition_table[pos_hash] = (depth, beta, 'lower')
-                return beta
+                self.transposition_table.store(pos_hash, depth, best_value, TT_LOWER, square)
+                return best_value
         
         # Store in transposition table
         if best_value <= original_alpha:
-            self.transposition_table[pos_hash] = (depth, best_value, 'upper')
+            self.transposition_table.store(pos_hash, depth, best_value, TT_UPPER)
         elif best_value >= beta:
-            self.transposition_table[pos_hash] = (depth, best_value, 'lower')
+            self.transposition_table.store(pos_hash, depth, best_value, TT_LOWER, best_square)
         else:
-            self.transposition_table[pos_hash] = (depth, best_value, 'exact')
+            self.transposition_table.store(pos_hash, depth, best_value, TT_EXACT, best_square)
         
         return best_value
     
-    def get_best_move(self, game, depth, player_name=None):
-        """Find best move using bitboard-optimized search"""
+    def get_best_move(self, game, depth, player_name=None, time_ms=None, node_limit=None):
+        """
+        Find best move using bitboard-optimized search.
+        
+        With time_ms or node_limit the search is iterative deepening up
+        to `depth` (unbounded if None) within that budget; otherwise a
+        fixed-depth search.
+        """
+        if time_ms or node_limit:
+            return self.iterative_deepening(game, depth, time_ms, node_limit, player_name)
+        
         self.nodes = 0
         self.pruning = 0
-        self.transposition_table.clear()
+        self.reduced = self.re_searches = 0
+        self.transposition_table.new_search()
+        self.start_budget()
         
         time_start = time.perf_counter()
         
         # Get moves
-        move_list = game.get_move_list()
-        if len(move_list) == 0:
+        root_squares = list(squares(game.get_valid_moves()))
+        if not root_squares:
             return None
         
         # Print header
@@ -204,11 +431,15 @@ class BitboardMinimaxEngine(GameEngine):
         best_move = None
         move_count = 0
         
-        # Search all moves
-        for move in move_list:
-            game.move(move)
+        # Search all moves (a stopped search keeps the best completed one)
+        for square in root_squares:
+            flips = game.make(square)
             value = -self.alphabeta(game, depth - 1, -INFINITY, -best_value)
-            game.undo_move()
+            game.unmake(square, flips)
+            if self.stopped:
+                print(f"{'--':<8} {'stopped':<10}")
+                break
+            move = game.square_to_move(square)
             
             # Print statistics BEFORE updating best_value
             time_diff = time.perf_counter() - time_start
@@ -228,6 +459,7 @@ class BitboardMinimaxEngine(GameEngine):
             if value > best_value or best_move is None:
                 best_value = value
                 best_move = move
+                self.report_progress(game, depth, square, value)
         
         # Summary
         time_total = time.perf_counter() - time_start
@@ -244,4 +476,127 @@ class BitboardMinimaxEngine(GameEngine):
         print("="*80 + "\n")
         
         return best_move
-
+    
+    def order_root_moves(self, game, root_squares):
+        """Initial root move order for iterative deepening"""
+        return list(root_squares)
+    
+    def search_root(self, game, depth, root_squares, guess=None):
+        """
+        Search the root moves in the given order.
+        
+        guess is the previous iteration's value (None on the first one),
+        for engines that search the root with an aspiration window.
+        
+        Returns:
+            (best_square, best_value), or None if the budget ran out
+        """
+        best_value = -INFINITY
+        best_square = None
+        
+        for square in root_squares:
+            flips = game.make(square)
+            value = -self.alphabeta(game, depth - 1, -INFINITY, -best_value)
+            game.unmake(square, flips)
+            if self.stopped:
+                return None
+            
+            if value > best_value or best_square is None:
+                best_value = value
+                best_square = square
+        
+        return best_square, best_value
+    
+    def iterative_deepening(self, game, max_depth=None, time_ms=None, node_limit=None,
+                            player_name=None):
+        """
+        Iterative deepening within a wall-clock and/or node budget.
+        
+        Searches depth 1, 2, ... until max_depth, the budget or the end
+        of the game. Every iteration starts with the previous best move
+        and reuses the transposition table it filled. An iteration cut
+        by the budget is discarded: the move of the last completed
+        iteration is returned.
+        
+        Args:
+            game: BitboardGame position
+            max_depth: Deepest iteration (None = no limit)
+            time_ms: Time budget in milliseconds
+            node_limit: Node budget
+            player_name: Name shown in the reasoning output
+        """
+        self.nodes = 0
+        self.pruning = 0
+        self.reduced = self.re_searches = 0
+        self.completed_depth = 0
+        self.transposition_table.new_search()
+        
+        root_squares = self.order_root_moves(game, squares(game.get_valid_moves()))
+        if not root_squares:
+            return None
+        
+        time_start = time.perf_counter()
+        self.start_budget(time_ms, node_limit)
+        
+        # Deeper than the number of empty squares only repeats the same tree
+        empties = 64 - game._count_bits(game.black | game.white)
+        max_depth = max(1, min(max_depth or MAX_SEARCH_DEPTH, empties))
+        
+        # Print header
+        print("\n" + "="*80)
+        if player_name:
+            print(f"⏱️  ITERATIVE DEEPENING - {player_name}")
+        else:
+            print("⏱️  ITERATIVE DEEPENING")
+        budget = []
+        if time_ms:
+            budget.append(f"{time_ms} ms")
+        if node_limit:
+            budget.append(f"{node_limit:,} nodes")
+        print(f"Budget: {' / '.join(budget)}, max depth {max_depth}")
+        print("="*80)
+        print(f"{'Depth':<8} {'Move':<8} {'Value':<10} {'Nodes':<10} {'Time(s)':<10} {'Rate':<12}")
+        print("-"*80)
+        
+        best_square = root_squares[0]
+        best_value = None
+        
+        for depth in range(1, max_depth + 1):
+            result = self.search_root(game, depth, root_squares, best_value)
+            if result is None:
+                print(f"{depth:<8} {'--':<8} {'aborted':<10} {self.nodes:>8d}")
+                break
+            
+            best_square, best_value = result
+            self.completed_depth = depth
+            self.report_progress(game, depth, best_square, best_value)
+            
+            time_diff = time.perf_counter() - time_start
+            time_rate = self.nodes / time_diff if time_diff > 0 else 0
+            print(f"{depth:<8} {str(game.square_to_move(best_square)):<8} {best_value:>8d}   "
+                  f"{self.nodes:>8d}   {time_diff:>8.3f}   {time_rate:>10.0f}")
+            
+            # Previous best first in the next iteration
+            root_squares.remove(best_square)
+            root_squares.insert(0, best_square)
+            
+            # Game decided within the horizon: deeper search cannot change it
+            if abs(best_value) >= INFINITY:
+                break
+            if time_ms and time_diff * 1000 >= time_ms * NEXT_ITERATION_TIME_SHARE:
+                break
+        
+        self.start_budget()
+        
+        # Summary
+        time_total = time.perf_counter() - time_start
+        best_move = game.square_to_move(best_square)
+        print("-"*80)
+        print(f"📊 SUMMARY:")
+        print(f"   • Completed depth: {self.completed_depth}")
+        print(f"   • Total nodes analyzed: {self.nodes:,}")
+        print(f"   • Total time: {time_total:.3f} seconds")
+        print(f"   • Selected move: {best_move} (value: {best_value})")
+        print("="*80 + "\n")
+        
+        return best_move
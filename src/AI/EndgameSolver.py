@@ -0,0 +1,413 @@
+#------------------------------------------------------------------------
+#    Endgame Solver - Exact Score on Bitboards
+#
+#    Perfect play for the last empties: searches to the end of the game
+#    and returns the exact final disc differential, or only win/loss/draw
+#    (null window around zero, solvable a few empties earlier). Works
+#    directly on (player, opponent) bitboard pairs, without BitboardGame
+#    objects.
+#------------------------------------------------------------------------
+
+from AI.TranspositionTable import TranspositionTable, TT_EXACT, TT_LOWER, TT_UPPER, NO_MOVE
+from Reversi.BitboardGame import FULL_BOARD, get_moves, get_flips, popcount, squares
+from Reversi.BitboardTables import (
+    CORNER_MASK, EDGE_MASK, FILE_A, FILE_H, RANK_1, RANK_8, NEIGHBORS, QUADRANT_MASKS,
+    LINES_HORIZONTAL, LINES_VERTICAL, LINES_DIAGONAL, LINES_ANTI_DIAGONAL,
+    ZOBRIST_BLACK_BYTES, ZOBRIST_WHITE_BYTES, zobrist_board
+)
+import time
+
+# Score bounds (final disc differential)
+SCORE_MAX = 64
+
+# Kinds of solver result, and win/draw/loss outcomes of a WLD solve
+RESULT_EXACT = 'exact'
+RESULT_WLD = 'wld'
+WIN, DRAW, LOSS = 1, 0, -1
+OUTCOME_NAMES = {WIN: 'win', DRAW: 'draw', LOSS: 'loss'}
+
+# Solver transposition table budget (MB)
+SOLVER_TT_MB = 4
+
+# Empties thresholds of the solver techniques
+SHALLOW_EMPTIES = 4          # specialized routines at and below
+TT_MIN_EMPTIES = 6           # transposition table at and above
+FASTEST_FIRST_MIN_EMPTIES = 6  # mobility ordering at and above (parity below)
+STABILITY_MIN_EMPTIES = 6    # stability cutoff at and above
+
+# Nodes between two budget checks
+BUDGET_CHECK_NODES = 1024
+
+NOT_FILE_A = FULL_BOARD ^ FILE_A
+NOT_FILE_H = FULL_BOARD ^ FILE_H
+
+
+def final_score(player, opponent):
+    """Disc differential of a finished game"""
+    return popcount(player) - popcount(opponent)
+
+
+def full_lines(occupied):
+    """
+    Squares lying on completely filled lines, per direction.
+
+    Returns:
+        (horizontal, vertical, diagonal, anti_diagonal) masks
+    """
+    result = []
+    for lines in (LINES_HORIZONTAL, LINES_VERTICAL, LINES_DIAGONAL, LINES_ANTI_DIAGONAL):
+        full = 0
+        for line in lines:
+            if occupied & line == line:
+                full |= line
+        result.append(full)
+    return result
+
+
+def stable_discs(own, occupied):
+    """
+    Discs of `own` that can never be flipped (conservative).
+
+    A disc is stable if along each of the 4 line directions it cannot be
+    bracketed: the line is full, or the disc touches the board edge or
+    a stable disc of its color on that line. Grown to a fixpoint from
+    the corners.
+    """
+    full_h, full_v, full_d, full_a = full_lines(occupied)
+    base_h = full_h | FILE_A | FILE_H
+    base_v = full_v | RANK_1 | RANK_8
+    base_d = full_d | EDGE_MASK
+    base_a = full_a | EDGE_MASK
+
+    stable = 0
+    while True:
+        new = own & \
+            (base_h | ((stable << 1) & NOT_FILE_A) | ((stable >> 1) & NOT_FILE_H)) & \
+            (base_v | (stable << 8) | (stable >> 8)) & \
+            (base_d | ((stable << 9) & NOT_FILE_A) | ((stable >> 9) & NOT_FILE_H)) & \
+            (base_a | ((stable << 7) & NOT_FILE_H) | ((stable >> 7) & NOT_FILE_A))
+        if new == stable:
+            return stable
+        stable = new
+
+
+def parity_order(empty, candidates):
+    """Candidate squares in odd-parity quadrants first"""
+    odd = 0
+    for quadrant in QUADRANT_MASKS:
+        if popcount(empty & quadrant) & 1:
+            odd |= quadrant
+    return list(squares(candidates & odd)) + list(squares(candidates & ~odd))
+
+
+class EndgameSolver:
+    """
+    Exact endgame solver.
+
+    Techniques:
+    - Alpha-beta with null-window scouts (PVS) on raw bitboards (no
+      game objects in the tree)
+    - Fastest-first ordering (least opponent mobility) far from the
+      end, quadrant parity ordering close to it
+    - Specialized routines for the last 1-4 empties: iterate the
+      empty squares directly, and score the final move from its flip
+      count without making it
+    - Stability cutoff: opponent's stable discs bound our best score
+    - Own small transposition table
+
+    Scores are final disc differentials from the side to move's
+    perspective (empty squares are not counted).
+    """
+
+    def __init__(self, tt_size_mb=SOLVER_TT_MB):
+        self.transposition_table = TranspositionTable(tt_size_mb)
+        self.nodes = 0
+
+        # Search budget; stopped aborts the solve. stop_flag is an
+        # optional shared flag raised by another process (parallel solve).
+        self.deadline = None
+        self.node_limit = None
+        self.stop_flag = None
+        self.stopped = False
+        self.next_check = BUDGET_CHECK_NODES
+
+    def start_budget(self, time_ms=None, node_limit=None):
+        """Arm (or disarm, without arguments) the time and node budget"""
+        self.deadline = time.perf_counter() + time_ms / 1000.0 if time_ms else None
+        self.node_limit = node_limit
+        self.stopped = False
+        self.next_check = self.nodes + BUDGET_CHECK_NODES
+
+    def check_budget(self):
+        """Flag the solve as stopped once its time or node budget is spent"""
+        if ((self.deadline is not None and time.perf_counter() >= self.deadline) or
+                (self.node_limit is not None and self.nodes >= self.node_limit) or
+                (self.stop_flag is not None and self.stop_flag.value)):
+            self.stopped = True
+        return self.stopped
+
+    def solve(self, game, alpha=-SCORE_MAX, beta=SCORE_MAX, time_ms=None, node_limit=None):
+        """
+        Solve a position exactly.
+
+        Args:
+            game: BitboardGame position
+            alpha, beta: Score window (a narrower window solves faster
+                         but only bounds the score outside it)
+            time_ms: Optional time budget in milliseconds
+            node_limit: Optional node budget
+
+        Returns:
+            (best_square, score), or None if the budget ran out.
+            best_square is None when the side to move must pass.
+        """
+        self.nodes = 0
+        self.transposition_table.new_search()
+        self.start_budget(time_ms, node_limit)
+
+        player, opponent = game._get_player_boards()
+        empty = FULL_BOARD & ~(player | opponent)
+        n_empties = popcount(empty)
+
+        moves = get_moves(player, opponent)
+        if not moves:
+            score = self.solve_board(player, opponent, alpha, beta, n_empties)
+            return None if self.stopped else (None, score)
+
+        ordered = self.order_root_moves(game, player, opponent, moves, empty, n_empties)
+        return self.solve_root(player, opponent, ordered, alpha, beta, n_empties)
+
+    def order_root_moves(self, game, player, opponent, moves, empty, n_empties):
+        """Root moves in search order (same ordering as inner nodes)"""
+        return self.order_moves(player, opponent, moves, empty, n_empties, NO_MOVE)
+
+    def solve_root(self, player, opponent, ordered, alpha, beta, n_empties):
+        """
+        Solve the root moves in the given order.
+
+        Returns:
+            (best_square, best_score), or None if the budget ran out
+        """
+        best_square = None
+        best_score = -SCORE_MAX - 1
+        for square in ordered:
+            flips = get_flips(square, player, opponent)
+            next_player = opponent ^ flips
+            next_opponent = player | flips | (1 << square)
+            if best_square is None:
+                score = -self.solve_board(next_player, next_opponent, -beta, -alpha, n_empties - 1)
+            else:
+                # Null-window scout, re-search only if it beats the best move
+                bound = max(alpha, best_score)
+                score = -self.solve_board(next_player, next_opponent, -bound - 1, -bound, n_empties - 1)
+                if bound < score < beta:
+                    score = -self.solve_board(next_player, next_opponent, -beta, -score, n_empties - 1)
+            if self.stopped:
+                return None
+            if score > best_score:
+                best_score = score
+                best_square = square
+                if score >= beta:
+                    break
+
+        return best_square, best_score
+
+    def solve_wld(self, game, time_ms=None, node_limit=None):
+        """
+        Solve a position for win/loss/draw only.
+
+        Searches the null window (-1, 1) around a draw: every node cuts
+        as soon as the sign of its score is known, which is much cheaper
+        than the exact score.
+
+        Returns:
+            (best_square, outcome) with outcome WIN, DRAW or LOSS, or None
+            if the budget ran out. best_square wins (or draws) if possible
+            and is None when the side to move must pass.
+        """
+        result = self.solve(game, -1, 1, time_ms, node_limit)
+        if result is None:
+            return None
+        square, score = result
+        return square, WIN if score > 0 else LOSS if score < 0 else DRAW
+
+    def solve_board(self, player, opponent, alpha, beta, n_empties):
+        """
+        Exact score of a position given as bitboards (fail-soft).
+
+        Args:
+            player, opponent: Discs of the side to move and of the other side
+            alpha, beta: Score window
+            n_empties: Number of empty squares
+        """
+        if n_empties <= SHALLOW_EMPTIES:
+            empty = FULL_BOARD & ~(player | opponent)
+            if n_empties == 0:
+                self.nodes += 1
+                return final_score(player, opponent)
+            if n_empties == 1:
+                self.nodes += 1
+                return self.solve_last(player, opponent, empty.bit_length() - 1)
+            return self.solve_shallow(player, opponent, alpha, beta,
+                                      parity_order(empty, empty))
+
+        self.nodes += 1
+        if self.nodes >= self.next_check:
+            self.next_check = self.nodes + BUDGET_CHECK_NODES
+            if self.check_budget():
+                return 0
+
+        # Stability cutoff: opponent's stable discs are lost for good
+        if n_empties >= STABILITY_MIN_EMPTIES and alpha > 0:
+            upper = SCORE_MAX - 2 * popcount(stable_discs(opponent, player | opponent))
+            if upper <= alpha:
+                return upper
+            if upper < beta:
+                beta = upper
+
+        # Transposition table
+        key = 0
+        tt_move = NO_MOVE
+        if n_empties >= TT_MIN_EMPTIES:
+            key = zobrist_board(player, ZOBRIST_BLACK_BYTES) ^ zobrist_board(opponent, ZOBRIST_WHITE_BYTES)
+            entry = self.transposition_table.probe(key)
+            if entry is not None:
+                _, stored_value, stored_type, tt_move = entry
+                if stored_type == TT_EXACT:
+                    return stored_value
+                elif stored_type == TT_LOWER and stored_value >= beta:
+                    return stored_value
+                elif stored_type == TT_UPPER and stored_value <= alpha:
+                    return stored_value
+
+        moves = get_moves(player, opponent)
+        if not moves:
+            if not get_moves(opponent, player):
+                return final_score(player, opponent)
+            return -self.solve_board(opponent, player, -beta, -alpha, n_empties)
+
+        empty = FULL_BOARD & ~(player | opponent)
+        original_alpha = alpha
+        best_score = -SCORE_MAX - 1
+        best_square = NO_MOVE
+
+        for square in self.order_moves(player, opponent, moves, empty, n_empties, tt_move):
+            flips = get_flips(square, player, opponent)
+            next_player = opponent ^ flips
+            next_opponent = player | flips | (1 << square)
+            if best_score == -SCORE_MAX - 1:
+                score = -self.solve_board(next_player, next_opponent, -beta, -alpha, n_empties - 1)
+            else:
+                # Null-window scout, re-search only if it beats alpha
+                score = -self.solve_board(next_player, next_opponent, -alpha - 1, -alpha, n_empties - 1)
+                if alpha < score < beta:
+                    score = -self.solve_board(next_player, next_opponent, -beta, -score, n_empties - 1)
+            if self.stopped:
+                return 0
+            if score > best_score:
+                best_score = score
+                best_square = square
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if key:
+            if best_score <= original_alpha:
+                self.transposition_table.store(key, n_empties, best_score, TT_UPPER)
+            elif best_score >= beta:
+                self.transposition_table.store(key, n_empties, best_score, TT_LOWER, best_square)
+            else:
+                self.transposition_table.store(key, n_empties, best_score, TT_EXACT, best_square)
+
+        return best_score
+
+    def order_moves(self, player, opponent, moves, empty, n_empties, tt_move):
+        """
+        Endgame move ordering.
+
+        - Transposition table move first
+        - Far from the end: fastest-first (fewest opponent replies),
+          corners breaking ties
+        - Close to the end: odd-parity quadrants first
+        """
+        if n_empties >= FASTEST_FIRST_MIN_EMPTIES:
+            scored = []
+            for square in squares(moves):
+                if square == tt_move:
+                    continue
+                flips = get_flips(square, player, opponent)
+                replies = popcount(get_moves(opponent ^ flips, player | flips | (1 << square)))
+                if (1 << square) & CORNER_MASK:
+                    replies -= 1
+                scored.append((replies, square))
+            scored.sort()
+            ordered = [square for _, square in scored]
+        else:
+            ordered = parity_order(empty, moves & ~(1 << tt_move if tt_move != NO_MOVE else 0))
+
+        if tt_move != NO_MOVE and moves & (1 << tt_move):
+            ordered.insert(0, tt_move)
+        return ordered
+
+    def solve_shallow(self, player, opponent, alpha, beta, empties):
+        """
+        Exact score with 2-4 empties (fail-soft).
+
+        Iterates the empty squares in the given (parity) order instead
+        of generating moves; legality is the flip test itself.
+        """
+        self.nodes += 1
+        best_score = -SCORE_MAX - 1
+
+        for index, square in enumerate(empties):
+            if not NEIGHBORS[square] & opponent:
+                continue
+            flips = get_flips(square, player, opponent)
+            if not flips:
+                continue
+            rest = empties[:index] + empties[index + 1:]
+            next_player = opponent ^ flips
+            next_opponent = player | flips | (1 << square)
+            if len(rest) == 1:
+                self.nodes += 1
+                score = -self.solve_last(next_player, next_opponent, rest[0])
+            else:
+                score = -self.solve_shallow(next_player, next_opponent, -beta, -alpha, rest)
+            if score > best_score:
+                best_score = score
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        return best_score
+
+        if best_score > -SCORE_MAX - 1:
+            return best_score
+
+        # No move: pass if the opponent can play, otherwise the game is over
+        for square in empties:
+            if NEIGHBORS[square] & player and get_flips(square, opponent, player):
+                return -self.solve_shallow(opponent, player, -beta, -alpha, empties)
+        return final_score(player, opponent)
+
+    def solve_last(self, player, opponent, square):
+        """
+        Exact score with one empty square, from flip counts alone
+        (no make/unmake): each flipped disc swings the score by 2,
+        plus 1 for the placed disc.
+        """
+        score = bin(player).count('1') - bin(opponent).count('1')
+
+        neighbors = NEIGHBORS[square]
+        if neighbors & opponent:
+            flips = get_flips(square, player, opponent)
+            if flips:
+                return score + 2 * bin(flips).count('1') + 1
+
+        # Player passes: opponent takes the last square if it can
+        if neighbors & player:
+            flips = get_flips(square, opponent, player)
+            if flips:
+                return score - 2 * bin(flips).count('1') - 1
+
+        return score
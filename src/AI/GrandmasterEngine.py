@@ -3,18 +3,73 @@
 #    Advanced move ordering + enhanced evaluation for maximum strength
 #------------------------------------------------------------------------
 
-from AI.ParallelBitboardMinimaxEngine import ParallelBitboardMinimaxEngine, INFINITY
+from AI.ParallelBitboardMinimaxEngine import (
+    ParallelBitboardMinimaxEngine, INFINITY, DEFAULT_TT_MB, SEARCH_AUTO, SEARCH_ROOT_SPLIT,
+    SEARCH_LAZY_SMP, improves_root_result
+)
+from AI.BitboardMinimaxEngine import BUDGET_CHECK_MASK, IID_MIN_DEPTH, ETC_MIN_DEPTH
+from AI.ProbCut import PROBCUT_MIN_DEPTH
+from AI.EndgameSolver import RESULT_EXACT, RESULT_WLD, WIN, DRAW, LOSS, OUTCOME_NAMES
+from AI.ParallelEndgameSolver import ParallelEndgameSolver
+from AI.TranspositionTable import TT_EXACT, TT_LOWER, TT_UPPER, NO_MOVE
+from AI.WorkerPool import BACKEND_PROCESS
+from Reversi.BitboardGame import squares, popcount
 from Reversi.Game import Move
 import time
 
+# Solve exactly from this many empty squares
+ENDGAME_EMPTIES = 14
+
+# Solve for win/loss/draw from this many empty squares (null window,
+# reaches a few empties deeper than the exact solve in the same time)
+WLD_EMPTIES = 16
+
+# Kind of result of a midgame search (heuristic value)
+RESULT_HEURISTIC = 'heuristic'
+
+# Aspiration window: half-width around the previous iteration's root
+# value (evaluation units; 0 = full window). Widened by ASPIRATION_GROWTH
+# after every fail low/high.
+ASPIRATION_WINDOW = 60
+ASPIRATION_GROWTH = 4
+
+# Share of a time budget given to the exact solver before falling back
+# to the midgame search
+ENDGAME_TIME_SHARE = 0.5
+
+# Strategic squares of the static move order
+CORNER_MASK = 0x8100000000000081       # a1, h1, a8, h8
+STABLE_EDGE_MASK = 0x7E0000000000007E  # Edges without X-squares
+CENTER_MASK = 0x0000001818000000       # d4, e4, d5, e5
+
+# Static priority of each square (corner > edge > center > others)
+SQUARE_PRIORITY = [1000 if (1 << square) & CORNER_MASK else
+                   500 if (1 << square) & STABLE_EDGE_MASK else
+                   100 if (1 << square) & CENTER_MASK else 0
+                   for square in range(64)]
+
+# Nodes at least this deep (near the root, large subtrees) order moves by
+# probing the opponent's mobility after each move; below, the history
+# and counter-move tables order them by lookup only
+MOBILITY_ORDER_DEPTH = 5
+
+# History scores are shifted right by this at every new search (aging)
+HISTORY_AGING_SHIFT = 1
+
 class GrandmasterEngine(ParallelBitboardMinimaxEngine):
     """
     Grandmaster engine with advanced strategic improvements:
     
-    1. Move Ordering - Corner/Edge/Mobility priority (2-3x speedup)
+    1. Move Ordering - Hash move, then Corner/Edge/Mobility priority near
+       the root (2-3x speedup)
     2. Enhanced Evaluation - X-squares, stability, frontier, parity (+30% strength)
-    3. Killer Move Heuristic - Remembers cutoff moves (1.3x speedup)
-    4. Parallel search with all improvements
+    3. History and Counter-Move Heuristics - Remember cutoff moves by
+       square, aged between searches; cheap ordering deeper in the tree
+    4. Principal Variation Search (null-window scouts) with aspiration
+       windows around the previous iteration's score
+    5. Parallel search with all improvements
+    6. Endgame solver: win/loss/draw first, exact score for the last empties,
+       split over the workers for large solves
     
     Expected performance:
     - Speedup: 3-5x vs base parallel (8-15x vs sequential)
@@ -22,83 +77,132 @@ class GrandmasterEngine(ParallelBitboardMinimaxEngine):
     - Total: 400-1000x vs standard AI
     """
     
-    def __init__(self, evaluator=None, num_workers=None):
-        super().__init__(evaluator, num_workers)
-        
-        # Killer move heuristic - stores moves that caused cutoff
-        self.killer_moves = {}  # {depth: [move1, move2]}
+    def __init__(self, evaluator=None, num_workers=None, tt_size_mb=DEFAULT_TT_MB,
+                 endgame_empties=ENDGAME_EMPTIES, wld_empties=WLD_EMPTIES,
+                 search_mode=SEARCH_AUTO, backend=BACKEND_PROCESS):
+        super().__init__(evaluator, num_workers, tt_size_mb, search_mode, backend)
+        
+        # History heuristic: depth² credited to moves that caused a
+        # cutoff, per side to move (0 = black) and square
+        self.history = [[0] * 64, [0] * 64]
+        
+        # Counter moves: the last cutoff reply per side to move and
+        # previous move square (NO_MOVE = pass or root)
+        self.counter_moves = [[NO_MOVE] * (NO_MOVE + 1), [NO_MOVE] * (NO_MOVE + 1)]
+        self.previous_square = NO_MOVE  # Move leading to the current node
+        self.history_root = None
+        
+        # Principal Variation Search and root aspiration window
+        # (switchable to compare node counts with plain alpha-beta)
+        self.use_pvs = True
+        self.aspiration_window = ASPIRATION_WINDOW
+        
+        # Endgame solver: WLD from wld_empties, exact from endgame_empties
+        # (large solves split over the same number and kind of workers)
+        self.endgame_empties = endgame_empties
+        self.wld_empties = wld_empties
+        self.endgame_solver = ParallelEndgameSolver(num_workers=self.num_workers,
+                                                    backend=self.backend)
+        
+        # Kind and value of the last move's result (see get_search_result)
+        self.result_kind = RESULT_HEURISTIC
+        self.result_value = None
         
         print(f"[GrandmasterEngine] Advanced strategy active!")
         print(f"  • Move ordering: Corner > Edge > Mobility")
         print(f"  • Evaluation: X-squares, Stability, Frontier, Parity")
-        print(f"  • Killer moves: 2 per depth level")
+        print(f"  • Ordering: hash move, counter moves, history (mobility near the root)")
+        print(f"  • Search: PVS, aspiration window ±{ASPIRATION_WINDOW}")
+        print(f"  • Endgame: WLD solver at {wld_empties}, exact at {endgame_empties} empties")
         print(f"  • Expected improvement: 3-5x speedup, +30% strength")
     
-    def order_moves(self, game, move_list):
+    def order_moves(self, game, square_list):
         """
         Advanced move ordering for maximum alpha-beta efficiency.
         
         Priority:
-        1. Killer moves (caused cutoff before)
-        2. Corners (always best)
-        3. Stable edges (adjacent to corners)
+        1. Corners (always best)
+        2. Stable edges (adjacent to corners)
+        3. Center squares
         4. Mobility reducers (limit opponent options)
-        5. Center squares
-        6. Others
         
-        Returns moves sorted by expected strength (best first).
+        Plays every move to count the opponent's replies, so interior
+        nodes use it only near the root (see MOBILITY_ORDER_DEPTH).
+        
+        Args:
+            game: BitboardGame position
+            square_list: Legal moves as square indices (0-63)
+        
+        Returns squares sorted by expected strength (best first).
         """
-        if not move_list:
+        if not square_list:
             return []
         
-        # Bit masks for strategic squares
-        corner_mask = 0x8100000000000081  # a1, h1, a8, h8
-        stable_edge_mask = 0x7E0000000000007E  # Edges without X-squares
-        center_mask = 0x0000001818000000  # d4, e4, d5, e5
-        
         scored_moves = []
         
-        for move in move_list:
-            score = 0
-            
-            # Get bit position
-            if isinstance(move, str):
-                # Convert move string to bit
-                col = ord(move[0].upper()) - ord('A')
-                row = int(move[1]) - 1
-                bit = row * 8 + col
-            else:
-                bit = (move.y - 1) * 8 + (move.x - 1)
-            
-            bit_mask = 1 << bit
-            
-            # 1. Corner: Maximum priority (+1000)
-            if bit_mask & corner_mask:
-                score += 1000
+        for square in square_list:
+            score = SQUARE_PRIORITY[square]
             
-            # 2. Stable edge: High priority (+500)
-            elif bit_mask & stable_edge_mask:
-                score += 500
+            # Mobility reduction: Check opponent moves after this
+            flips = game.make(square)
+            opponent_moves = popcount(game.get_valid_moves())
+            game.unmake(square, flips)
+            # Fewer opponent moves = better for us
+            score -= opponent_moves * 15
             
-            # 3. Center control: Medium priority (+100)
-            elif bit_mask & center_mask:
-                score += 100
-            
-            # 4. Mobility reduction: Check opponent moves after this
-            try:
-                game.move(move)
-                opponent_moves = len(game.get_move_list())
-                game.undo_move()
-                # Fewer opponent moves = better for us
-                score -= opponent_moves * 15
-            except:
-                pass
-            
-            scored_moves.append((score, move))
+            scored_moves.append((score, square))
         
         # Sort by score descending (best first)
         scored_moves.sort(reverse=True, key=lambda x: x[0])
-        return [move for _, move in scored_moves]
+        return [square for _, square in scored_moves]
+    
+    def order_interior_moves(self, game, moves, depth, hash_square):
+        """
+        Move order of an interior node: the hash move, the counter move
+        to the previous move, then the others by history score (static
+        square priority breaking ties), or by order_moves() near the root.
+        
+        Args:
+            game: BitboardGame position
+            moves: Legal moves bitboard
+            depth: Remaining depth of the node
+            hash_square: Best move stored in the transposition table
+        """
+        ordered = []
+        if hash_square != NO_MOVE and moves & (1 << hash_square):
+            ordered.append(hash_square)
+            moves ^= 1 << hash_square
+        color = 0 if game.turn == 'B' else 1
+        counter = self.counter_moves[color][self.previous_square]
+        if counter != NO_MOVE and moves & (1 << counter):
+            ordered.append(counter)
+            moves ^= 1 << counter
+        if moves:
+            if depth >= MOBILITY_ORDER_DEPTH:
+                ordered.extend(self.order_moves(game, list(squares(moves))))
+            else:
+                # History first; the static priority only breaks ties
+                history = self.history[color]
+                ordered.extend(sorted(squares(moves), reverse=True,
+                                      key=lambda sq: (history[sq] << 10) + SQUARE_PRIORITY[sq]))
+        return ordered
+    
+    def age_history(self):
+        """Age the history scores between searches (recent cutoffs weigh more)"""
+        for history in self.history:
+            for square in range(64):
+                history[square] >>= HISTORY_AGING_SHIFT
+    
+    def new_root(self, root):
+        """New search root: also ages the history, once per root position"""
+        super().new_root(root)
+        if root != self.history_root:
+            self.history_root = root
+            self.age_history()
+    
+    def evaluation_profile(self):
+        """ProbCut calibration of the advanced evaluation (see evaluate_advanced)"""
+        return 'grandmaster'
     
     def evaluate_advanced(self, game):
         """
@@ -130,12 +234,10 @@ class GrandmasterEngine(ParallelBitboardMinimaxEngine):
         score = 0
         
         # 1. MOBILITY (critical in midgame)
-        my_mobility = game._count_bits(game.get_valid_moves())
-        
-        # Calculate opponent mobility
-        game.pass_turn()
-        opponent_mobility = game._count_bits(game.get_valid_moves())
-        game.undo_move()
+        # Both sides' move bitboards are memoized by the game for this node
+        my_moves, opponent_moves = game.get_mobility()
+        my_mobility = popcount(my_moves)
+        opponent_mobility = popcount(opponent_moves)
         
         if phase == 'midgame':
             score += (my_mobility - opponent_mobility) * 15
@@ -250,118 +352,326 @@ class GrandmasterEngine(ParallelBitboardMinimaxEngine):
         return score
     
     def alphabeta(self, game, depth, alpha, beta):
-        """Alpha-beta with killer move ordering"""
+        """
+        Alpha-beta with history/counter-move ordering, as Principal
+        Variation Search.
+        
+        The first (best-ordered) move gets the full window, the others a
+        null window (alpha, alpha + 1) that only proves them worse; a move
+        that beats alpha is re-searched with the full window. Late moves
+        scout shallower first (late move reductions, if enabled) and get
+        the full-depth scout only if they beat alpha. Enhanced
+        transposition cutoffs and internal iterative deepening work as
+        in BitboardMinimaxEngine.alphabeta.
+        """
         self.nodes += 1
+        if not self.nodes & BUDGET_CHECK_MASK and self.check_budget():
+            return 0
+        
+        # Move leading here (counter-move key); the shallow ProbCut and
+        # IID searches below overwrite previous_square
+        previous = self.previous_square
         
         # Transposition table lookup
-        pos_hash = self.get_zobrist_hash(game)
-        if pos_hash in self.transposition_table:
-            stored_depth, stored_value, stored_type = self.transposition_table[pos_hash]
+        pos_hash = game.zobrist
+        entry = self.transposition_table.probe(pos_hash)
+        hash_square = NO_MOVE
+        if entry is not None:
+            stored_depth, stored_value, stored_type, hash_square = entry
             if stored_depth >= depth:
-                if stored_type == 'exact':
+                if stored_type == TT_EXACT:
                     return stored_value
-                elif stored_type == 'lower' and stored_value >= beta:
+                elif stored_type == TT_LOWER and stored_value >= beta:
                     return stored_value
-                elif stored_type == 'upper' and stored_value <= alpha:
+                elif stored_type == TT_UPPER and stored_value <= alpha:
                     return stored_value
         
+        # Move generation, once per node: terminal detection, pass handling,
+        # move iteration and mobility evaluation all reuse the memoized
+        # move bitboards of this position
+        moves = game.get_valid_moves()
+        
         # Terminal conditions
-        if game.check_lost():
-            return -INFINITY
-        if game.check_win():
-            return INFINITY
+        if not moves and not game.get_opponent_moves():
+            return self.terminal_value(game)
         if depth == 0:
             return self.evaluate_advanced(game)  # Use advanced evaluation
         
-        # Get moves
-        move_list = game.get_move_list()
-        
         # Handle pass
-        if len(move_list) == 0:
-            game.pass_turn()
+        if not moves:
+            game.make_pass()
+            self.previous_square = NO_MOVE
             value = -self.alphabeta(game, depth - 1, -beta, -alpha)
-            game.undo_move()
+            game.unmake_pass()
             return value
         
-        # ORDER MOVES with killer move priority
-        ordered_moves = []
-        
-        # First: Add killer moves if available
-        if depth in self.killer_moves:
-            for killer in self.killer_moves[depth]:
-                if killer in move_list:
-                    ordered_moves.append(killer)
+        # Multi-ProbCut: shallow searches predict the deep result
+        if self.probcut is not None and depth >= PROBCUT_MIN_DEPTH and not self.in_probcut:
+            value = self.try_probcut(game, depth, alpha, beta)
+            if value is not None:
+                return value
+            self.previous_square = previous
+        
+        # Enhanced transposition cutoff: a child's entry refutes the node
+        if depth >= ETC_MIN_DEPTH:
+            square = self.enhanced_cutoff(game, moves, depth, beta)
+            if square != NO_MOVE:
+                self.pruning += 1
+                self.transposition_table.store(pos_hash, depth, beta, TT_LOWER, square)
+                return beta
         
-        # Then: Order remaining moves strategically
-        remaining_moves = [m for m in move_list if m not in ordered_moves]
-        if remaining_moves:
-            ordered_moves.extend(self.order_moves(game, remaining_moves))
+        # Order moves: hash move (by internal iterative deepening at PV
+        # nodes without one), counter move, history scores
+        if hash_square == NO_MOVE and beta - alpha > 1 and depth >= IID_MIN_DEPTH:
+            hash_square = self.internal_iterative_deepening(game, depth, alpha, beta)
+            if self.stopped:
+                return 0
+            self.previous_square = previous
+        ordered_moves = self.order_interior_moves(game, moves, depth, hash_square)
         
         # Search moves
         best_value = -INFINITY
+        best_square = NO_MOVE
         original_alpha = alpha
         
-        for move in ordered_moves:
-            game.move(move)
-            value = -self.alphabeta(game, depth - 1, -beta, -alpha)
-            game.undo_move()
+        for index, move in enumerate(ordered_moves):
+            flips = game.make(move)
+            self.previous_square = move
+            if index == 0 or not self.use_pvs:
+                value = -self.alphabeta(game, depth - 1, -beta, -alpha)
+            else:
+                reduction = self.late_move_reduction(depth, index, move, hash_square)
+                if reduction:
+                    self.reduced += 1
+                    value = -self.alphabeta(game, depth - 1 - reduction, -alpha - 1, -alpha)
+                    if value > alpha and not self.stopped:
+                        # Verification: beats alpha, scout at full depth
+                        self.re_searches += 1
+                        self.previous_square = move
+                        value = -self.alphabeta(game, depth - 1, -alpha - 1, -alpha)
+                else:
+                    value = -self.alphabeta(game, depth - 1, -alpha - 1, -alpha)
+                if alpha < value < beta:
+                    self.previous_square = move
+                    value = -self.alphabeta(game, depth - 1, -beta, -alpha)
+            game.unmake(move, flips)
+            if self.stopped:
+                return 0
             
             if value > best_value:
                 best_value = value
+                best_square = move
             if value > alpha:
                 alpha = value
             if alpha >= beta:
-                # Beta cutoff - this is a killer move!
+                # Beta cutoff: credit the move in the ordering tables
                 self.pruning += 1
-                
-                # Store killer move
-                if depth not in self.killer_moves:
-                    self.killer_moves[depth] = []
-                if move not in self.killer_moves[depth]:
-                    self.killer_moves[depth].insert(0, move)
-                    # Keep only 2 killer moves per depth
-                    if len(self.killer_moves[depth]) > 2:
-                        self.killer_moves[depth].pop()
-                
-                self.transposition_table[pos_hash] = (depth, beta, 'lower')
-                return beta
+                color = 0 if game.turn == 'B' else 1
+                self.history[color][move] += depth * depth
+                self.counter_moves[color][previous] = move
+                self.transposition_table.store(pos_hash, depth, best_value, TT_LOWER, move)
+                return best_value
         
         # Store in transposition table
         if best_value <= original_alpha:
-            self.transposition_table[pos_hash] = (depth, best_value, 'upper')
+            self.transposition_table.store(pos_hash, depth, best_value, TT_UPPER)
         elif best_value >= beta:
-            self.transposition_table[pos_hash] = (depth, best_value, 'lower')
+            self.transposition_table.store(pos_hash, depth, best_value, TT_LOWER, best_square)
         else:
-            self.transposition_table[pos_hash] = (depth, best_value, 'exact')
+            self.transposition_table.store(pos_hash, depth, best_value, TT_EXACT, best_square)
         
         return best_value
     
-    def get_best_move(self, game, depth, player_name=None):
+    def order_root_moves(self, game, root_squares):
+        """Iterative deepening starts from the strategic order"""
+        return self.order_moves(game, list(root_squares))
+    
+    def search_root(self, game, depth, root_squares, guess=None):
+        """
+        Root search within an aspiration window around `guess`.
+        
+        The window starts at ±aspiration_window around the previous
+        iteration's value and widens on the failing side until the value
+        falls inside it.
+        
+        Returns:
+            (best_square, best_value), or None if the budget ran out
+        """
+        if guess is None or not self.aspiration_window or abs(guess) >= INFINITY:
+            return self.search_root_window(game, depth, root_squares, -INFINITY, INFINITY)
+        
+        delta = self.aspiration_window
+        alpha = max(guess - delta, -INFINITY)
+        beta = min(guess + delta, INFINITY)
+        while True:
+            result = self.search_root_window(game, depth, root_squares, alpha, beta)
+            if result is None:
+                return None
+            value = result[1]
+            delta *= ASPIRATION_GROWTH
+            if value <= alpha and alpha > -INFINITY:
+                alpha = max(value - delta, -INFINITY)    # fail low
+            elif value >= beta and beta < INFINITY:
+                beta = min(value + delta, INFINITY)      # fail high
+            else:
+                return result
+    
+    def search_root_window(self, game, depth, root_squares, alpha, beta):
+        """
+        PVS over the root moves within (alpha, beta).
+        
+        Returns:
+            (best_square, best_value), or None if the budget ran out
+        """
+        best_value = -INFINITY
+        best_square = None
+        
+        for square in root_squares:
+            flips = game.make(square)
+            self.previous_square = square
+            if best_square is None or not self.use_pvs:
+                value = -self.alphabeta(game, depth - 1, -beta, -alpha)
+            else:
+                value = -self.alphabeta(game, depth - 1, -alpha - 1, -alpha)
+                if alpha < value < beta:
+                    self.previous_square = square
+                    value = -self.alphabeta(game, depth - 1, -beta, -alpha)
+            game.unmake(square, flips)
+            if self.stopped:
+                return None
+            
+            if value > best_value or best_square is None:
+                best_value = value
+                best_square = square
+            if value > alpha:
+                alpha = value
+            if alpha >= beta:
+                break
+        
+        return best_square, best_value
+    
+    def get_best_move(self, game, depth, player_name=None, time_ms=None, node_limit=None):
         """Enhanced get_best_move with move ordering at root level"""
-        # Clear killer moves for new search
-        self.killer_moves.clear()
+        # Age the ordering tables for the new search
+        self.history_root = (game.black, game.white, game.turn)
+        self.age_history()
+        self.result_kind = RESULT_HEURISTIC
+        self.result_value = None
+        
+        # Endgame: perfect play when the solver finishes within budget
+        empties = 64 - popcount(game.black | game.white)
+        if empties <= max(self.endgame_empties, self.wld_empties):
+            solver_time_ms = time_ms * ENDGAME_TIME_SHARE if time_ms else None
+            exact = empties <= self.endgame_empties
+            move = self.solve_endgame(game, player_name, solver_time_ms, node_limit, exact)
+            if move is not None:
+                return move
+            if time_ms:
+                time_ms -= solver_time_ms
+        
+        if time_ms or node_limit:
+            return self.iterative_deepening(game, depth, time_ms, node_limit, player_name)
+        
+        root_squares = list(squares(game.get_valid_moves()))
+        if not root_squares:
+            return None
         
-        move_list = game.get_move_list()
-        if len(move_list) == 0:
+        # Decide whether (and how) to parallelize
+        mode = self.parallel_mode(depth, len(root_squares))
+        
+        if mode == SEARCH_ROOT_SPLIT:
+            return self._get_best_move_parallel_ordered(game, depth, player_name, root_squares)
+        elif mode == SEARCH_LAZY_SMP:
+            return self._get_best_move_lazy_smp(game, depth, player_name, root_squares)
+        else:
+            return self._get_best_move_sequential_ordered(game, depth, player_name, root_squares)
+    
+    def solve_endgame(self, game, player_name=None, time_ms=None, node_limit=None,
+                      exact=True):
+        """
+        Play the endgame perfectly with the solver.
+        
+        exact=False only solves for win/loss/draw; a proven loss is left
+        to the midgame search, which plays for the opponent's mistakes.
+        The result is recorded in result_kind/result_value.
+        
+        Returns:
+            Move, or None if there is no move, the budget ran out or the
+            WLD solve proved a loss
+        """
+        time_start = time.perf_counter()
+        if exact:
+            result = self.endgame_solver.solve(game, time_ms=time_ms, node_limit=node_limit)
+        else:
+            result = self.endgame_solver.solve_wld(game, time_ms=time_ms, node_limit=node_limit)
+        time_total = time.perf_counter() - time_start
+        
+        self.nodes = self.endgame_solver.nodes
+        self.pruning = 0
+        
+        print("\n" + "="*80)
+        title = "ENDGAME SOLVER" if exact else "ENDGAME SOLVER (WIN/LOSS/DRAW)"
+        if player_name:
+            print(f"🎯 GRANDMASTER {title} - {player_name}")
+        else:
+            print(f"🎯 GRANDMASTER {title}")
+        print("="*80)
+        empties = 64 - popcount(game.black | game.white)
+        print(f"   • Empty squares: {empties}")
+        print(f"   • Nodes analyzed: {self.nodes:,}")
+        if self.endgame_solver.splits:
+            print(f"   • Split points: {self.endgame_solver.splits:,} "
+                  f"({self.endgame_solver.aborts:,} cancelled on cutoff)")
+        print(f"   • Time: {time_total:.3f}s")
+        
+        if result is None or result[0] is None:
+            print(f"   • Budget exhausted: falling back to midgame search" if result is None
+                  else f"   • No legal move")
+            print("="*80 + "\n")
             return None
         
-        # Decide whether to parallelize
-        use_parallel = (
-            depth >= 7 and
-            len(move_list) >= 4 and
-            self.num_workers >= 2
-        )
+        square, value = result
+        self.result_kind = RESULT_EXACT if exact else RESULT_WLD
+        self.result_value = value
+        best_move = game.square_to_move(square)
+        
+        if not exact and value == LOSS:
+            print(f"   • Proven loss: falling back to midgame search")
+            print("="*80 + "\n")
+            return None
         
-        if use_parallel:
-            return self._get_best_move_parallel_ordered(game, depth, player_name, move_list)
+        if exact:
+            outcome = OUTCOME_NAMES[WIN if value > 0 else LOSS if value < 0 else DRAW]
+            print(f"   • Selected: {best_move} (exact: {outcome} by {value:+d} discs)")
         else:
-            return self._get_best_move_sequential_ordered(game, depth, player_name, move_list)
+            print(f"   • Selected: {best_move} (wld: {OUTCOME_NAMES[value]})")
+        print("="*80 + "\n")
+        
+        return best_move
+    
+    def close_pool(self):
+        """Release the worker pool leases of the search and of the endgame solver"""
+        super().close_pool()
+        self.endgame_solver.close_pool()
+    
+    def get_search_result(self):
+        """
+        Kind of result behind the last move.
+        
+        Returns:
+            {'result_kind': 'exact' | 'wld' | 'heuristic',
+             'result_value': disc differential (exact), WIN/DRAW/LOSS
+                             (wld) or None (heuristic)}
+        """
+        return {'result_kind': self.result_kind, 'result_value': self.result_value}
     
-    def _get_best_move_sequential_ordered(self, game, depth, player_name, move_list):
+    def _get_best_move_sequential_ordered(self, game, depth, player_name, root_squares):
         """Sequential search with advanced move ordering"""
         self.nodes = 0
         self.pruning = 0
-        self.transposition_table.clear()
+        self.reduced = self.re_searches = 0
+        self.transposition_table.new_search()
+        self.start_budget()
         
         time_start = time.perf_counter()
         
@@ -382,16 +692,28 @@ class GrandmasterEngine(ParallelBitboardMinimaxEngine):
         print("-"*80)
         
         # Order moves strategically
-        ordered_moves = self.order_moves(game, move_list)
+        ordered_moves = self.order_moves(game, root_squares)
         
         best_value = -INFINITY
         best_move = None
         move_count = 0
         
-        for move in ordered_moves:
-            game.move(move)
-            value = -self.alphabeta(game, depth - 1, -INFINITY, -best_value)
-            game.undo_move()
+        for square in ordered_moves:
+            flips = game.make(square)
+            self.previous_square = square
+            if best_move is None or not self.use_pvs:
+                value = -self.alphabeta(game, depth - 1, -INFINITY, -best_value)
+            else:
+                # Scout: prove the move no better than the best so far
+                value = -self.alphabeta(game, depth - 1, -best_value - 1, -best_value)
+                if value > best_value:
+                    self.previous_square = square
+                    value = -self.alphabeta(game, depth - 1, -INFINITY, -best_value)
+            game.unmake(square, flips)
+            if self.stopped:
+                print(f"{'--':<8} {'stopped':<10}")
+                break
+            move = game.square_to_move(square)
             
             time_diff = time.perf_counter() - time_start
             move_count += 1
@@ -405,6 +727,7 @@ class GrandmasterEngine(ParallelBitboardMinimaxEngine):
             if value > best_value or best_move is None:
                 best_value = value
                 best_move = move
+                self.report_progress(game, depth, square, value)
         
         # Summary
         time_total = time.perf_counter() - time_start
@@ -422,7 +745,7 @@ class GrandmasterEngine(ParallelBitboardMinimaxEngine):
         
         return best_move
     
-    def _get_best_move_parallel_ordered(self, game, depth, player_name, move_list):
+    def _get_best_move_parallel_ordered(self, game, depth, player_name, root_squares):
         """Parallel search with advanced move ordering"""
         time_start = time.perf_counter()
         
@@ -440,17 +763,11 @@ class GrandmasterEngine(ParallelBitboardMinimaxEngine):
         print("="*80)
         
         # Order moves before parallelization (best moves get evaluated)
-        ordered_moves = self.order_moves(game, move_list)
-        
-        # Prepare work items with ordered moves
-        work_items = [(game, move, depth) for move in ordered_moves]
-        
-        # Evaluate in parallel
-        pool = self._get_pool()
+        ordered_moves = self.order_moves(game, root_squares)
         
-        # Import worker function
-        from AI.ParallelBitboardMinimaxEngine import evaluate_move_worker
-        results = pool.map(evaluate_move_worker, work_items)
+        # Evaluate in parallel: best-ordered move first, then the rest
+        # against the shared bound
+        results = self.search_root_parallel(game, depth, ordered_moves)
         
         # Process results
         print(f"{'Move':<8} {'Value':<10} {'Nodes':<12} {'Pruning':<10}")
@@ -461,19 +778,23 @@ class GrandmasterEngine(ParallelBitboardMinimaxEngine):
         total_nodes = 0
         total_pruning = 0
         
-        for move, value, nodes, pruning in results:
+        for square, value, nodes, pruning, exact in results:
+            move = game.square_to_move(square)
             total_nodes += nodes
             total_pruning += pruning
             
-            is_best = value > best_value or best_move is None
+            is_best = improves_root_result(value, exact, best_value, best_move)
             move_str = f"⭐{move}" if is_best else f"🚫{move}"
             
             print(f"{move_str:<8} {value:>8d}   {nodes:>10,}   {pruning:>8,}")
             
-            if value > best_value or best_move is None:
+            if is_best:
                 best_value = value
                 best_move = move
         
+        self.nodes = total_nodes
+        self.pruning = total_pruning
+        
         # Summary
         time_total = time.perf_counter() - time_start
         print("-"*80)
@@ -0,0 +1,118 @@
+#------------------------------------------------------------------------
+#    Late Move Reductions - Reduced Search of the Move List's Tail
+#
+#    With the hash move, corners and the history first, the best move of
+#    a node is rarely late in its move list. Late moves are searched a
+#    few plies shallower with a null window (alpha, alpha + 1), which
+#    only has to show that they do not beat alpha; a move that does is
+#    verified by a full-depth re-search, so the shallow search can only
+#    miss a better move, never pick a worse one. The reduction grows
+#    with the node's depth and the move's index in the move order:
+#
+#        reduction = base + ln(depth) * ln(index + 1) / divisor
+#
+#    rounded up to an even number of plies: Reversi evaluations swing
+#    between odd and even depths, so an odd reduction biases the reduced
+#    value and most such moves need the re-search. The reduced search
+#    keeps at least one ply. Schedules are compared by self-play
+#    (examples/lmr_selfplay.py).
+#------------------------------------------------------------------------
+
+import math
+
+# Squares never reduced: corners are stable and mostly the best move
+UNREDUCED_SQUARES = 0x8100000000000081  # a1, h1, a8, h8
+
+# Deepest node and longest move list of the precomputed tables
+MAX_DEPTH = 64
+MAX_MOVES = 64
+
+# Named schedules: (min_depth, full_moves, base, divisor). Nodes
+# shallower than min_depth and the first full_moves moves of every
+# node are searched at full depth.
+LMR_SCHEDULES = {
+    'conservative': (4, 4, 0.0, 3.0),
+    'standard': (4, 3, 0.25, 2.5),
+    'aggressive': (4, 2, 0.5, 2.0),
+}
+
+# Schedule of EngineBuilder.with_late_move_reductions()
+LMR_SCHEDULE = 'standard'
+
+
+class ReductionSchedule:
+    """
+    Reduction in plies of every (depth, move index) pair.
+
+    Attributes:
+        min_depth: Shallowest node whose moves are reduced
+        full_moves: Moves of a node searched at full depth
+        base, divisor: Parameters of the reduction formula (see above)
+
+    Raises:
+        ValueError: If min_depth < 1 or full_moves < 0
+    """
+
+    def __init__(self, min_depth, full_moves, base, divisor):
+        if min_depth < 1 or full_moves < 0:
+            raise ValueError(f"Invalid reduction schedule: min_depth {min_depth} (expected >= 1), "
+                             f"full_moves {full_moves} (expected >= 0)")
+        self.min_depth = min_depth
+        self.full_moves = full_moves
+        self.base = base
+        self.divisor = divisor
+        self.table = [[self._reduction(depth, index) for index in range(MAX_MOVES)]
+                      for depth in range(MAX_DEPTH)]
+
+    def _reduction(self, depth, index):
+        """Reduction by the formula, even (0 for shallow nodes and early moves)"""
+        if depth < self.min_depth or index < self.full_moves:
+            return 0
+        reduction = int(self.base + math.log(depth) * math.log(index + 1) / self.divisor)
+        reduction += reduction & 1
+        while reduction > depth - 2:
+            reduction -= 2
+        return max(0, reduction)
+
+    def reduction(self, depth, index):
+        """Plies to reduce the move at `index` of a `depth` node"""
+        return self.table[depth][index]
+
+    def parameters(self):
+        """(min_depth, full_moves, base, divisor)"""
+        return (self.min_depth, self.full_moves, self.base, self.divisor)
+
+    def __reduce__(self):
+        # Pickled by parameters: the tables are rebuilt in workers
+        return (ReductionSchedule, self.parameters())
+
+    def __eq__(self, other):
+        return isinstance(other, ReductionSchedule) and self.parameters() == other.parameters()
+
+    def __hash__(self):
+        return hash(self.parameters())
+
+    def __repr__(self):
+        return (f"ReductionSchedule(min_depth={self.min_depth}, full_moves={self.full_moves}, "
+                f"base={self.base}, divisor={self.divisor})")
+
+
+def reduction_schedule(schedule):
+    """
+    Schedule from its configuration: a name of LMR_SCHEDULES, a dict of
+    ReductionSchedule arguments, a ReductionSchedule, or None (no
+    reductions).
+
+    Raises:
+        ValueError: Unknown schedule name or invalid parameters
+    """
+    if not schedule:
+        return None
+    if isinstance(schedule, ReductionSchedule):
+        return schedule
+    if isinstance(schedule, dict):
+        return ReductionSchedule(**schedule)
+    if schedule not in LMR_SCHEDULES:
+        raise ValueError(f"Unknown reduction schedule '{schedule}' "
+                         f"(expected one of {list(LMR_SCHEDULES)})")
+    return ReductionSchedule(*LMR_SCHEDULES[schedule])
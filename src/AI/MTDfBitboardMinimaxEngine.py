@@ -0,0 +1,105 @@
+#------------------------------------------------------------------------
+#    MTD(f) Bitboard Engine - Zero-Window Search Driver
+#
+#    MTD(f) (Plaat et al.) finds the minimax value with a sequence of
+#    zero-window alpha-beta searches: each one proves the value above or
+#    below a test value and tightens a lower or an upper bound, until
+#    the bounds meet. The first test value is an earlier iteration's
+#    score, so a good guess needs few passes; the transposition table
+#    keeps the passes from repeating each other's work.
+#------------------------------------------------------------------------
+
+from AI.BitboardMinimaxEngine import BitboardMinimaxEngine, INFINITY, DEFAULT_TT_MB
+
+
+class MTDfBitboardMinimaxEngine(BitboardMinimaxEngine):
+    """
+    Bitboard engine searching the root with MTD(f).
+
+    Features:
+    - Iterative deepening also for fixed-depth searches: every depth is
+      seeded with the score two plies shallower (Reversi scores swing
+      between odd and even depths), else with the previous one's
+    - Zero-window passes over the bitboard alpha-beta (fail-soft, so
+      each pass moves the bound to the value it found, not by one)
+    - Bounded transposition table kept across passes, iterations and moves
+    """
+
+    def __init__(self, evaluator=None, tt_size_mb=DEFAULT_TT_MB):
+        super().__init__(evaluator=evaluator, tt_size_mb=tt_size_mb)
+        self.name = "MTDfBitboard"
+
+        # Zero-window passes of the last search (all iterations) and
+        # the score of each completed iteration
+        self.passes = 0
+        self.iteration_values = {}
+
+    def search_root(self, game, depth, root_squares, guess=None):
+        """
+        MTD(f) over the root moves, starting from the value of the
+        iteration two plies shallower, else from `guess` (the previous
+        iteration's value), else from the static evaluation.
+
+        Returns:
+            (best_square, best_value), or None if the budget ran out
+        """
+        value = self.iteration_values.get(depth - 2, guess)
+        if value is None:
+            value = self.evaluate_bitboard(game)
+        lower, upper = -INFINITY, INFINITY
+        best_square = root_squares[0]
+
+        while lower < upper:
+            gamma = max(value, lower + 1)
+            result = self.search_root_window(game, depth, root_squares, gamma - 1, gamma)
+            if result is None:
+                return None
+            self.passes += 1
+            square, value = result
+            if value >= gamma:
+                lower = value
+                best_square = square  # Fail high: a move reaching the value
+            else:
+                upper = value
+
+        self.iteration_values[depth] = value
+        return best_square, value
+
+    def search_root_window(self, game, depth, root_squares, alpha, beta):
+        """
+        Alpha-beta over the root moves within (alpha, beta), fail-soft.
+
+        Returns:
+            (best_square, best_value), or None if the budget ran out
+        """
+        best_value = -INFINITY
+        best_square = root_squares[0]
+
+        for square in root_squares:
+            flips = game.make(square)
+            value = -self.alphabeta(game, depth - 1, -beta, -max(alpha, best_value))
+            game.unmake(square, flips)
+            if self.stopped:
+                return None
+
+            if value > best_value:
+                best_value = value
+                best_square = square
+                if value >= beta:
+                    break
+
+        return best_square, best_value
+
+    def iterative_deepening(self, game, max_depth=None, time_ms=None, node_limit=None,
+                            player_name=None):
+        """Iterative deepening (see BitboardMinimaxEngine) with fresh MTD(f) seeds"""
+        self.passes = 0
+        self.iteration_values = {}
+        return super().iterative_deepening(game, max_depth, time_ms, node_limit, player_name)
+
+    def get_best_move(self, game, depth, player_name=None, time_ms=None, node_limit=None):
+        """
+        Find best move with MTD(f), iterative deepening to `depth`
+        (within time_ms / node_limit if given).
+        """
+        return self.iterative_deepening(game, depth, time_ms, node_limit, player_name)
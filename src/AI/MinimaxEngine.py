@@ -19,6 +19,7 @@
 from Reversi.Game import Game
 from Reversi.Game import Move
 from AI.GameEngine import GameEngine
+from AI.TranspositionTable import TranspositionTable, TT_EXACT, TT_LOWER, TT_UPPER, NO_MOVE
 import time
 import sys
 
@@ -26,7 +27,7 @@ INFINITY = 10000
 
 class MinimaxEngine(GameEngine):
 
-    def __init__(self, evaluator=None):
+    def __init__(self, evaluator=None, tt_size_mb=16):
         super().__init__("MinimaxEngine", evaluator)
         
         # init:
@@ -63,12 +64,18 @@ class MinimaxEngine(GameEngine):
             [ 0, 1, 8, 7, 6, 6, 7, 8, 1 ], 
         ]
         
-        # Transposition table for caching positions
-        self.transposition_table = {}
+        # Fixed-size transposition table, persistent across moves
+        self.transposition_table = TranspositionTable(tt_size_mb)
         
         # Move ordering cache
         self.move_cache = {}
         
+        # Optional stop flag (truthy .value once the search should stop,
+        # e.g. the stop signal of a background search) and progress callback
+        self.stop_flag = None
+        self.stopped = False
+        self.progress = None
+        
         # Corner positions (highest priority)
         self.corners = [(1,1), (1,8), (8,1), (8,8)]
         
@@ -82,21 +89,31 @@ class MinimaxEngine(GameEngine):
         """Generate a hash for the current position"""
         return hash(game.export_str() + str(game.get_turn()))
 
+    def move_square(self, move):
+        """Square index (0-63) of a move, as stored in the transposition table"""
+        if move is None or move.x > 8 or move.y > 8:
+            return NO_MOVE
+        return (move.y - 1) * 8 + (move.x - 1)
+
     def alfabeta(self, game, depth, alfa, beta):
 
         # nodes counter
         self.nodes += 1
+        if self.stop_flag is not None and self.stop_flag.value:
+            self.stopped = True
+            return 0
 
         # Check transposition table
         position_hash = self.get_position_hash(game)
-        if position_hash in self.transposition_table:
-            stored_depth, stored_value, stored_type = self.transposition_table[position_hash]
+        entry = self.transposition_table.probe(position_hash)
+        if entry is not None:
+            stored_depth, stored_value, stored_type, _ = entry
             if stored_depth >= depth:
-                if stored_type == 'exact':
+                if stored_type == TT_EXACT:
                     return stored_value
-                elif stored_type == 'lower' and stored_value >= beta:
+                elif stored_type == TT_LOWER and stored_value >= beta:
                     return stored_value
-                elif stored_type == 'upper' and stored_value <= alfa:
+                elif stored_type == TT_UPPER and stored_value <= alfa:
                     return stored_value
 
         # check win/loss
@@ -131,6 +148,8 @@ class MinimaxEngine(GameEngine):
             game.move(move)
             value = -self.alfabeta(game, depth-1, -beta, -alfa)
             game.undo_move()
+            if self.stopped:
+                return 0
 
             if value > best_value:
                 best_value = value
@@ -142,16 +161,19 @@ class MinimaxEngine(GameEngine):
             if alfa >= beta:
                 self.pruning += 1
                 # Store in transposition table
-                self.transposition_table[position_hash] = (depth, beta, 'lower')
+                self.transposition_table.store(position_hash, depth, beta, TT_LOWER,
+                                               self.move_square(move))
                 return beta
 
         # Store in transposition table
         if best_value <= original_alfa:
-            self.transposition_table[position_hash] = (depth, best_value, 'upper')
+            self.transposition_table.store(position_hash, depth, best_value, TT_UPPER)
         elif best_value >= beta:
-            self.transposition_table[position_hash] = (depth, best_value, 'lower')
+            self.transposition_table.store(position_hash, depth, best_value, TT_LOWER,
+                                           self.move_square(best_move))
         else:
-            self.transposition_table[position_hash] = (depth, best_value, 'exact')
+            self.transposition_table.store(position_hash, depth, best_value, TT_EXACT,
+                                           self.move_square(best_move))
 
         return best_value
 
@@ -199,8 +221,9 @@ class MinimaxEngine(GameEngine):
 
         self.nodes = 0
         self.pruning = 0
-        # Clear transposition table for new search
-        self.transposition_table.clear()
+        self.stopped = False
+        # Age the transposition table (entries carry over between moves)
+        self.transposition_table.new_search()
 
         time_start = time.perf_counter()
 
@@ -235,11 +258,14 @@ class MinimaxEngine(GameEngine):
         
         move_count = 0
         
-        # deep explore all available moves
+        # deep explore all available moves (a stopped search keeps the best completed one)
         for move in move_list_sorted:
             game.move(move)
             value = -self.alfabeta(game, depth-1, -INFINITY, -best_value)
             game.undo_move()
+            if self.stopped:
+                print(f"{'--':<8} {'stopped':<10}")
+                break
 
             # print statistics BEFORE updating best_value
             time_diff = time.perf_counter() - time_start
@@ -272,6 +298,9 @@ class MinimaxEngine(GameEngine):
             if value > best_value or best_move == None:
                 best_value = value
                 best_move = move
+                if self.progress is not None:
+                    self.progress({'depth': depth, 'move': move, 'value': value,
+                                   'nodes': self.nodes})
         
         # Print summary statistics
         time_total = time.perf_counter() - time_start
@@ -3,37 +3,253 @@
 #    Expected: 2-4x speedup on 4 cores, 4-8x on 8+ cores
 #------------------------------------------------------------------------
 
-from AI.BitboardMinimaxEngine import BitboardMinimaxEngine, INFINITY
-from multiprocessing import Pool, cpu_count
+from AI.BitboardMinimaxEngine import BitboardMinimaxEngine, INFINITY, DEFAULT_TT_MB
+from AI.ProbCut import PROBCUT_FILE
+from AI.TranspositionTable import (LocklessTranspositionTable, SharedTranspositionTable,
+                                   local_table, shared_memory, NO_MOVE)
+from AI.WorkerPool import (BACKEND_PROCESS, BACKEND_THREAD, get_pool_manager, resolve_backend,
+                           shared_worker_state, worker_backend, worker_state)
+from Reversi.BitboardGame import BitboardGame, squares
+from multiprocessing import cpu_count, TimeoutError
+import contextlib
+import io
+import threading
 import time
-import copy
 
-def evaluate_move_worker(args):
+# Transposition table budget of each worker process (MB)
+WORKER_TT_MB = 16
+
+# Parallel search modes
+SEARCH_AUTO = 'auto'              # root split, Lazy SMP for narrow roots
+SEARCH_ROOT_SPLIT = 'root_split'  # one root move per worker
+SEARCH_LAZY_SMP = 'lazy_smp'      # all workers search the whole root
+
+# Parallel search is used from this depth; root splitting needs at least
+# ROOT_SPLIT_MIN_MOVES root moves to keep the workers busy
+PARALLEL_MIN_DEPTH = 7
+ROOT_SPLIT_MIN_MOVES = 4
+
+# Seconds between stop checks while the master waits for root results
+ROOT_POLL_SECONDS = 0.05
+
+class WorkerState(threading.local):
+    """
+    Worker state, set up by init_worker() or activate_worker(): per
+    worker process, or per worker thread with the thread backend.
+    """
+    engine = None
+    game = None
+    alpha = None
+    stop = None
+
+_worker = WorkerState()
+_worker_tables = {}
+
+def init_worker(tt_size_mb=WORKER_TT_MB, shared_alpha=None,
+                engine_class=BitboardMinimaxEngine, evaluator=None, stop_flag=None):
+    """
+    Pool initializer: one long-lived engine (and transposition table)
+    and one reusable game object per worker process.
+    
+    Args:
+        tt_size_mb: Worker transposition table budget
+        shared_alpha: multiprocessing.Value holding the best root score
+                      found so far by any worker (None = no sharing)
+        engine_class: Engine whose alphabeta the worker runs (the class
+                      of the parallel engine, so workers search like it)
+        evaluator: Evaluator of the parallel engine
+        stop_flag: multiprocessing.Value raised to stop Lazy SMP helpers
+                   (or set to a split id to abort YBWC helpers)
+    """
+    _worker.engine = build_worker_engine(engine_class, evaluator, tt_size_mb)
+    _worker.game = BitboardGame.create_empty()
+    _worker.alpha = shared_alpha
+    _worker.stop = stop_flag
+
+def build_worker_engine(engine_class, evaluator, tt_size_mb, table=None, selectivity=None,
+                        reductions=None):
+    """
+    Engine searching on behalf of a parallel engine in a worker, with
+    its own transposition table or the given one, and the parallel
+    engine's ProbCut selectivity and late move reductions.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):  # no banner per worker
+        engine = engine_class(evaluator=evaluator, tt_size_mb=tt_size_mb)
+        engine.set_selectivity(selectivity)
+        engine.set_reductions(reductions)
+    if table is not None:
+        engine.transposition_table = table
+    return engine
+
+def activate_worker(key, shared_alpha, stop_flag, tt_size_mb=WORKER_TT_MB,
+                    engine_class=BitboardMinimaxEngine, evaluator=None, selectivity=None,
+                    reductions=None):
+    """
+    Worker setup of a pool lease (see AI.WorkerPool.run_job): switch the
+    worker to the lease's engine, built on first use and then kept with
+    its transposition table for later tasks, turns and games. Worker
+    threads (thread backend) each get an engine, but all of them share
+    one lock-free transposition table of tt_size_mb.
+    
+    Args:
+        key: Lease profile (identifies equally configured engines)
+        shared_alpha: Lease slot holding the best root score found so far
+        stop_flag: Lease slot raised to stop helpers
+        tt_size_mb, engine_class, evaluator: As for init_worker()
+        selectivity: ProbCut selectivity of the parallel engine
+        reductions: Late move reduction schedule of the parallel engine
+    """
+    table = None
+    if worker_backend() == BACKEND_THREAD:
+        table = shared_worker_state(('table', key), lambda: LocklessTranspositionTable(tt_size_mb))
+    _worker.engine = worker_state(
+        key, lambda: build_worker_engine(engine_class, evaluator, tt_size_mb, table, selectivity,
+                                         reductions))
+    if _worker.game is None:
+        _worker.game = BitboardGame.create_empty()
+    _worker.alpha = shared_alpha
+    _worker.stop = stop_flag
+
+def attach_table(table_name, table_mb):
+    """
+    Worker view of the master's shared table: the table itself for
+    worker threads, else attached to its shared memory once per name.
+    """
+    table = local_table(table_name) or _worker_tables.get(table_name)
+    if table is None:
+        table = _worker_tables[table_name] = SharedTranspositionTable(table_mb, name=table_name)
+    return table
+
+def root_tasks(game, root_squares, depth, alpha=-INFINITY, beta=INFINITY):
+    """Compact, cheaply pickled worker tasks for the given root moves"""
+    return [(game.black, game.white, game.turn, square, depth, alpha, beta)
+            for square in root_squares]
+
+def evaluate_move_worker(task):
     """
     Worker function to evaluate a single move.
     Must be at module level for pickling.
     
+    The worker's transposition table persists across root moves and
+    across searches; it is aged whenever the root position changes
+    (once, also when worker threads share it).
+    
+    With a finite alpha (raised to the shared root bound, if any) the
+    move is first scouted with a null window and re-searched only if
+    it beats alpha; the value is then exact and raises the shared bound.
+    Otherwise the value is an upper bound <= alpha. The search gives up
+    once the lease's stop flag is raised.
+    
     Args:
-        args: Tuple of (game_bytes, move, depth, evaluator)
+        task: Tuple of (black, white, turn, square, depth, alpha, beta)
     
     Returns:
-        Tuple of (move, value, nodes, pruning)
+        Tuple of (square, value, nodes, pruning, exact); value is None if
+        the search was stopped, exact tells an exact value (full window
+        or beat alpha) from an upper bound
+    """
+    black, white, turn, square, depth, alpha, beta = task
+    
+    if _worker.engine is None:
+        init_worker()
+    engine = _worker.engine
+    game = _worker.game
+    
+    # New root position: entries from the previous search age out first
+    engine.new_root((black, white, turn))
+    
+    engine.nodes = 0
+    engine.pruning = 0
+    stop = _worker.stop
+    if stop is not None and stop.value:
+        return (square, None, 0, 0, False)
+    game.set_position(black, white, turn)
+    game.make(square)
+    
+    shared = _worker.alpha
+    if shared is not None:
+        alpha = max(alpha, shared.value)
+    
+    engine.stop_flag = stop
+    engine.start_budget()
+    try:
+        if alpha > -INFINITY:
+            value = -engine.alphabeta(game, depth - 1, -alpha - 1, -alpha)
+            if alpha < value < beta and not engine.stopped:
+                value = -engine.alphabeta(game, depth - 1, -beta, -alpha)
+        else:
+            value = -engine.alphabeta(game, depth - 1, -beta, -alpha)
+    finally:
+        engine.stop_flag = None
+    if engine.stopped:
+        return (square, None, engine.nodes, engine.pruning, False)
+    
+    if shared is not None and value > shared.value:
+        with shared.get_lock():
+            if value > shared.value:
+                shared.value = value
+    
+    exact = alpha == -INFINITY or value > alpha
+    return (square, value, engine.nodes, engine.pruning, exact)
+
+def improves_root_result(value, exact, best_value, best_move):
+    """
+    Whether a root result (in completion order) replaces the best so
+    far: a higher value, or an exact value tying it. An upper bound
+    equal to the best value (scouted against the bound that exact value
+    raised) never does, whichever result arrived first.
+    """
+    return best_move is None or value > best_value or (value == best_value and exact)
+
+def lazy_smp_worker(task):
     """
-    game_state, move, depth = args
+    Lazy SMP helper: iterative deepening over the whole root into the
+    shared transposition table, until the main search raises the stop
+    flag (or the helper reaches its depth).
+    
+    Helpers differ from the main search and from each other so that they
+    fill the table with useful entries instead of repeating its work:
+    odd helpers go one ply deeper, and each rotates the root move order.
+    
+    Args:
+        task: Tuple of (black, white, turn, depth, helper, table_name, table_mb)
     
-    # Create engine for this worker (each has own transposition table)
-    engine = BitboardMinimaxEngine()
+    Returns:
+        Number of nodes searched
+    """
+    black, white, turn, depth, helper, table_name, table_mb = task
     
-    # Copy game state to avoid shared memory issues
-    game = copy.deepcopy(game_state)
+    if _worker.engine is None:
+        init_worker()
+    engine = _worker.engine
+    game = _worker.game
     
-    # Make move
-    game.move(move)
+    table = attach_table(table_name, table_mb)
     
-    # Evaluate with full alpha-beta window (workers are independent)
-    value = -engine.alphabeta(game, depth - 1, -INFINITY, INFINITY)
+    game.set_position(black, white, turn)
+    private_table = engine.transposition_table
+    engine.transposition_table = table
+    engine.stop_flag = _worker.stop
+    engine.nodes = 0
+    engine.start_budget()
+    try:
+        root_squares = engine.order_root_moves(game, game.legal_squares())
+        shift = helper % len(root_squares)
+        root_squares = root_squares[shift:] + root_squares[:shift]
+        value = None
+        for iteration in range(1, depth + 1 + helper % 2):
+            result = engine.search_root(game, iteration, root_squares, value)
+            if result is None:
+                break
+            square, value = result
+            root_squares.remove(square)
+            root_squares.insert(0, square)
+    finally:
+        engine.transposition_table = private_table
+        engine.stop_flag = None
+        engine.start_budget()
     
-    return (move, value, engine.nodes, engine.pruning)
+    return engine.nodes
 
 
 class ParallelBitboardMinimaxEngine(BitboardMinimaxEngine):
@@ -41,9 +257,19 @@ class ParallelBitboardMinimaxEngine(BitboardMinimaxEngine):
     Parallel bitboard minimax using multiprocessing.
     
     Features:
-    - Root-level parallelism (evaluates moves in parallel)
-    - Worker pool reuse for multiple moves
-    - Adaptive parallelization based on depth
+    - Root-level parallelism: the first move is searched alone, the
+      others are dispatched dynamically and scouted against a best-score
+      bound shared by all workers
+    - Lazy SMP for roots with few moves: all workers search the whole
+      root at staggered depths and move orders, sharing only a lock-free
+      transposition table in shared memory
+    - Workers come from the process-wide pool (AI.WorkerPool): the
+      engine leases a share of it and each worker keeps the engine's
+      worker-side engine and transposition table across moves and games
+    - Worker threads instead of processes on free-threaded CPython
+      (backend='thread'): one transposition table and the precomputed
+      bitboard tables for all of them, nothing copied between processes
+    - Adaptive parallelization based on depth and root width
     - Expected speedup: 2-4x on 4 cores
     
     Performance:
@@ -52,61 +278,256 @@ class ParallelBitboardMinimaxEngine(BitboardMinimaxEngine):
     - Best for depth >= 7 with 4+ CPU cores
     """
     
-    def __init__(self, evaluator=None, num_workers=None):
-        super().__init__(evaluator)
+    def __init__(self, evaluator=None, num_workers=None, tt_size_mb=DEFAULT_TT_MB,
+                 search_mode=SEARCH_AUTO, backend=BACKEND_PROCESS):
+        super().__init__(evaluator, tt_size_mb)
         
         # Calculate optimal worker count (leave 1 core for system)
         self.num_workers = num_workers or max(1, cpu_count() - 1)
+        self.search_mode = search_mode
+        
+        # Worker threads only without the GIL, processes otherwise
+        self.backend = resolve_backend(backend)
+        
+        # Pool lease (with the root bound and stop flag its workers
+        # share) is taken on demand; the shared table on first use
+        self._lease = None
+        self._shared_table = None
+        
+        print(f"[ParallelEngine] Configured for {self.num_workers} worker {self.worker_kind}")
+    
+    @property
+    def worker_kind(self):
+        """'threads' or 'processes', for reports"""
+        return 'threads' if self.backend == BACKEND_THREAD else 'processes'
+    
+    def _get_lease(self):
+        """Get or take this engine's lease on the shared worker pool"""
+        if self._lease is None or self._lease.released:
+            # Worker threads share one table: the budget of all workers
+            tt_size_mb = WORKER_TT_MB
+            if self.backend == BACKEND_THREAD:
+                tt_size_mb *= self.num_workers
+            self._lease = get_pool_manager(self.backend).acquire(
+                self.num_workers, activate_worker,
+                (tt_size_mb, type(self), self.evaluator, self.selectivity, self.reductions))
+        return self._lease
+    
+    def _get_shared_table(self):
+        """
+        Get or create the transposition table shared with the workers
+        (same budget as the engine's own table): an in-process table for
+        worker threads, else one in shared memory, or None without
+        shared memory support.
+        """
+        if self._shared_table is None:
+            if self.backend == BACKEND_THREAD:
+                self._shared_table = LocklessTranspositionTable(self.transposition_table.size_mb)
+            elif shared_memory is not None:
+                self._shared_table = SharedTranspositionTable(self.transposition_table.size_mb)
+        return self._shared_table
+    
+    def parallel_mode(self, depth, move_count):
+        """
+        Parallel search mode for a root, or None for sequential search.
+        
+        Parallel only pays off for deep searches on several cores. Root
+        splitting needs enough root moves to share out; narrower roots
+        (late midgame) use Lazy SMP where a table can be shared.
+        """
+        if depth < PARALLEL_MIN_DEPTH or self.num_workers < 2 or move_count < 2:
+            return None
+        lazy_smp = ((shared_memory is not None or self.backend == BACKEND_THREAD) and
+                    (self.search_mode == SEARCH_LAZY_SMP or
+                     (self.search_mode == SEARCH_AUTO and move_count < ROOT_SPLIT_MIN_MOVES)))
+        if lazy_smp:
+            return SEARCH_LAZY_SMP
+        if move_count >= ROOT_SPLIT_MIN_MOVES:
+            return SEARCH_ROOT_SPLIT
+        return None
+    
+    def search_root_parallel(self, game, depth, ordered_squares):
+        """
+        Root split with a shared alpha bound (young brothers wait).
+        
+        The first (best-ordered) move is searched with the full window to
+        establish a bound; the remaining moves go to whichever worker is
+        idle and are scouted against the best score found so far.
+        
+        Returns:
+            List of (square, value, nodes, pruning, exact) in completion
+            order; values of moves that did not beat the bound are upper
+            bounds (exact False).
+            Once the search is stopped, only the moves completed so far.
+        """
+        lease = self._get_lease()
+        lease.flag.value = 0
+        self.start_budget()
+        
+        lease.bound.value = -INFINITY
+        first = self.collect_root_results(lease, root_tasks(game, ordered_squares[:1], depth))
+        if not first:
+            return []
+        lease.bound.value = first[0][1]
+        
+        rest = root_tasks(game, ordered_squares[1:], depth, alpha=first[0][1])
+        return first + self.collect_root_results(lease, rest)
+    
+    def collect_root_results(self, lease, tasks):
+        """
+        Completed results of root tasks, in completion order; a stop
+        request (see check_budget) raises the lease's stop flag so that
+        the workers give up their searches.
+        """
+        pending = lease.imap_unordered(evaluate_move_worker, tasks)
+        results = []
+        for _ in tasks:
+            while True:
+                try:
+                    result = pending.next(ROOT_POLL_SECONDS)
+                    break
+                except TimeoutError:
+                    if self.check_budget():
+                        lease.flag.value = 1
+            if result[1] is not None:
+                results.append(result)
+        return results
+    
+    def search_lazy_smp(self, game, depth, root_squares):
+        """
+        Lazy SMP: iterative deepening in this process while the pool's
+        workers search the same root as helpers, all through one shared
+        transposition table. The helpers are stopped when this search
+        completes; its result is the result.
+        
+        Returns:
+            (best_square, best_value, helper_nodes)
+        """
+        lease = self._get_lease()
+        table = self._get_shared_table()
+        table.new_search()
         
-        # Pool is created on-demand and cached
-        self._pool = None
+        lease.flag.value = 0
+        helpers = [lease.apply_async(lazy_smp_worker,
+                                     (game.black, game.white, game.turn, depth, helper,
+                                      table.name, table.size_mb))
+                   for helper in range(1, lease.quota)]
         
-        print(f"[ParallelEngine] Configured for {self.num_workers} worker processes")
+        private_table = self.transposition_table
+        self.transposition_table = table
+        self.start_budget()
+        try:
+            root_squares = self.order_root_moves(game, root_squares)
+            best_square, best_value = None, None
+            for iteration in range(1, depth + 1):
+                result = self.search_root(game, iteration, root_squares, best_value)
+                if result is None:  # stopped: keep the last completed iteration
+                    break
+                best_square, best_value = result
+                self.report_progress(game, iteration, best_square, best_value)
+                root_squares.remove(best_square)
+                root_squares.insert(0, best_square)
+        finally:
+            self.transposition_table = private_table
+            lease.flag.value = 1
+            helper_nodes = sum(helper.get() for helper in helpers)
+        
+        return best_square, best_value, helper_nodes
+    
+    def set_selectivity(self, selectivity, path=PROBCUT_FILE):
+        """Set the ProbCut selectivity (see BitboardMinimaxEngine); workers get it with the next lease"""
+        super().set_selectivity(selectivity, path)
+        if self._lease is not None:
+            self._lease.release()
+            self._lease = None
+    
+    def set_reductions(self, schedule):
+        """Set the late move reductions (see BitboardMinimaxEngine); workers get them with the next lease"""
+        super().set_reductions(schedule)
+        if self._lease is not None:
+            self._lease.release()
+            self._lease = None
     
-    def _get_pool(self):
-        """Get or create worker pool (lazy initialization)"""
-        if self._pool is None:
-            self._pool = Pool(processes=self.num_workers)
-        return self._pool
+    def hash_move(self, game, table=None):
+        """Best move from the engine's table, else from the Lazy SMP shared table"""
+        square = super().hash_move(game, table)
+        if square == NO_MOVE and table is None and self._shared_table is not None:
+            square = super().hash_move(game, self._shared_table)
+        return square
     
     def close_pool(self):
-        """Close worker pool (call when done with engine)"""
-        if self._pool is not None:
-            self._pool.close()
-            self._pool.join()
-            self._pool = None
+        """Release the worker pool lease and the shared table (call when done with engine)"""
+        if self._lease is not None:
+            self._lease.release()
+            self._lease = None
+        if self._shared_table is not None:
+            self._shared_table.close()
+            self._shared_table = None
     
-    def get_best_move(self, game, depth, player_name=None):
+    def get_best_move(self, game, depth, player_name=None, time_ms=None, node_limit=None):
         """
         Find best move using parallel or sequential search.
         
         Automatically chooses based on:
         - Depth (>= 7 for parallel)
-        - Number of moves (>= 4 for parallel)
+        - Number of moves (>= 4 for root splitting, fewer for Lazy SMP)
         - Available cores
+        
+        With time_ms or node_limit, runs iterative deepening in this
+        process (it relies on the engine's own transposition table).
         """
-        move_list = game.get_move_list()
-        if len(move_list) == 0:
+        if time_ms or node_limit:
+            return self.iterative_deepening(game, depth, time_ms, node_limit, player_name)
+        
+        root_squares = list(squares(game.get_valid_moves()))
+        if not root_squares:
             return None
         
-        # Decide whether to parallelize
-        # Parallel only beneficial if:
-        # 1. Deep enough search (depth >= 7)
-        # 2. Enough moves to distribute (>= 4)
-        # 3. Multiple cores available
-        use_parallel = (
-            depth >= 7 and
-            len(move_list) >= 4 and
-            self.num_workers >= 2
-        )
-        
-        if use_parallel:
-            return self._get_best_move_parallel(game, depth, player_name, move_list)
+        # Decide whether (and how) to parallelize
+        mode = self.parallel_mode(depth, len(root_squares))
+        
+        if mode == SEARCH_ROOT_SPLIT:
+            return self._get_best_move_parallel(game, depth, player_name, root_squares)
+        elif mode == SEARCH_LAZY_SMP:
+            return self._get_best_move_lazy_smp(game, depth, player_name, root_squares)
         else:
             # Use sequential for shallow searches
             return super().get_best_move(game, depth, player_name)
     
-    def _get_best_move_parallel(self, game, depth, player_name, move_list):
+    def _get_best_move_lazy_smp(self, game, depth, player_name, root_squares):
+        """Lazy SMP search with reasoning output"""
+        time_start = time.perf_counter()
+        self.nodes = 0
+        self.pruning = 0
+        self.reduced = self.re_searches = 0
+        
+        print("\n" + "="*80)
+        if player_name:
+            print(f"🚀 LAZY SMP BITBOARD AI - {player_name} ({self.num_workers} {self.worker_kind})")
+        else:
+            print(f"🚀 LAZY SMP BITBOARD AI ({self.num_workers} {self.worker_kind})")
+        print("="*80)
+        
+        best_square, best_value, helper_nodes = self.search_lazy_smp(game, depth, root_squares)
+        best_move = game.square_to_move(best_square) if best_square is not None else None
+        main_nodes = self.nodes
+        self.nodes += helper_nodes
+        
+        time_total = time.perf_counter() - time_start
+        print(f"📊 LAZY SMP SUMMARY:")
+        quota = self._lease.quota
+        print(f"   • Workers: {quota} (1 main + {quota - 1} helpers, {self.num_workers} requested)")
+        print(f"   • Root moves: {len(root_squares)}")
+        print(f"   • Nodes: {self.nodes:,} (main {main_nodes:,})")
+        print(f"   • Time: {time_total:.3f}s")
+        if time_total > 0:
+            print(f"   • Rate: {self.nodes/time_total:,.0f} nodes/sec")
+        print(f"   • Selected: {best_move} (value: {best_value})")
+        print("="*80 + "\n")
+        
+        return best_move
+    
+    def _get_best_move_parallel(self, game, depth, player_name, root_squares):
         """Parallel search at root level"""
         time_start = time.perf_counter()
         
@@ -124,12 +545,9 @@ class ParallelBitboardMinimaxEngine(BitboardMinimaxEngine):
         print(f"Move: {current_move}/{max_moves} ({progress_pct:.1f}% complete)")
         print("="*80)
         
-        # Prepare work items
-        work_items = [(game, move, depth) for move in move_list]
-        
         # Evaluate moves in parallel
-        pool = self._get_pool()
-        results = pool.map(evaluate_move_worker, work_items)
+        root_squares = self.order_root_moves(game, root_squares)
+        results = self.search_root_parallel(game, depth, root_squares)
         
         # Process results
         print(f"{'Move':<8} {'Value':<10} {'Nodes':<12} {'Pruning':<10}")
@@ -140,25 +558,30 @@ class ParallelBitboardMinimaxEngine(BitboardMinimaxEngine):
         total_nodes = 0
         total_pruning = 0
         
-        for move, value, nodes, pruning in results:
+        for square, value, nodes, pruning, exact in results:
+            move = game.square_to_move(square)
             total_nodes += nodes
             total_pruning += pruning
             
-            is_best = value > best_value or best_move is None
+            is_best = improves_root_result(value, exact, best_value, best_move)
             move_str = f"⭐{move}" if is_best else f"🚫{move}"
             
             print(f"{move_str:<8} {value:>8d}   {nodes:>10,}   {pruning:>8,}")
             
-            if value > best_value or best_move is None:
+            if is_best:
                 best_value = value
                 best_move = move
         
+        self.nodes = total_nodes
+        self.pruning = total_pruning
+        
         # Summary
         time_total = time.perf_counter() - time_start
         print("-"*80)
         print(f"📊 PARALLEL SUMMARY:")
-        print(f"   • Workers: {self.num_workers} cores")
-        print(f"   • Moves: {len(move_list)}")
+        print(f"   • Workers: {self._lease.quota} {self.worker_kind} of the shared pool "
+              f"({self.num_workers} requested)")
+        print(f"   • Moves: {len(root_squares)}")
         print(f"   • Nodes: {total_nodes:,}")
         print(f"   • Pruning: {total_pruning:,}")
         print(f"   • Time: {time_total:.3f}s")
@@ -179,7 +602,7 @@ class ParallelBitboardMinimaxEngine(BitboardMinimaxEngine):
         return best_move
     
     def __del__(self):
-        """Cleanup worker pool on destruction"""
+        """Release the pool lease on destruction"""
         self.close_pool()
 
 
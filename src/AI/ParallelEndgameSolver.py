@@ -0,0 +1,477 @@
+#------------------------------------------------------------------------
+#    Parallel Endgame Solver - Exact Score on Many Cores
+#
+#    The exact solve with its subtrees distributed over the shared
+#    worker pool. Splitting follows the Young Brothers Wait Concept
+#    along the principal variation: at every split point the eldest
+#    brother is solved first (splitting further down), then the young
+#    brothers are solved in parallel against the bound it established.
+#    A young brother that proves a cutoff - at the root of a
+#    win/loss/draw solve, a win - cancels its siblings at once.
+#------------------------------------------------------------------------
+
+from AI.EndgameSolver import EndgameSolver, SCORE_MAX, SOLVER_TT_MB, STABILITY_MIN_EMPTIES, final_score, stable_discs
+from AI.ParallelBitboardMinimaxEngine import attach_table
+from AI.YBWCBitboardMinimaxEngine import SplitAbort, SPLIT_POLL_SECONDS
+from AI.TranspositionTable import (LocklessTranspositionTable, SharedTranspositionTable, shared_memory,
+                                   TT_EXACT, TT_LOWER, TT_UPPER, NO_MOVE)
+from AI.WorkerPool import (BACKEND_PROCESS, BACKEND_THREAD, get_pool_manager, resolve_backend,
+                           shared_worker_state, worker_backend, worker_state)
+from Reversi.BitboardGame import FULL_BOARD, get_moves, get_flips, popcount, squares
+from Reversi.BitboardTables import ZOBRIST_BLACK_BYTES, ZOBRIST_WHITE_BYTES, zobrist_board
+from multiprocessing import cpu_count, TimeoutError
+import threading
+
+# Positions with at least this many empties are solved in parallel;
+# smaller solves finish faster than the workers can be kept busy
+PARALLEL_MIN_EMPTIES = 16
+
+# Nodes with at least this many empties are split points; the young
+# brothers handed to the workers are one empty smaller
+SPLIT_MIN_EMPTIES = 14
+
+# Ordering search at split points: depth, and evaluation weights of
+# mobility and stable discs (final positions count the disc differential
+# times ORDER_FINAL_WEIGHT)
+ORDER_DEPTH = 4
+ORDER_MOBILITY_WEIGHT = 2
+ORDER_STABILITY_WEIGHT = 4
+ORDER_FINAL_WEIGHT = 100
+INFINITE_ORDER = (SCORE_MAX + 1) * ORDER_FINAL_WEIGHT
+
+class SolverWorker(threading.local):
+    """
+    Worker state, set up by activate_solver_worker(): per worker
+    process, or per worker thread with the thread backend.
+    """
+    solver = None
+    bound = None
+    flag = None
+
+_worker = SolverWorker()
+
+def build_worker_solver(tt_size_mb, table=None):
+    """Solver of a worker, with its own transposition table or the given one"""
+    solver = EndgameSolver(tt_size_mb)
+    if table is not None:
+        solver.transposition_table = table
+    return solver
+
+def activate_solver_worker(key, bound, flag, tt_size_mb=SOLVER_TT_MB):
+    """
+    Worker setup of a pool lease (see AI.WorkerPool.run_job): a solver
+    built once per worker and kept with its transposition table (one
+    table for all worker threads with the thread backend).
+
+    Args:
+        key: Lease profile
+        bound: Lease slot holding the best score of the current split point
+        flag: Lease slot set to a split id to cancel its young brothers
+        tt_size_mb: Worker solver table budget (used without a shared table)
+    """
+    table = None
+    if worker_backend() == BACKEND_THREAD:
+        table = shared_worker_state(('table', key), lambda: LocklessTranspositionTable(tt_size_mb))
+    _worker.solver = worker_state(key, lambda: build_worker_solver(tt_size_mb, table))
+    _worker.bound = bound
+    _worker.flag = flag
+
+def raise_bound(bound, score):
+    """Raise a shared bound to score; returns the bound"""
+    with bound.get_lock():
+        if score > bound.value:
+            bound.value = score
+        return bound.value
+
+class HelperStop:
+    """
+    Stop flag of a helper's solve, as seen by its check_budget(): raised
+    when the master cancels the split point, or when a sibling proves
+    the shared bound above the floor (alpha) of the window being solved,
+    which makes the solve obsolete.
+    """
+
+    def __init__(self, flag, split_id, bound):
+        self.cancel = SplitAbort(flag, split_id)
+        self.bound = bound
+        self.floor = None
+
+    @property
+    def value(self):
+        return self.cancel.value or (self.floor is not None and self.bound.value > self.floor)
+
+
+def solve_move_worker(task):
+    """
+    Helper: solve one young brother of a split point.
+    Must be at module level for pickling.
+
+    The move is scouted with a null window at the split point's best
+    score so far (the task's alpha, raised to the shared bound) and
+    re-solved only if it beats it. Every score proven on the way (the
+    scout's lower bound, then the exact score) raises the shared bound
+    for the siblings. A scout or re-solve overtaken by the bound is
+    restarted against it; the helper gives up as soon as the master
+    cancels the split point.
+
+    Args:
+        task: Tuple of (player, opponent, square, alpha, beta, n_empties,
+              split_id, table_name, table_mb); n_empties is that of the
+              split point
+
+    Returns:
+        Tuple of (square, score, nodes, complete, raised): raised tells
+        whether the score beat the scout bound (exact, or a lower bound
+        >= beta) rather than being an upper bound; the score of a
+        cancelled solve (complete False) is meaningless
+    """
+    player, opponent, square, alpha, beta, n_empties, split_id, table_name, table_mb = task
+
+    solver = _worker.solver
+    shared_bound = _worker.bound
+    solver.nodes = 0
+    stop = HelperStop(_worker.flag, split_id, shared_bound)
+    if stop.cancel.value:
+        return (square, 0, 0, False, False)
+
+    private_table = solver.transposition_table
+    if table_name is not None:
+        solver.transposition_table = attach_table(table_name, table_mb)
+    solver.stop_flag = stop
+    flips = get_flips(square, player, opponent)
+    next_player = opponent ^ flips
+    next_opponent = player | flips | (1 << square)
+    try:
+        alpha = max(alpha, shared_bound.value)
+        while True:
+            stop.floor = alpha
+            solver.start_budget()
+            score = -solver.solve_board(next_player, next_opponent, -alpha - 1, -alpha, n_empties - 1)
+            if solver.stopped:
+                if stop.cancel.value:
+                    break
+                alpha = shared_bound.value
+                continue
+            if not alpha < score < beta:
+                break
+
+            # Failed high: score is a lower bound the siblings can scout against
+            bound = raise_bound(shared_bound, score)
+            if bound > score:
+                alpha = bound
+                continue
+            stop.floor = score
+            solver.start_budget()
+            exact = -solver.solve_board(next_player, next_opponent, -beta, -score, n_empties - 1)
+            if solver.stopped:
+                if stop.cancel.value:
+                    break
+                alpha = shared_bound.value
+                continue
+            score = exact
+            if score < beta:
+                raise_bound(shared_bound, score)
+            break
+        complete = not stop.cancel.value
+        raised = score > alpha
+    finally:
+        solver.transposition_table = private_table
+        solver.stop_flag = None
+        solver.start_budget()
+
+    return (square, score, solver.nodes, complete, raised)
+
+
+class ParallelEndgameSolver(EndgameSolver):
+    """
+    Exact endgame solver on the process-wide worker pool.
+
+    Features:
+    - Moves of split points ordered by a shallow search (ORDER_DEPTH
+      plies on mobility and stability) so that the eldest brother is
+      usually the best move
+    - Split points at every node with at least split_empties empties
+      on the principal variation, the root included: eldest brother
+      first, then the young brothers dispatched dynamically to idle
+      workers
+    - Shared bound per split point: helpers scout against the best
+      score any sibling has proven so far; a cutoff (a win at the root
+      of a win/loss/draw solve) cancels the siblings still running
+    - One transposition table in shared memory (or simply in memory,
+      with worker threads) for master and helpers where available
+
+    Positions below parallel_empties, or solves with fewer than two
+    workers, run the sequential EndgameSolver unchanged. The master
+    only waits while a node is split.
+    """
+
+    def __init__(self, tt_size_mb=SOLVER_TT_MB, num_workers=None,
+                 parallel_empties=PARALLEL_MIN_EMPTIES, split_empties=SPLIT_MIN_EMPTIES,
+                 backend=BACKEND_PROCESS):
+        super().__init__(tt_size_mb)
+        self.num_workers = num_workers or max(1, cpu_count() - 1)
+        self.backend = resolve_backend(backend)
+        self.parallel_empties = parallel_empties
+        self.split_empties = split_empties
+
+        # Only the master splits, and only during a parallel solve
+        self.splitting = False
+        self.split_id = 0
+
+        # Statistics of the last solve
+        self.splits = 0
+        self.aborts = 0
+
+        # Pool lease and shared table are taken on first parallel solve
+        self._lease = None
+        self._shared_table = None
+
+    def _get_lease(self):
+        """Get or take this solver's lease on the shared worker pool"""
+        if self._lease is None or self._lease.released:
+            self._lease = get_pool_manager(self.backend).acquire(
+                self.num_workers, activate_solver_worker, (self.transposition_table.size_mb,))
+        return self._lease
+
+    def _get_shared_table(self):
+        """Table shared with the helpers (None for processes without shared memory support)"""
+        if self._shared_table is None:
+            if self.backend == BACKEND_THREAD:
+                self._shared_table = LocklessTranspositionTable(self.transposition_table.size_mb)
+            elif shared_memory is not None:
+                self._shared_table = SharedTranspositionTable(self.transposition_table.size_mb)
+        return self._shared_table
+
+    def close_pool(self):
+        """Release the worker pool lease and the shared table (call when done with solver)"""
+        if self._lease is not None:
+            self._lease.release()
+            self._lease = None
+        if self._shared_table is not None:
+            self._shared_table.close()
+            self._shared_table = None
+
+    def solve(self, game, alpha=-SCORE_MAX, beta=SCORE_MAX, time_ms=None, node_limit=None):
+        """Solve a position exactly, in parallel from parallel_empties (see EndgameSolver.solve)"""
+        self.splits = 0
+        self.aborts = 0
+        n_empties = 64 - popcount(game.black | game.white)
+        if self.num_workers < 2 or n_empties < self.parallel_empties:
+            return super().solve(game, alpha, beta, time_ms, node_limit)
+
+        self._get_lease().flag.value = 0
+
+        # Master and helpers solve into one shared table when available
+        private_table = self.transposition_table
+        shared_table = self._get_shared_table()
+        if shared_table is not None:
+            self.transposition_table = shared_table
+        self.splitting = True
+        try:
+            return super().solve(game, alpha, beta, time_ms, node_limit)
+        finally:
+            self.splitting = False
+            self.transposition_table = private_table
+
+    def order_root_moves(self, game, player, opponent, moves, empty, n_empties):
+        """Root moves by the ordering search, for parallel solves"""
+        if not self.splitting:
+            return super().order_root_moves(game, player, opponent, moves, empty, n_empties)
+        return self.order_split_moves(player, opponent, moves, NO_MOVE)
+
+    def order_split_moves(self, player, opponent, moves, tt_move):
+        """
+        Moves of a split point best first (transposition table move
+        first): the eldest brother should be the best move, or the young
+        brothers are solved against a bound that is too low. Ranked by a
+        shallow alpha-beta search (ORDER_DEPTH plies) on mobility and
+        stable discs, which predicts endgame scores far better than
+        fastest-first or the midgame evaluation.
+        """
+        scored = []
+        for square in squares(moves):
+            if square == tt_move:
+                continue
+            flips = get_flips(square, player, opponent)
+            value = self.ordering_search(opponent ^ flips, player | flips | (1 << square),
+                                         ORDER_DEPTH - 1, -INFINITE_ORDER, INFINITE_ORDER)
+            scored.append((value, square))
+        scored.sort()
+        ordered = [square for _, square in scored]
+        if tt_move != NO_MOVE and moves & (1 << tt_move):
+            ordered.insert(0, tt_move)
+        return ordered
+
+    def ordering_search(self, player, opponent, depth, alpha, beta):
+        """Shallow alpha-beta of the ordering search (fail-soft)"""
+        self.nodes += 1
+        moves = get_moves(player, opponent)
+        if not moves:
+            if not get_moves(opponent, player):
+                return final_score(player, opponent) * ORDER_FINAL_WEIGHT
+            if depth == 0:
+                return -self.order_evaluation(opponent, player)
+            return -self.ordering_search(opponent, player, depth - 1, -beta, -alpha)
+        if depth == 0:
+            return self.order_evaluation(player, opponent)
+
+        best = -INFINITE_ORDER
+        for square in squares(moves):
+            flips = get_flips(square, player, opponent)
+            value = -self.ordering_search(opponent ^ flips, player | flips | (1 << square),
+                                          depth - 1, -beta, -alpha)
+            if value > best:
+                best = value
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+        return best
+
+    def order_evaluation(self, player, opponent):
+        """Evaluation of the ordering search: mobility and stable discs"""
+        occupied = player | opponent
+        mobility = popcount(get_moves(player, opponent)) - popcount(get_moves(opponent, player))
+        stability = popcount(stable_discs(player, occupied)) - popcount(stable_discs(opponent, occupied))
+        return mobility * ORDER_MOBILITY_WEIGHT + stability * ORDER_STABILITY_WEIGHT
+
+    def solve_root(self, player, opponent, ordered, alpha, beta, n_empties):
+        """The root is a split point like any other node"""
+        if not self.splitting or n_empties < self.split_empties or len(ordered) < 2:
+            return super().solve_root(player, opponent, ordered, alpha, beta, n_empties)
+
+        best_square, best_score = self.split_moves(player, opponent, ordered, alpha, beta, n_empties)
+        if self.stopped:
+            return None
+        return best_square, best_score
+
+    def solve_board(self, player, opponent, alpha, beta, n_empties):
+        """Exact score; nodes with enough empties become split points"""
+        if not self.splitting or n_empties < self.split_empties:
+            return super().solve_board(player, opponent, alpha, beta, n_empties)
+        return self.split_node(player, opponent, alpha, beta, n_empties)
+
+    def split_node(self, player, opponent, alpha, beta, n_empties):
+        """Exact score at a split point (fail-soft, see solve_board)"""
+        self.nodes += 1
+        if self.check_budget():
+            return 0
+
+        # Stability cutoff: opponent's stable discs are lost for good
+        if n_empties >= STABILITY_MIN_EMPTIES and alpha > 0:
+            upper = SCORE_MAX - 2 * popcount(stable_discs(opponent, player | opponent))
+            if upper <= alpha:
+                return upper
+            if upper < beta:
+                beta = upper
+
+        key = zobrist_board(player, ZOBRIST_BLACK_BYTES) ^ zobrist_board(opponent, ZOBRIST_WHITE_BYTES)
+        tt_move = NO_MOVE
+        entry = self.transposition_table.probe(key)
+        if entry is not None:
+            _, stored_value, stored_type, tt_move = entry
+            if stored_type == TT_EXACT:
+                return stored_value
+            elif stored_type == TT_LOWER and stored_value >= beta:
+                return stored_value
+            elif stored_type == TT_UPPER and stored_value <= alpha:
+                return stored_value
+
+        moves = get_moves(player, opponent)
+        if not moves:
+            if not get_moves(opponent, player):
+                return final_score(player, opponent)
+            return -self.solve_board(opponent, player, -beta, -alpha, n_empties)
+
+        ordered = self.order_split_moves(player, opponent, moves, tt_move)
+        best_square, best_score = self.split_moves(player, opponent, ordered, alpha, beta, n_empties)
+        if self.stopped:
+            return 0
+
+        if best_score <= alpha:
+            self.transposition_table.store(key, n_empties, best_score, TT_UPPER)
+        elif best_score >= beta:
+            self.transposition_table.store(key, n_empties, best_score, TT_LOWER, best_square)
+        else:
+            self.transposition_table.store(key, n_empties, best_score, TT_EXACT, best_square)
+        return best_score
+
+    def split_moves(self, player, opponent, ordered, alpha, beta, n_empties):
+        """
+        Solve the moves of a split point: the eldest brother here (it
+        may split further down), the young brothers in the pool unless
+        the eldest already cuts off.
+
+        Returns:
+            (best_square, best_score); meaningless if stopped
+        """
+        best_square = ordered[0]
+        flips = get_flips(best_square, player, opponent)
+        best_score = -self.solve_board(opponent ^ flips, player | flips | (1 << best_square),
+                                       -beta, -alpha, n_empties - 1)
+        if self.stopped or best_score >= beta or len(ordered) < 2:
+            return best_square, best_score
+
+        young = self.solve_young_brothers(player, opponent, ordered[1:],
+                                          max(alpha, best_score), beta, n_empties)
+        for square, score, raised in young:
+            # An upper bound equal to the best score does not displace it
+            if score > best_score or (score == best_score and raised):
+                best_score = score
+                best_square = square
+        return best_square, best_score
+
+    def solve_young_brothers(self, player, opponent, young_squares, alpha, beta, n_empties):
+        """
+        Solve the young brothers of a split point in the worker pool.
+
+        Results are collected as they complete; the first one that
+        reaches beta (or the budget running out) cancels the helpers
+        still solving this split point.
+
+        Returns:
+            List of (square, score, raised) of the completed solves
+        """
+        lease = self._get_lease()
+        self.split_id += 1
+        self.splits += 1
+        split_id = self.split_id
+        table = self._shared_table if self.transposition_table is self._shared_table else None
+        table_name, table_mb = (table.name, table.size_mb) if table is not None else (None, None)
+
+        lease.bound.value = alpha
+        tasks = [(player, opponent, square, alpha, beta, n_empties, split_id, table_name, table_mb)
+                 for square in young_squares]
+        pending = lease.imap_unordered(solve_move_worker, tasks)
+
+        results = []
+        aborted = False
+        for _ in tasks:
+            while True:
+                try:
+                    square, score, nodes, complete, raised = pending.next(SPLIT_POLL_SECONDS)
+                    break
+                except TimeoutError:
+                    if not aborted and self.check_budget():
+                        lease.flag.value = split_id
+                        aborted = True
+
+            self.nodes += nodes
+            if not complete:
+                continue
+            results.append((square, score, raised))
+
+            if aborted:
+                continue
+            if score >= beta:
+                self.aborts += 1
+            elif not self.check_budget():
+                continue
+            lease.flag.value = split_id
+            aborted = True
+
+        return results
+
+    def __del__(self):
+        """Release the pool lease on destruction"""
+        self.close_pool()
@@ -0,0 +1,179 @@
+#------------------------------------------------------------------------
+#    Multi-ProbCut - Selective Midgame Search
+#
+#    A shallow search predicts the result of a deep one: the deep value
+#    is about a * shallow value + b, with a normally distributed error of
+#    deviation sigma, fitted per depth pair and game phase on positions
+#    from our own games (examples/probcut_calibration.py). A node is cut
+#    when a null window shallow search shows that the prediction clears
+#    the window by `selectivity` deviations (Buro's Multi-ProbCut).
+#------------------------------------------------------------------------
+
+import json
+import os
+
+# Calibration data file (parameters per evaluation profile)
+PROBCUT_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'probcut.json')
+
+# Shallowest deep search that is checked (against a depth 1 search)
+PROBCUT_MIN_DEPTH = 3
+
+# Default selectivity: cut when the prediction clears the window by this
+# many standard deviations (1.5 = about 93% confidence, one-sided)
+PROBCUT_SELECTIVITY = 1.5
+
+# Empties per game phase (phase = empties // PHASE_EMPTIES)
+PHASE_EMPTIES = 10
+
+# Windows beyond this are left to the full search (won/lost positions;
+# half of the engines' INFINITY)
+PROBCUT_VALUE_LIMIT = 5000
+
+_loaded = {}
+
+
+def shallow_depth(depth):
+    """Depth of the shallow search predicting a deep one (about a quarter, same parity)"""
+    return 2 * (depth // 4) + (depth & 1)
+
+
+def phase_of(empties, phase_empties=PHASE_EMPTIES):
+    """Game phase of a position with `empties` empty squares"""
+    return empties // phase_empties
+
+
+class ProbCut:
+    """
+    Calibrated shallow-vs-deep regressions of one evaluation function.
+
+    Attributes:
+        pairs: {deep depth: (shallow depth, {phase: (a, b, sigma)})}
+        selectivity: Cut threshold in standard deviations
+        phase_empties: Empties per game phase
+    """
+
+    def __init__(self, pairs, selectivity=PROBCUT_SELECTIVITY, phase_empties=PHASE_EMPTIES):
+        self.pairs = pairs
+        self.selectivity = selectivity
+        self.phase_empties = phase_empties
+        self._checks = {}
+
+    def check(self, depth, empties):
+        """
+        Regression for a node: (shallow depth, a, b, sigma), or None.
+
+        Depths beyond the calibrated ones reuse the deepest calibrated
+        pair of the same parity, with its depth gap; phases without data
+        use the nearest calibrated phase. Nodes whose search reaches the
+        end of the game (depth >= empties) are not checked.
+        """
+        key = (depth, empties)
+        if key in self._checks:
+            return self._checks[key]
+
+        check = None
+        pair = self.pairs.get(depth)
+        shallow = pair[0] if pair else None
+        if pair is None:
+            deeper = [deep for deep in self.pairs if deep < depth and (depth - deep) % 2 == 0]
+            if deeper:
+                base = max(deeper)
+                pair = self.pairs[base]
+                shallow = depth - (base - pair[0])
+        if pair is not None and pair[1] and depth < empties:
+            phase = phase_of(empties, self.phase_empties)
+            nearest = min(pair[1], key=lambda calibrated: abs(calibrated - phase))
+            a, b, sigma = pair[1][nearest]
+            if a > 0:
+                check = (shallow, a, b, sigma)
+        self._checks[key] = check
+        return check
+
+    def windows(self, depth, empties, alpha, beta):
+        """
+        Null windows of the shallow search for a node.
+
+        Returns:
+            (shallow depth, high, low) or None: the deep value is
+            predicted >= beta if the shallow one is >= high, and <= alpha
+            if the shallow one is <= low
+        """
+        check = self.check(depth, empties)
+        if check is None:
+            return None
+        shallow, a, b, sigma = check
+        margin = self.selectivity * sigma
+        high = -int(-(beta + margin - b) // a)  # ceiling
+        low = int((alpha - margin - b) // a)
+        return shallow, high, low
+
+    @staticmethod
+    def pairs_from_json(data):
+        """Pairs of a profile as stored in the data file"""
+        return {int(depth): (entry['shallow'],
+                             {int(phase): (fit['a'], fit['b'], fit['sigma'])
+                              for phase, fit in entry['phases'].items()})
+                for depth, entry in data.items()}
+
+
+def load_probcut(profile, selectivity=PROBCUT_SELECTIVITY, path=PROBCUT_FILE):
+    """
+    ProbCut of an evaluation profile from the calibration file.
+
+    Args:
+        profile: Evaluation profile (see BitboardMinimaxEngine.evaluation_profile)
+        selectivity: Cut threshold in standard deviations
+        path: Calibration data file
+
+    Returns:
+        ProbCut, or None if the profile is not calibrated
+    """
+    if path not in _loaded:
+        try:
+            with open(path) as f:
+                _loaded[path] = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: ProbCut calibration not loaded from {path}: {e}")
+            _loaded[path] = {}
+    data = _loaded[path]
+    profiles = data.get('profiles', {})
+    if profile not in profiles:
+        print(f"Warning: no ProbCut calibration for '{profile}' in {path}")
+        return None
+    return ProbCut(ProbCut.pairs_from_json(profiles[profile]), selectivity,
+                   data.get('phase_empties', PHASE_EMPTIES))
+
+
+def save_probcut(profile, fits, path=PROBCUT_FILE, phase_empties=PHASE_EMPTIES,
+                 description=None):
+    """
+    Store a profile's fits in the calibration file (other profiles kept).
+
+    Args:
+        profile: Evaluation profile
+        fits: {deep depth: (shallow depth, {phase: (a, b, sigma, samples)})}
+        path: Calibration data file
+        phase_empties: Empties per game phase of the fits
+        description: Optional note on how the fits were made
+    """
+    try:
+        with open(path) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    if data.get('phase_empties', phase_empties) != phase_empties:
+        data['profiles'] = {}  # other profiles used other phases
+    data['phase_empties'] = phase_empties
+    profiles = data.setdefault('profiles', {})
+    profiles[profile] = {
+        str(depth): {'shallow': shallow,
+                     'phases': {str(phase): {'a': round(a, 4), 'b': round(b, 2),
+                                             'sigma': round(sigma, 2), 'samples': samples}
+                                for phase, (a, b, sigma, samples) in sorted(phases.items())}}
+        for depth, (shallow, phases) in sorted(fits.items())
+    }
+    if description:
+        data.setdefault('notes', {})[profile] = description
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    _loaded.pop(path, None)
@@ -0,0 +1,422 @@
+#------------------------------------------------------------------------
+#    Transposition Table - Bounded, Array-Backed
+#
+#    Fixed-size hash table of search results shared by the minimax
+#    engines. Memory is allocated once from a megabyte budget and never
+#    grows, and entries survive between moves of a game. A lock-free
+#    variant lets several threads search into one table, and its
+#    shared-memory subclass several processes (Lazy SMP, split points).
+#------------------------------------------------------------------------
+
+from array import array
+import itertools
+import os
+import weakref
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None
+
+# Bound types
+TT_EXACT = 1
+TT_LOWER = 2   # value is a lower bound (fail high)
+TT_UPPER = 3   # value is an upper bound (fail low)
+
+# Best move placeholder (squares are 0-63)
+NO_MOVE = 64
+
+# Packed entry layout (one unsigned 64-bit word next to the full key):
+#   bits  0-19  value + VALUE_OFFSET
+#   bits 20-27  depth
+#   bits 28-29  bound type (0 = empty slot)
+#   bits 30-36  best move square (NO_MOVE = none)
+#   bits 37-44  age (search generation)
+VALUE_BITS = 20
+VALUE_OFFSET = 1 << (VALUE_BITS - 1)
+VALUE_MASK = (1 << VALUE_BITS) - 1
+DEPTH_SHIFT = 20
+BOUND_SHIFT = 28
+MOVE_SHIFT = 30
+AGE_SHIFT = 37
+
+KEY_MASK = 0xFFFFFFFFFFFFFFFF
+
+# Bytes per entry: 64-bit key + 64-bit packed data
+ENTRY_BYTES = 16
+
+# Shared table header (search age), in 64-bit words
+HEADER_WORDS = 2
+
+
+class TranspositionTable:
+    """
+    Bounded transposition table with a two-tier replacement policy.
+
+    Layout:
+    - Two preallocated arrays (keys, packed data), 16 bytes per entry
+    - Buckets of two slots indexed by the low bits of the Zobrist key
+    - The full key is stored and compared on probe (no false hits from
+      index collisions)
+
+    Replacement (per bucket):
+    - Slot 0 is depth-preferred: replaced only by a deeper (or equal)
+      result, or when its entry is from an older search
+    - Slot 1 is always-replace: takes everything slot 0 refuses
+
+    The table persists across searches; call new_search() at the start
+    of each move so entries from previous moves age out first.
+    """
+
+    def __init__(self, size_mb=16):
+        """
+        Allocate the table.
+
+        Args:
+            size_mb: Memory budget in megabytes (rounded down to a power
+                     of two number of buckets)
+        """
+        self._set_size(size_mb)
+        self.keys = array('Q', bytes(8 * self.num_entries))
+        self.data = array('Q', bytes(8 * self.num_entries))
+        self.age = 0
+        self.root = None
+
+        # Statistics
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def _set_size(self, size_mb):
+        """Number of entries and bucket mask for a megabyte budget"""
+        budget = max(1, int(size_mb * 1024 * 1024) // (ENTRY_BYTES * 2))
+        buckets = 1 << (budget.bit_length() - 1)
+
+        self.size_mb = size_mb
+        self.num_entries = buckets * 2
+        self.bucket_mask = buckets - 1
+
+    def new_search(self):
+        """Start a new search: bump the age so old entries are replaced first"""
+        self.age = (self.age + 1) & 0xFF
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    def new_root(self, root):
+        """
+        new_search() for a new root position only: searchers sharing the
+        table call it for every task of a search, the table ages once.
+        """
+        if root != self.root:
+            self.root = root
+            self.new_search()
+
+    def clear(self):
+        """Erase all entries"""
+        self.keys = array('Q', bytes(8 * self.num_entries))
+        self.data = array('Q', bytes(8 * self.num_entries))
+        self.age = 0
+
+    def probe(self, key):
+        """
+        Look up a position.
+
+        Args:
+            key: 64-bit Zobrist key
+
+        Returns:
+            (depth, value, bound, best_move) or None if not stored.
+            best_move is a square (0-63) or NO_MOVE.
+        """
+        key &= KEY_MASK
+        index = (key & self.bucket_mask) << 1
+        keys = self.keys
+        self.probes += 1
+
+        if keys[index] == key:
+            data = self.data[index]
+        elif keys[index + 1] == key:
+            data = self.data[index + 1]
+        else:
+            return None
+
+        bound = (data >> BOUND_SHIFT) & 3
+        if not bound:
+            return None
+
+        self.hits += 1
+        return ((data >> DEPTH_SHIFT) & 0xFF,
+                (data & VALUE_MASK) - VALUE_OFFSET,
+                bound,
+                (data >> MOVE_SHIFT) & 0x7F)
+
+    def store(self, key, depth, value, bound, best_move=NO_MOVE):
+        """
+        Store a search result.
+
+        Args:
+            key: 64-bit Zobrist key
+            depth: Remaining search depth of the result
+            value: Score (side to move's perspective)
+            bound: TT_EXACT, TT_LOWER or TT_UPPER
+            best_move: Best/cutoff square, or NO_MOVE
+        """
+        key &= KEY_MASK
+        index = (key & self.bucket_mask) << 1
+        keys = self.keys
+        data = self.data
+        age = self.age
+        self.stores += 1
+
+        # Same position already in the bucket: keep its move if we have none
+        if best_move == NO_MOVE:
+            if keys[index] == key and (data[index] >> BOUND_SHIFT) & 3:
+                best_move = (data[index] >> MOVE_SHIFT) & 0x7F
+            elif keys[index + 1] == key and (data[index + 1] >> BOUND_SHIFT) & 3:
+                best_move = (data[index + 1] >> MOVE_SHIFT) & 0x7F
+
+        if value > VALUE_OFFSET - 1:
+            value = VALUE_OFFSET - 1
+        elif value < -VALUE_OFFSET:
+            value = -VALUE_OFFSET
+
+        packed = ((int(value) + VALUE_OFFSET) |
+                  (min(depth, 0xFF) << DEPTH_SHIFT) |
+                  (bound << BOUND_SHIFT) |
+                  (best_move << MOVE_SHIFT) |
+                  (age << AGE_SHIFT))
+
+        # Tier 1: depth-preferred slot
+        old = data[index]
+        if (not (old >> BOUND_SHIFT) & 3 or
+                depth >= (old >> DEPTH_SHIFT) & 0xFF or
+                (old >> AGE_SHIFT) & 0xFF != age):
+            # Demote the previous occupant to the always-replace slot
+            if keys[index] != key and (old >> BOUND_SHIFT) & 3:
+                keys[index + 1] = keys[index]
+                data[index + 1] = old
+            elif keys[index + 1] == key:
+                data[index + 1] = 0
+            keys[index] = key
+            data[index] = packed
+            return
+
+        # Tier 2: always-replace slot
+        keys[index + 1] = key
+        data[index + 1] = packed
+
+    def get_move(self, key):
+        """Best move stored for a position (square), or NO_MOVE"""
+        entry = self.probe(key)
+        return entry[3] if entry else NO_MOVE
+
+    def usage(self):
+        """Fraction of slots filled in the current search generation"""
+        sample = min(self.num_entries, 2000)
+        used = sum(1 for i in range(sample)
+                   if (self.data[i] >> BOUND_SHIFT) & 3 and
+                   (self.data[i] >> AGE_SHIFT) & 0xFF == self.age)
+        return used / sample
+
+    def get_statistics(self):
+        """Table statistics for the current search"""
+        return {
+            'size_mb': self.size_mb,
+            'entries': self.num_entries,
+            'probes': self.probes,
+            'hits': self.hits,
+            'stores': self.stores,
+            'hit_rate': self.hits / max(1, self.probes),
+            'usage': self.usage()
+        }
+
+    def __len__(self):
+        return self.num_entries
+
+
+def prepare_shared_memory():
+    """
+    Start the resource tracker before worker processes are forked, so
+    that workers attaching to a shared table report to the same tracker
+    as its creator instead of starting their own (which would unlink the
+    block, or warn about a leak, when the worker exits).
+    """
+    if shared_memory is not None and os.name == 'posix':
+        from multiprocessing import resource_tracker
+        resource_tracker.ensure_running()
+
+
+# In-process lock-free tables by name (see local_table())
+_local_tables = weakref.WeakValueDictionary()
+_local_table_ids = itertools.count(1)
+
+def local_table(name):
+    """Lock-free table of this process with the given name, or None"""
+    return _local_tables.get(name)
+
+
+class LocklessTranspositionTable(TranspositionTable):
+    """
+    Transposition table for concurrent searchers, without locks.
+
+    Same packed 16-byte entries and replacement policy as the private
+    table, but the key word holds key ^ data, so an entry torn by two
+    searchers writing at once (key of one store, data of the other)
+    fails verification and reads as a miss.
+
+    This class is the table the worker threads of the thread backend
+    share; it is registered under a name so that tasks refer to it the
+    way they refer to a shared-memory table (see local_table()).
+    """
+
+    def __init__(self, size_mb=16):
+        super().__init__(size_mb)
+        self.name = f"tt-{os.getpid()}-{next(_local_table_ids)}"
+        _local_tables[self.name] = self
+
+    def probe(self, key):
+        """Look up a position (see TranspositionTable.probe)"""
+        key &= KEY_MASK
+        index = (key & self.bucket_mask) << 1
+        keys = self.keys
+        self.probes += 1
+
+        data = self.data[index]
+        if keys[index] ^ data != key:
+            data = self.data[index + 1]
+            if keys[index + 1] ^ data != key:
+                return None
+
+        bound = (data >> BOUND_SHIFT) & 3
+        if not bound:
+            return None
+
+        self.hits += 1
+        return ((data >> DEPTH_SHIFT) & 0xFF,
+                (data & VALUE_MASK) - VALUE_OFFSET,
+                bound,
+                (data >> MOVE_SHIFT) & 0x7F)
+
+    def store(self, key, depth, value, bound, best_move=NO_MOVE):
+        """Store a search result (see TranspositionTable.store)"""
+        key &= KEY_MASK
+        index = (key & self.bucket_mask) << 1
+        keys = self.keys
+        data = self.data
+        age = self.age
+        self.stores += 1
+
+        old = data[index]
+        old_key = keys[index] ^ old
+        other = data[index + 1]
+        other_key = keys[index + 1] ^ other
+
+        # Same position already in the bucket: keep its move if we have none
+        if best_move == NO_MOVE:
+            if old_key == key and (old >> BOUND_SHIFT) & 3:
+                best_move = (old >> MOVE_SHIFT) & 0x7F
+            elif other_key == key and (other >> BOUND_SHIFT) & 3:
+                best_move = (other >> MOVE_SHIFT) & 0x7F
+
+        if value > VALUE_OFFSET - 1:
+            value = VALUE_OFFSET - 1
+        elif value < -VALUE_OFFSET:
+            value = -VALUE_OFFSET
+
+        packed = ((int(value) + VALUE_OFFSET) |
+                  (min(depth, 0xFF) << DEPTH_SHIFT) |
+                  (bound << BOUND_SHIFT) |
+                  (best_move << MOVE_SHIFT) |
+                  (age << AGE_SHIFT))
+
+        # Tier 1: depth-preferred slot
+        if (not (old >> BOUND_SHIFT) & 3 or
+                depth >= (old >> DEPTH_SHIFT) & 0xFF or
+                (old >> AGE_SHIFT) & 0xFF != age):
+            # Demote the previous occupant to the always-replace slot
+            if old_key != key and (old >> BOUND_SHIFT) & 3:
+                data[index + 1] = old
+                keys[index + 1] = old_key ^ old
+            elif other_key == key:
+                data[index + 1] = 0
+                keys[index + 1] = 0
+            data[index] = packed
+            keys[index] = key ^ packed
+            return
+
+        # Tier 2: always-replace slot
+        data[index + 1] = packed
+        keys[index + 1] = key ^ packed
+
+    def close(self):
+        """Unregister the table"""
+        _local_tables.pop(self.name, None)
+
+
+class SharedTranspositionTable(LocklessTranspositionTable):
+    """
+    Lock-free transposition table in multiprocessing.shared_memory, for
+    searchers in several processes (Lazy SMP, split points).
+
+    The search age lives in the shared header, so new_search() in one
+    process ages the table for all of them.
+
+    The creating process owns the block and unlinks it in close();
+    other processes attach to it by name.
+    """
+
+    def __init__(self, size_mb=16, name=None):
+        """
+        Create a shared table, or attach to an existing one.
+
+        Args:
+            size_mb: Memory budget in megabytes (same value when attaching)
+            name: Shared memory block to attach to (None = create one)
+        """
+        if shared_memory is None:
+            raise RuntimeError("SharedTranspositionTable requires Python 3.8+")
+
+        self._set_size(size_mb)
+        size = 8 * (HEADER_WORDS + 2 * self.num_entries)
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+            self.shm.buf[:size] = bytes(size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+
+        self._words = self.shm.buf[:size].cast('Q')
+        self.keys = self._words[HEADER_WORDS:HEADER_WORDS + self.num_entries]
+        self.data = self._words[HEADER_WORDS + self.num_entries:]
+        self.root = None
+
+        # Statistics (per process)
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    @property
+    def age(self):
+        return self._words[0]
+
+    @age.setter
+    def age(self, value):
+        self._words[0] = value
+
+    def clear(self):
+        """Erase all entries (in every process)"""
+        self.shm.buf[:len(self._words) * 8] = bytes(len(self._words) * 8)
+
+    def close(self):
+        """Detach from the block; the owner also frees it"""
+        if self.shm is None:
+            return
+        self.keys.release()
+        self.data.release()
+        self._words.release()
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+        self.shm = None
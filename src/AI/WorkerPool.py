@@ -0,0 +1,452 @@
+#------------------------------------------------------------------------
+#    Worker Pool Manager - One Process Pool for All Parallel Engines
+#
+#    A single, process-wide pool of warm worker processes. Parallel
+#    engines do not create pools of their own: they take a lease, which
+#    gives them a share of the workers (their core quota), shared-memory
+#    slots for their search bounds and flags, and a worker-side engine
+#    built once per worker from the lease's profile. Two engines
+#    searching at the same time split the workers instead of
+#    oversubscribing the cores; the pool is shut down explicitly or at
+#    interpreter exit, never by the garbage collector.
+#
+#    Two backends: worker processes (default), or worker threads on
+#    free-threaded CPython, where threads share one transposition table
+#    and the precomputed tables without pickling or copying. The thread
+#    backend is only used when the GIL is disabled at runtime; with the
+#    GIL, requests for it fall back to processes.
+#------------------------------------------------------------------------
+
+from collections import OrderedDict, deque
+from multiprocessing import cpu_count, get_all_start_methods, get_context, TimeoutError
+from multiprocessing.pool import ThreadPool
+import atexit
+import pickle
+import queue
+import sys
+import threading
+
+from AI.TranspositionTable import prepare_shared_memory
+
+# Leases that can be held at the same time (shared-memory slots)
+MAX_LEASES = 16
+
+# Worker profiles up to this size travel through shared memory; larger
+# ones are sent along with every task
+PROFILE_BYTES = 4096
+
+# Worker-side states (engines and their tables) kept per worker process
+MAX_WORKER_PROFILES = 4
+
+# Pool backends
+BACKEND_PROCESS = 'process'
+BACKEND_THREAD = 'thread'
+BACKENDS = (BACKEND_PROCESS, BACKEND_THREAD)
+
+# Workers are forked from a server process that has the search modules
+# imported once, instead of from the (large, threaded) main process
+START_METHOD = 'forkserver'
+PRELOAD_MODULES = [
+    'Reversi.BitboardGame',
+    'AI.BitboardMinimaxEngine',
+    'AI.ParallelBitboardMinimaxEngine',
+    'AI.GrandmasterEngine',
+    'AI.YBWCBitboardMinimaxEngine',
+    'AI.ParallelEndgameSolver',
+]
+
+
+class SharedSlot:
+    """One int of a shared array, with the multiprocessing.Value interface"""
+
+    def __init__(self, array, index):
+        self.array = array
+        self.index = index
+
+    @property
+    def value(self):
+        return self.array[self.index]
+
+    @value.setter
+    def value(self, value):
+        self.array[self.index] = value
+
+    def get_lock(self):
+        return self.array.get_lock()
+
+
+def gil_enabled():
+    """Whether the GIL is enabled (always, before free-threaded CPython 3.13)"""
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+def resolve_backend(backend):
+    """
+    Backend to use for a requested one: threads only run in parallel
+    without the GIL, so BACKEND_THREAD falls back to processes with it.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown pool backend '{backend}' (expected one of {BACKENDS})")
+    if backend == BACKEND_THREAD and gil_enabled():
+        return BACKEND_PROCESS
+    return backend
+
+
+class PoolWorker(threading.local):
+    """
+    Worker-side pool state, set up by init_pool_worker(): per worker
+    process, or per worker thread with the thread backend.
+    """
+
+    def __init__(self):
+        self.backend = BACKEND_PROCESS
+        self.bounds = None
+        self.flags = None
+        self.profiles = None
+        self.profile_sizes = None
+        self.slots = {}              # slot -> lease state seen by this worker
+        self.states = OrderedDict()  # profile bytes -> setup result
+
+_pool_worker = PoolWorker()
+
+# States shared by all worker threads of this process (see shared_worker_state)
+_shared_states = OrderedDict()
+_shared_states_lock = threading.Lock()
+
+def init_pool_worker(bounds, flags, profiles, profile_sizes, backend=BACKEND_PROCESS):
+    """Pool initializer: keep the shared lease slots"""
+    _pool_worker.backend = backend
+    _pool_worker.bounds = bounds
+    _pool_worker.flags = flags
+    _pool_worker.profiles = profiles
+    _pool_worker.profile_sizes = profile_sizes
+
+def run_job(job):
+    """
+    Run one leased task in a worker.
+    Must be at module level for pickling.
+
+    The lease's profile - a (setup, args) pair - is read from shared
+    memory the first time the worker sees the lease. setup(key, bound,
+    flag, *args) is then called before every task to activate the
+    lease's worker state (building it only for an unknown key): key is
+    the profile itself, so equally configured engines share warm state
+    across leases, e.g. across the games of a tournament.
+
+    Args:
+        job: Tuple of (func, task, slot, lease_id, inline_profile)
+
+    Returns:
+        func(task)
+    """
+    func, task, slot, lease_id, inline_profile = job
+
+    worker = _pool_worker
+    known = worker.slots.get(slot)
+    if known is None or known[0] != lease_id:
+        if inline_profile is None:
+            start = slot * PROFILE_BYTES
+            inline_profile = bytes(worker.profiles[start:start + worker.profile_sizes[slot]])
+        setup, args = pickle.loads(inline_profile)
+        known = worker.slots[slot] = (lease_id, inline_profile, setup, args,
+                                      SharedSlot(worker.bounds, slot), SharedSlot(worker.flags, slot))
+    _, profile, setup, args, bound, flag = known
+
+    setup(profile, bound, flag, *args)
+    return func(task)
+
+def cached_state(states, key, build):
+    """states[key], built on first use; least recently used dropped beyond MAX_WORKER_PROFILES"""
+    state = states.get(key)
+    if state is None:
+        state = states[key] = build()
+        while len(states) > MAX_WORKER_PROFILES:
+            states.popitem(last=False)
+    else:
+        states.move_to_end(key)
+    return state
+
+def worker_state(key, build):
+    """
+    Worker-side state for a profile key, built on first use: one per
+    worker process, or per worker thread with the thread backend.
+    """
+    return cached_state(_pool_worker.states, key, build)
+
+def shared_worker_state(key, build):
+    """
+    Worker-side state for a key shared by all workers of this process:
+    by the worker threads with the thread backend (e.g. one
+    transposition table), otherwise the same as worker_state().
+    """
+    if _pool_worker.backend != BACKEND_THREAD:
+        return worker_state(key, build)
+    with _shared_states_lock:
+        return cached_state(_shared_states, key, build)
+
+def worker_backend():
+    """Backend of the pool this worker belongs to"""
+    return _pool_worker.backend
+
+
+class LeaseResults:
+    """
+    Results of a batch of leased tasks in completion order, with at most
+    the lease's quota of tasks in the pool at any time.
+
+    Iterates like Pool.imap_unordered; next(timeout) raises
+    multiprocessing.TimeoutError if no result arrives in time.
+    """
+
+    def __init__(self, lease, func, tasks):
+        self.lease = lease
+        self.func = func
+        self.pending = deque(tasks)
+        self.results = queue.Queue()
+        self.outstanding = 0
+        self._submit()
+
+    def _submit(self):
+        quota = self.lease.quota
+        while self.pending and self.outstanding < quota:
+            self.lease.apply_async(self.func, self.pending.popleft(),
+                                   callback=self.results.put,
+                                   error_callback=self.results.put)
+            self.outstanding += 1
+
+    def __iter__(self):
+        return self
+
+    def next(self, timeout=None):
+        if not self.outstanding:
+            raise StopIteration
+        try:
+            result = self.results.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError
+        self.outstanding -= 1
+        self._submit()
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+    __next__ = next
+
+
+class PoolLease:
+    """
+    A parallel engine's share of the process-wide pool.
+
+    Attributes:
+        requested: Workers the engine asked for
+        bound: Shared int for the engine's search bound (e.g. root alpha)
+        flag: Shared int for the engine's stop/abort flag
+    """
+
+    def __init__(self, manager, slot, lease_id, requested, profile):
+        self.manager = manager
+        self.slot = slot
+        self.lease_id = lease_id
+        self.requested = requested
+        self.profile = profile
+        self.inline_profile = profile if len(profile) > PROFILE_BYTES else None
+        self.bound = SharedSlot(manager.bounds, slot)
+        self.flag = SharedSlot(manager.flags, slot)
+        self.outstanding = 0
+        self.released = False
+
+    @property
+    def quota(self):
+        """Workers this lease may keep busy right now"""
+        return self.manager.quota(self)
+
+    def _job(self, func, task):
+        if self.released:
+            raise RuntimeError("Pool lease already released")
+        return (func, task, self.slot, self.lease_id, self.inline_profile)
+
+    def apply(self, func, task):
+        """Run func(task) in a worker and wait for the result"""
+        return self.apply_async(func, task).get()
+
+    def apply_async(self, func, task, callback=None, error_callback=None):
+        """Run func(task) in a worker; returns its AsyncResult"""
+        job = self._job(func, task)
+        self.manager._started(self)
+
+        def done(result):
+            self.manager._finished(self)
+            if callback is not None:
+                callback(result)
+
+        def failed(error):
+            self.manager._finished(self)
+            if error_callback is not None:
+                error_callback(error)
+
+        return self.manager.pool.apply_async(run_job, (job,), callback=done,
+                                             error_callback=failed)
+
+    def imap_unordered(self, func, tasks):
+        """func over tasks within the lease's quota, in completion order"""
+        return LeaseResults(self, func, tasks)
+
+    def release(self):
+        """Give the slot back; the workers stay warm for other engines"""
+        if not self.released:
+            self.manager.release(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+class PoolManager:
+    """
+    Process-wide owner of a worker pool (one singleton per backend, see
+    instance()).
+
+    Quotas: the workers are divided evenly among the leases that are
+    busy (have tasks in the pool) at the time of asking; a lease never
+    gets more than it requested. A single searching engine therefore
+    gets the whole pool, two engines searching at once get half each.
+    """
+
+    _instances = {}
+    _instance_lock = threading.Lock()
+
+    def __init__(self, processes=None, start_method=START_METHOD, backend=BACKEND_PROCESS):
+        """
+        Args:
+            processes: Workers (default: one per core, minus one for the
+                       main process)
+            start_method: multiprocessing start method; falls back to the
+                          platform default where unavailable
+            backend: BACKEND_PROCESS, or BACKEND_THREAD for worker threads
+                     (used as given: see resolve_backend())
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown pool backend '{backend}' (expected one of {BACKENDS})")
+        self.processes = processes or max(1, cpu_count() - 1)
+        self.start_method = start_method if start_method in get_all_start_methods() else None
+        self.backend = backend
+
+        self.pool = None
+        self.bounds = None
+        self.flags = None
+        self.profiles = None
+        self.profile_sizes = None
+        self.leases = [None] * MAX_LEASES
+        self.next_lease_id = 1
+        self.lock = threading.Lock()
+
+    @classmethod
+    def instance(cls, backend=BACKEND_PROCESS):
+        """The process-wide manager of a backend"""
+        with cls._instance_lock:
+            manager = cls._instances.get(backend)
+            if manager is None:
+                manager = cls._instances[backend] = cls(backend=backend)
+                atexit.register(manager.shutdown)
+            return manager
+
+    def _start(self):
+        """Create the shared slots and the pool (once, on first lease)"""
+        threads = self.backend == BACKEND_THREAD
+        if not threads:
+            prepare_shared_memory()
+        ctx = get_context(None if threads else self.start_method)
+        if not threads and self.start_method == 'forkserver':
+            ctx.set_forkserver_preload(PRELOAD_MODULES)
+        self.bounds = ctx.Array('i', MAX_LEASES)
+        self.flags = ctx.Array('i', MAX_LEASES)
+        self.profiles = ctx.Array('c', MAX_LEASES * PROFILE_BYTES, lock=False)
+        self.profile_sizes = ctx.Array('i', MAX_LEASES, lock=False)
+        initargs = (self.bounds, self.flags, self.profiles, self.profile_sizes, self.backend)
+        if threads:
+            self.pool = ThreadPool(processes=self.processes, initializer=init_pool_worker,
+                                   initargs=initargs)
+        else:
+            self.pool = ctx.Pool(processes=self.processes, initializer=init_pool_worker,
+                                 initargs=initargs)
+
+    def acquire(self, workers, setup, args=()):
+        """
+        Lease a share of the pool.
+
+        Args:
+            workers: Workers requested (upper bound of the quota)
+            setup: Module-level function activating the worker state,
+                   called as setup(key, bound, flag, *args) in the worker
+            args: Picklable arguments of setup
+
+        Returns:
+            PoolLease
+        """
+        profile = pickle.dumps((setup, tuple(args)))
+        with self.lock:
+            if self.pool is None:
+                self._start()
+            if None not in self.leases:
+                raise RuntimeError(f"More than {MAX_LEASES} pool leases held at once")
+            slot = self.leases.index(None)
+            lease = PoolLease(self, slot, self.next_lease_id, max(1, workers), profile)
+            self.next_lease_id += 1
+            self.leases[slot] = lease
+
+        self.bounds[slot] = 0
+        self.flags[slot] = 0
+        if lease.inline_profile is None:
+            start = slot * PROFILE_BYTES
+            self.profiles[start:start + len(profile)] = profile
+            self.profile_sizes[slot] = len(profile)
+        return lease
+
+    def release(self, lease):
+        """Free a lease's slot"""
+        with self.lock:
+            if self.leases[lease.slot] is lease:
+                self.leases[lease.slot] = None
+            lease.released = True
+
+    def quota(self, lease):
+        """Even share of the workers among busy leases (see class docs)"""
+        with self.lock:
+            busy = sum(1 for other in self.leases
+                       if other is not None and (other.outstanding or other is lease))
+        return max(1, min(lease.requested, self.processes // max(1, busy)))
+
+    def _started(self, lease):
+        with self.lock:
+            lease.outstanding += 1
+
+    def _finished(self, lease):
+        with self.lock:
+            lease.outstanding -= 1
+
+    def resize(self, processes):
+        """Change the number of workers (restarts a running pool)"""
+        self.shutdown()
+        self.processes = max(1, processes)
+
+    def shutdown(self):
+        """Stop the workers now; later leases start a fresh pool"""
+        with self.lock:
+            pool, self.pool = self.pool, None
+            for lease in self.leases:
+                if lease is not None:
+                    lease.released = True
+            self.leases = [None] * MAX_LEASES
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+def get_pool_manager(backend=BACKEND_PROCESS):
+    """
+    The process-wide worker pool manager of a backend (engines pass the
+    backend through resolve_backend() when they are configured)
+    """
+    return PoolManager.instance(backend)
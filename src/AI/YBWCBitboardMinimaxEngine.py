@@ -0,0 +1,376 @@
+#------------------------------------------------------------------------
+#    YBWC Bitboard Minimax Engine - Split-Point Parallel Search
+#
+#    Young Brothers Wait Concept: a node is split between processes
+#    only after its eldest brother (first move) has been searched, so
+#    the helpers start with the alpha bound it established and most
+#    moves of a cut node are never searched in parallel in vain.
+#------------------------------------------------------------------------
+
+from AI.BitboardMinimaxEngine import INFINITY, DEFAULT_TT_MB, BUDGET_CHECK_MASK
+from AI.ParallelBitboardMinimaxEngine import ParallelBitboardMinimaxEngine
+import AI.ParallelBitboardMinimaxEngine as parallel
+from AI.TranspositionTable import TT_EXACT, TT_LOWER, TT_UPPER, NO_MOVE
+from AI.WorkerPool import BACKEND_PROCESS
+from Reversi.BitboardGame import squares
+from multiprocessing import TimeoutError
+import time
+
+# Nodes with at least this much remaining depth are split points; below
+# it a young brother is too small a task to be worth a process hop
+SPLIT_MIN_DEPTH = 4
+
+# Seconds between budget checks while the master waits for its helpers
+SPLIT_POLL_SECONDS = 0.05
+
+
+class SplitAbort:
+    """
+    Stop flag of one split point, as seen by a helper's check_budget():
+    raised once the master writes this split's id into the shared flag
+    (after a beta cutoff, or when its own budget runs out).
+    """
+
+    def __init__(self, flag, split_id):
+        self.flag = flag
+        self.split_id = split_id
+
+    @property
+    def value(self):
+        return self.flag.value == self.split_id
+
+
+def split_task(game, square, depth, alpha, beta, split_id, table):
+    """Compact, cheaply pickled task for one young brother of a split node"""
+    table_name, table_mb = (table.name, table.size_mb) if table is not None else (None, None)
+    return (game.black, game.white, game.turn, square, depth, alpha, beta,
+            split_id, table_name, table_mb)
+
+
+def young_brother_worker(task):
+    """
+    Helper: search one young brother of a split node.
+    Must be at module level for pickling.
+
+    The move is scouted with a null window at the alpha the eldest
+    brother established and re-searched only if it beats it. Helpers
+    search sequentially (they never split), into the master's shared
+    transposition table when there is one, and give up as soon as the
+    master aborts the split point.
+
+    Args:
+        task: Tuple of (black, white, turn, square, depth, alpha, beta,
+              split_id, table_name, table_mb); depth is that of the
+              split node
+
+    Returns:
+        Tuple of (square, value, nodes, pruning, complete); the value of
+        an aborted search (complete False) is meaningless
+    """
+    black, white, turn, square, depth, alpha, beta, split_id, table_name, table_mb = task
+
+    worker = parallel._worker
+    if worker.engine is None:
+        parallel.init_worker()
+    engine = worker.engine
+    game = worker.game
+
+    engine.nodes = 0
+    engine.pruning = 0
+    abort = SplitAbort(worker.stop, split_id)
+    if abort.value:
+        return (square, 0, 0, 0, False)
+
+    private_table = engine.transposition_table
+    if table_name is not None:
+        engine.transposition_table = parallel.attach_table(table_name, table_mb)
+    engine.stop_flag = abort
+    engine.start_budget()
+    try:
+        game.set_position(black, white, turn)
+        game.make(square)
+        if alpha > -INFINITY:
+            value = -engine.alphabeta(game, depth - 1, -alpha - 1, -alpha)
+            if alpha < value < beta and not engine.stopped:
+                value = -engine.alphabeta(game, depth - 1, -beta, -alpha)
+        else:
+            value = -engine.alphabeta(game, depth - 1, -beta, -alpha)
+        complete = not engine.stopped
+    finally:
+        engine.transposition_table = private_table
+        engine.stop_flag = None
+        engine.start_budget()
+
+    return (square, value, engine.nodes, engine.pruning, complete)
+
+
+class YBWCBitboardMinimaxEngine(ParallelBitboardMinimaxEngine):
+    """
+    Parallel bitboard minimax with Young Brothers Wait Concept splitting.
+
+    Features:
+    - Splits at internal nodes, not only at the root: every node with
+      at least split_depth plies to go (root included) searches its
+      eldest brother first - recursively splitting below it - and then
+      hands the young brothers to the worker pool with the alpha bound
+      the eldest brother established
+    - Helpers abort as soon as one young brother fails high (beta
+      cutoff) or the search budget runs out
+    - One transposition table in shared memory (or simply in memory,
+      with worker threads) for master and helpers, so split points find
+      the hash move and helpers reuse each other's results
+    - Iterative deepening also for fixed-depth searches, so that the
+      eldest brother is usually the best move (the premise of YBWC)
+
+    The master process only waits while a node is split: the engine's
+    share of the process-wide worker pool does the parallel work.
+    """
+
+    def __init__(self, evaluator=None, num_workers=None, tt_size_mb=DEFAULT_TT_MB,
+                 split_depth=SPLIT_MIN_DEPTH, backend=BACKEND_PROCESS):
+        super().__init__(evaluator, num_workers, tt_size_mb, backend=backend)
+        self.split_depth = split_depth
+
+        # Only the master process splits; workers run plain alpha-beta
+        self.splitting = False
+        self.split_id = 0
+
+        # Statistics of the last search
+        self.splits = 0
+        self.aborts = 0
+
+    def alphabeta(self, game, depth, alpha, beta):
+        """Alpha-beta search; nodes deep enough to split become split points"""
+        if not self.splitting or depth < self.split_depth:
+            return super().alphabeta(game, depth, alpha, beta)
+        return self.split_node(game, depth, alpha, beta)
+
+    def split_node(self, game, depth, alpha, beta):
+        """
+        Alpha-beta at a split point: the eldest brother (hash move
+        first) is searched here, the young brothers in parallel.
+        """
+        self.nodes += 1
+        if not self.nodes & BUDGET_CHECK_MASK and self.check_budget():
+            return 0
+
+        pos_hash = game.zobrist
+        hash_square = NO_MOVE
+        entry = self.transposition_table.probe(pos_hash)
+        if entry is not None:
+            stored_depth, stored_value, stored_type, hash_square = entry
+            if stored_depth >= depth:
+                if stored_type == TT_EXACT:
+                    return stored_value
+                elif stored_type == TT_LOWER and stored_value >= beta:
+                    return stored_value
+                elif stored_type == TT_UPPER and stored_value <= alpha:
+                    return stored_value
+
+        moves = game.get_valid_moves()
+        if not moves and not game.get_opponent_moves():
+            return self.terminal_value(game)
+        if not moves:
+            game.make_pass()
+            value = -self.alphabeta(game, depth - 1, -beta, -alpha)
+            game.unmake_pass()
+            return value
+
+        ordered = list(squares(moves))
+        if hash_square in ordered:
+            ordered.remove(hash_square)
+            ordered.insert(0, hash_square)
+        original_alpha = alpha
+
+        # Eldest brother: searched alone, may itself split further down
+        best_square = ordered[0]
+        flips = game.make(best_square)
+        best_value = -self.alphabeta(game, depth - 1, -beta, -alpha)
+        game.unmake(best_square, flips)
+        if self.stopped:
+            return 0
+        alpha = max(alpha, best_value)
+
+        # Young brothers: in parallel, unless the eldest already cut off
+        if alpha < beta and len(ordered) > 1:
+            for square, value in self.search_young_brothers(game, ordered[1:], depth,
+                                                            alpha, beta):
+                if value > best_value:
+                    best_value = value
+                    best_square = square
+            if self.stopped:
+                return 0
+            alpha = max(alpha, best_value)
+
+        if alpha >= beta:
+            # Fail soft, as in BitboardMinimaxEngine.alphabeta
+            self.pruning += 1
+            self.transposition_table.store(pos_hash, depth, best_value, TT_LOWER, best_square)
+            return best_value
+
+        if best_value <= original_alpha:
+            self.transposition_table.store(pos_hash, depth, best_value, TT_UPPER)
+        else:
+            self.transposition_table.store(pos_hash, depth, best_value, TT_EXACT, best_square)
+        return best_value
+
+    def search_young_brothers(self, game, young_squares, depth, alpha, beta):
+        """
+        Search the young brothers of a split node in the worker pool.
+
+        Results are collected as they complete; the first one that
+        reaches beta (or the master's budget running out) aborts the
+        helpers still searching this split point.
+
+        Returns:
+            List of (square, value) of the completed searches; values
+            that did not beat alpha are upper bounds
+        """
+        lease = self._get_lease()
+        self.split_id += 1
+        self.splits += 1
+        split_id = self.split_id
+        table = self._shared_table
+
+        tasks = [split_task(game, square, depth, alpha, beta, split_id, table)
+                 for square in young_squares]
+        pending = lease.imap_unordered(young_brother_worker, tasks)
+
+        results = []
+        aborted = False
+        for _ in tasks:
+            while True:
+                try:
+                    square, value, nodes, pruning, complete = pending.next(SPLIT_POLL_SECONDS)
+                    break
+                except TimeoutError:
+                    if not aborted and self.check_budget():
+                        lease.flag.value = split_id
+                        aborted = True
+
+            self.nodes += nodes
+            self.pruning += pruning
+            if not complete:
+                continue
+            results.append((square, value))
+            alpha = max(alpha, value)
+
+            if aborted:
+                continue
+            if alpha >= beta:
+                self.aborts += 1
+            elif not self.check_budget():
+                continue
+            lease.flag.value = split_id
+            aborted = True
+
+        return results
+
+    def search_root(self, game, depth, root_squares, guess=None):
+        """
+        Search the root moves in the given order; the root is a split
+        point like any other node.
+
+        Returns:
+            (best_square, best_value), or None if the budget ran out
+        """
+        if not self.splitting or depth < self.split_depth or len(root_squares) < 2:
+            return super().search_root(game, depth, root_squares, guess)
+
+        best_square = root_squares[0]
+        flips = game.make(best_square)
+        best_value = -self.alphabeta(game, depth - 1, -INFINITY, INFINITY)
+        game.unmake(best_square, flips)
+        if self.stopped:
+            return None
+
+        for square, value in self.search_young_brothers(game, root_squares[1:], depth,
+                                                        best_value, INFINITY):
+            if value > best_value:
+                best_value = value
+                best_square = square
+        if self.stopped:
+            return None
+
+        return best_square, best_value
+
+    def get_best_move(self, game, depth, player_name=None, time_ms=None, node_limit=None):
+        """
+        Find best move with YBWC parallel search.
+
+        Splitting needs at least two workers and a search at least
+        split_depth deep; otherwise the same search runs sequentially in
+        this process (the baseline for speedup measurements). With
+        time_ms or node_limit, iterative deepening within that budget.
+        """
+        self.splits = 0
+        self.aborts = 0
+        budget = time_ms or node_limit
+        if self.num_workers < 2 or not (budget or depth >= self.split_depth):
+            if budget:
+                return self.iterative_deepening(game, depth, time_ms, node_limit, player_name)
+            return self._get_best_move_ybwc(game, depth, player_name)
+
+        self._get_lease().flag.value = 0
+
+        # Master and helpers search into one shared table when available
+        private_table = self.transposition_table
+        shared_table = self._get_shared_table()
+        if shared_table is not None:
+            self.transposition_table = shared_table
+        self.splitting = True
+        try:
+            if budget:
+                return self.iterative_deepening(game, depth, time_ms, node_limit, player_name)
+            return self._get_best_move_ybwc(game, depth, player_name)
+        finally:
+            self.splitting = False
+            self.transposition_table = private_table
+
+    def _get_best_move_ybwc(self, game, depth, player_name):
+        """Fixed-depth YBWC search (iterative deepening to depth) with reasoning output"""
+        time_start = time.perf_counter()
+        self.nodes = 0
+        self.pruning = 0
+        self.reduced = self.re_searches = 0
+        self.transposition_table.new_search()
+        self.start_budget()
+
+        root_squares = self.order_root_moves(game, squares(game.get_valid_moves()))
+        if not root_squares:
+            return None
+
+        print("\n" + "="*80)
+        if player_name:
+            print(f"🚀 YBWC BITBOARD AI - {player_name} ({self.num_workers} workers)")
+        else:
+            print(f"🚀 YBWC BITBOARD AI ({self.num_workers} workers)")
+        print("="*80)
+
+        # A stopped iteration is discarded, as in iterative deepening
+        best_square, best_value = None, None
+        for iteration in range(1, depth + 1):
+            result = self.search_root(game, iteration, root_squares, best_value)
+            if result is None:
+                break
+            best_square, best_value = result
+            self.report_progress(game, iteration, best_square, best_value)
+            root_squares.remove(best_square)
+            root_squares.insert(0, best_square)
+        best_move = game.square_to_move(best_square) if best_square is not None else None
+
+        time_total = time.perf_counter() - time_start
+        print(f"📊 YBWC SUMMARY:")
+        if self.splitting:
+            print(f"   • Workers: {self._lease.quota} (split depth {self.split_depth})")
+        else:
+            print("   • Sequential (no split points)")
+        print(f"   • Split points: {self.splits:,} ({self.aborts:,} aborted on cutoff)")
+        print(f"   • Nodes: {self.nodes:,}")
+        print(f"   • Time: {time_total:.3f}s")
+        if time_total > 0:
+            print(f"   • Rate: {self.nodes/time_total:,.0f} nodes/sec")
+        print(f"   • Selected: {best_move} (value: {best_value})")
+        print("="*80 + "\n")
+
+        return best_move
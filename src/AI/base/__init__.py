@@ -9,6 +9,7 @@ Architecture: Strategy Pattern + Dependency Injection
 
 from AI.base.engine import Engine
 from AI.base.engine_metadata import EngineMetadata
+from AI.base.search_handle import SearchHandle, SearchLimits
 
-__all__ = ['Engine', 'EngineMetadata']
+__all__ = ['Engine', 'EngineMetadata', 'SearchHandle', 'SearchLimits']
 
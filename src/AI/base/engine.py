@@ -8,7 +8,8 @@ Version: 3.2.0
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
+from AI.base.search_handle import SearchHandle
 
 
 class Engine(ABC):
@@ -29,6 +30,9 @@ class Engine(ABC):
                 pass
     """
     
+    # True if get_best_move() accepts time_ms/node_limit budgets
+    supports_time_control = False
+    
     def __init__(self, name: str = "Engine", config: Optional[Dict[str, Any]] = None):
         """
         Initialize engine.
@@ -48,6 +52,12 @@ class Engine(ABC):
             'cache_misses': 0,
             'time_spent_ms': 0
         }
+        
+        # Stop flag and progress callback of a background search
+        # (see start_search), None otherwise
+        self.search_stop = None
+        self.search_progress = None
+        self._search = None
     
     @abstractmethod
     def get_best_move(self, game, depth: int, **kwargs):
@@ -77,6 +87,83 @@ class Engine(ABC):
         """
         pass
     
+    def score_moves(self, game, moves, depth: int, alpha: Optional[float] = None):
+        """
+        Score root moves for the side to move (higher is better), each
+        searched to the given depth. ParallelSearchDecorator splits the
+        root between worker processes through this method.
+        
+        Args:
+            game: Game state (left unchanged)
+            moves: Moves to score, in search order
+            depth: Search depth of the root (the moves are searched
+                   depth - 1 plies below it)
+            alpha: Score to beat, if known; scores not above it may be
+                   upper bounds
+        
+        Returns:
+            list: (move, score) per move, or None if the engine cannot
+                  score single moves (the default)
+        """
+        return None
+    
+    def start_search(self, game, limits=None,
+                     progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+                     **kwargs) -> SearchHandle:
+        """
+        Start searching in a worker thread and return at once.
+        
+        Args:
+            game: Game state (the search runs on a copy)
+            limits: SearchLimits (depth, time_ms, node_limit), a dict of
+                    them or a depth
+            progress: Optional callback receiving progress dicts
+            **kwargs: Additional get_best_move() parameters (player_name, etc.)
+        
+        Returns:
+            SearchHandle: poll(), result(), stop() of the running search
+        
+        Raises:
+            RuntimeError: If a search of this engine is still running
+        """
+        if self._search is not None and not self._search.poll():
+            raise RuntimeError(f"{self.name} is already searching")
+        self._search = SearchHandle(self, game, limits, progress, **kwargs)
+        return self._search
+    
+    def set_search_control(self, stop_flag, progress):
+        """
+        Attach the stop flag (an object with a truthy `.value` once the
+        search should stop) and progress callback of a background
+        search, or detach them with None. Decorators pass them on to the
+        engine they wrap; engines that can stop mid-tree or report
+        progress override this to hand them to their search.
+        """
+        self.search_stop = stop_flag
+        self.search_progress = progress
+        wrapped = getattr(self, 'engine', None)
+        if isinstance(wrapped, Engine):
+            wrapped.set_search_control(stop_flag, progress)
+    
+    def predict_reply(self, game):
+        """
+        Predict the move of the side to move, e.g. the opponent's reply
+        after our move (used for pondering).
+        
+        Decorators ask the engine they wrap; engines that remember their
+        search (transposition table best moves) override this.
+        
+        Args:
+            game: Game state
+        
+        Returns:
+            Move: Expected move, or None if the engine cannot tell
+        """
+        wrapped = getattr(self, 'engine', None)
+        if isinstance(wrapped, Engine):
+            return wrapped.predict_reply(game)
+        return None
+    
     def get_statistics(self) -> Dict[str, Any]:
         """
         Get engine performance statistics.
@@ -101,6 +188,17 @@ class Engine(ABC):
             if key in self._statistics:
                 self._statistics[key] += value
     
+    def close(self):
+        """
+        Release resources held outside the engine object, such as a
+        lease on the shared worker pool. Decorators close the engine
+        they wrap; the engine stays usable (resources are taken again
+        on the next search).
+        """
+        wrapped = getattr(self, 'engine', None)
+        if isinstance(wrapped, Engine):
+            wrapped.close()
+    
     def get_name(self) -> str:
         """Get engine display name."""
         return self.name
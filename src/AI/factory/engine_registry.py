@@ -107,6 +107,22 @@ class EngineRegistry:
         
         return cls._engines[name](**kwargs)
     
+    @classmethod
+    def get_name(cls, engine_class: Type[Engine]) -> Optional[str]:
+        """
+        Registered name of an engine class.
+        
+        Args:
+            engine_class: Engine class
+        
+        Returns:
+            Engine identifier or None if the class is not registered
+        """
+        for name, registered in cls._engines.items():
+            if registered is engine_class:
+                return name
+        return None
+    
     @classmethod
     def list_engines(cls) -> Dict[str, EngineMetadata]:
         """
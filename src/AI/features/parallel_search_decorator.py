@@ -1,105 +1,220 @@
 """
 Parallel Search Decorator
 
-Decorator Pattern: Adds multi-threading to any engine.
+Decorator Pattern: Adds multi-process root splitting to any engine.
 
 Version: 3.2.0
 """
 
 import sys
 import os
+import io
+import time
+import importlib
+import contextlib
+import threading
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from AI.base.engine import Engine
+from AI.factory.engine_registry import EngineRegistry
+from AI.WorkerPool import BACKEND_PROCESS, get_pool_manager, resolve_backend, worker_state
 from typing import Optional
-import multiprocessing
-from copy import deepcopy
+
+
+class WorkerEngine(threading.local):
+    """
+    Engine rebuilt in each worker from its registry name and config:
+    per worker process, or per worker thread with the thread backend.
+    """
+    engine = None
+
+_worker = WorkerEngine()
+
+def activate_engine_worker(key, bound, flag, module, name, config):
+    """
+    Worker setup of a pool lease (see AI.WorkerPool.run_job): switch to
+    the wrapped engine, rebuilt once per worker from its registry name
+    and configuration instead of being pickled with every task.
+    """
+    def build():
+        importlib.import_module(module)  # registers the engine in this process
+        with contextlib.redirect_stdout(io.StringIO()):
+            return EngineRegistry.get_engine(name, config=config)
+
+    _worker.engine = worker_state(key, build)
+
+def game_snapshot(game):
+    """Compact, picklable copy of a Game or BitboardGame position"""
+    if hasattr(game, 'set_position'):
+        return ('bitboard', game.black, game.white, game.turn)
+    return ('game', game.size, game.export_str(), game.turn, game.turn_cnt)
+
+def restore_game(snapshot):
+    """Game object for a game_snapshot()"""
+    if snapshot[0] == 'bitboard':
+        from Reversi.BitboardGame import BitboardGame
+        _, black, white, turn = snapshot
+        game = BitboardGame.create_empty()
+        game.set_position(black, white, turn)
+        return game
+
+    from Reversi.Game import Game
+    _, size, board, turn, turn_cnt = snapshot
+    game = Game(size)
+    game.import_str(board)
+    game.turn = turn
+    game.turn_cnt = turn_cnt
+    return game
+
+def score_moves_worker(task):
+    """
+    Worker function: score root moves with the worker's engine.
+    Must be at module level for pickling.
+
+    Args:
+        task: Tuple of (snapshot, moves, depth, alpha)
+
+    Returns:
+        Tuple of (scores, statistics) - the engine's (move, score) list
+        and the statistics it accumulated for this task
+    """
+    snapshot, moves, depth, alpha = task
+    engine = _worker.engine
+    engine.reset_statistics()
+    scores = engine.score_moves(restore_game(snapshot), moves, depth, alpha)
+    return scores, engine.get_statistics()
+
+
+def supports_move_scoring(engine: Engine) -> bool:
+    """Whether an engine implements Engine.score_moves()."""
+    return type(engine).score_moves is not Engine.score_moves
 
 
 class ParallelSearchDecorator(Engine):
     """
-    Decorator Pattern: Wraps any engine with parallel search.
-    
-    Evaluates moves in parallel using multiple threads/processes.
-    
+    Decorator Pattern: Wraps any engine with parallel root search.
+
+    Root moves are scored by workers from the shared pool
+    (AI.WorkerPool: processes, or threads on free-threaded CPython)
+    through the engine's score_moves(). The first move
+    is searched alone; the others are then scored dynamically, one per
+    task, against its score. Workers rebuild the engine from its
+    registry name and config once, so only positions and moves travel
+    per task; worker statistics are merged into this decorator's.
+
+    Falls back to the wrapped engine's own search for shallow or
+    budgeted searches, narrow roots, and engines that are not
+    registered or cannot score single moves.
+
     Example:
         base_engine = MinimaxEngine()
         engine = ParallelSearchDecorator(base_engine, threads=8)
     """
-    
-    def __init__(self, wrapped_engine: Engine, threads: int = 4):
+
+    def __init__(self, wrapped_engine: Engine, threads: int = 4,
+                 backend: str = BACKEND_PROCESS):
         """
         Wrap engine with parallel search.
-        
+
         Args:
             wrapped_engine: Base engine to wrap
-            threads: Number of threads to use
+            threads: Workers to request (the shared pool grants at most
+                     its size, less when busy)
+            backend: 'process', or 'thread' for worker threads where the
+                     GIL is disabled (processes otherwise)
         """
         super().__init__(name=f"{wrapped_engine.name}+Parallel")
         self.engine = wrapped_engine
-        self.threads = min(threads, multiprocessing.cpu_count())
-        self.pool = None
-    
-    def _ensure_pool(self):
-        """Lazy initialization of process pool."""
-        if self.pool is None:
-            self.pool = multiprocessing.Pool(self.threads)
-    
+        self.threads = threads
+        self.backend = resolve_backend(backend)
+        self.lease = None
+
+    def _worker_spec(self) -> Optional[tuple]:
+        """(module, registry name, config) to rebuild the engine in workers, or None"""
+        if self.threads < 2 or not supports_move_scoring(self.engine):
+            return None
+        name = EngineRegistry.get_name(type(self.engine))
+        if name is None:
+            return None
+        return (type(self.engine).__module__, name, self.engine.get_config())
+
+    def _get_lease(self, spec):
+        """Get or take a lease on the shared worker pool for this engine"""
+        if self.lease is None or self.lease.released:
+            self.lease = get_pool_manager(self.backend).acquire(self.threads, activate_engine_worker, spec)
+        return self.lease
+
     def get_best_move(self, game, depth: int, **kwargs):
         """
-        Get best move using parallel evaluation.
-        
+        Get best move using parallel root search.
+
         Args:
             game: Game state
             depth: Search depth
             **kwargs: Additional parameters
-        
+
         Returns:
             Move: Best move
         """
         moves = game.get_move_list()
-        
+
         # If only one move, no need for parallel
         if len(moves) <= 1:
             return moves[0] if moves else None
-        
-        # For shallow depth or few moves, use sequential
-        if depth <= 2 or len(moves) <= 2:
+
+        # Budgeted (iterative deepening) searches run in the wrapped engine
+        if depth is None or kwargs.get('time_ms') or kwargs.get('node_limit'):
             return self.engine.get_best_move(game, depth, **kwargs)
-        
-        # Parallel evaluation
-        self._ensure_pool()
-        
-        try:
-            # Evaluate each move in parallel
-            results = []
-            for move in moves:
-                game_copy = deepcopy(game)
-                game_copy.move(move)
-                score = self.engine.evaluate_position(game_copy)
-                results.append((move, score))
-            
-            # Find best move
-            best_move, best_score = max(results, key=lambda x: x[1])
-            return best_move
-        
-        except Exception as e:
-            # Fallback to sequential on error
-            print(f"Parallel search error: {e}, falling back to sequential")
+
+        # For shallow depth, few moves or engines workers cannot rebuild,
+        # use sequential
+        spec = self._worker_spec()
+        if depth <= 2 or len(moves) <= 2 or spec is None:
             return self.engine.get_best_move(game, depth, **kwargs)
-    
+
+        time_start = time.perf_counter()
+        lease = self._get_lease(spec)
+        snapshot = game_snapshot(game)
+
+        # First move alone, to give the others a score to beat
+        first, stats = lease.apply(score_moves_worker, (snapshot, moves[:1], depth, None))
+        self.update_statistics(**stats)
+        alpha = first[0][1]
+
+        scores = {0: first[0][1]}
+        tasks = [(snapshot, [move], depth, alpha) for move in moves[1:]]
+        for result, stats in lease.imap_unordered(score_moves_worker, tasks):
+            self.update_statistics(**stats)
+            move, score = result[0]
+            scores[moves.index(move)] = score
+
+        # Highest score, earliest move on ties (as a sequential search)
+        best = max(range(len(moves)), key=lambda i: (scores[i], -i))
+        self.update_statistics(time_spent_ms=int((time.perf_counter() - time_start) * 1000))
+        return moves[best]
+
     def evaluate_position(self, game) -> float:
         """Delegate evaluation to wrapped engine."""
         return self.engine.evaluate_position(game)
-    
+
+    def get_statistics(self):
+        """Combine statistics of the wrapped engine and of the workers."""
+        stats = self.engine.get_statistics()
+        for key, value in self._statistics.items():
+            stats[key] = stats.get(key, 0) + value
+        return stats
+
+    def close(self):
+        """Release the worker pool lease and close the wrapped engine."""
+        self.cleanup()
+        super().close()
+
     def cleanup(self):
-        """Clean up process pool."""
-        if self.pool:
-            self.pool.close()
-            self.pool.join()
-            self.pool = None
-    
+        """Release the worker pool lease."""
+        if self.lease is not None:
+            self.lease.release()
+            self.lease = None
+
     def __del__(self):
         """Cleanup on deletion."""
         self.cleanup()
-
@@ -23,7 +23,7 @@ from AI.factory.engine_registry import EngineRegistry
     complexity='very_high',
     speed='slow',
     strength='master',
-    features=['bitboard', 'advanced_eval', 'endgame', 'move_ordering', 'killer_moves']
+    features=['bitboard', 'advanced_eval', 'endgame', 'move_ordering', 'history_heuristic']
 ))
 class GrandmasterEngine(Engine):
     """
@@ -39,6 +39,8 @@ class GrandmasterEngine(Engine):
     Wrapper around AI/GrandmasterEngine.py.
     """
     
+    supports_time_control = True
+    
     def __init__(self, config=None):
         """Initialize grandmaster engine."""
         super().__init__("Grandmaster", config)
@@ -51,9 +53,23 @@ class GrandmasterEngine(Engine):
             self.evaluator = AdvancedEvaluator()
         
         # Use legacy grandmaster engine
-        from AI.GrandmasterEngine import GrandmasterEngine as LegacyGrandmasterEngine
-        self._legacy_engine = LegacyGrandmasterEngine()
+        from AI.GrandmasterEngine import (
+            GrandmasterEngine as LegacyGrandmasterEngine, ENDGAME_EMPTIES, WLD_EMPTIES
+        )
+        from AI.BitboardMinimaxEngine import DEFAULT_TT_MB
+        from AI.ParallelBitboardMinimaxEngine import SEARCH_AUTO
+        from AI.WorkerPool import BACKEND_PROCESS
+        config = config or {}
+        self._legacy_engine = LegacyGrandmasterEngine(
+            tt_size_mb=config.get('tt_size_mb', DEFAULT_TT_MB),
+            endgame_empties=config.get('endgame_empties', ENDGAME_EMPTIES),
+            wld_empties=config.get('wld_empties', WLD_EMPTIES),
+            search_mode=config.get('search_mode', SEARCH_AUTO),
+            backend=config.get('backend', BACKEND_PROCESS)
+        )
         self._legacy_engine.evaluator = self.evaluator
+        self._legacy_engine.set_selectivity(config.get('selectivity'))
+        self._legacy_engine.set_reductions(config.get('reductions'))
     
     def get_best_move(self, game, depth: int, **kwargs):
         """Find best move using grandmaster techniques."""
@@ -79,7 +95,36 @@ class GrandmasterEngine(Engine):
         
         return move
     
+    def set_search_control(self, stop_flag, progress):
+        """Hand the stop flag and progress callback to the search and the endgame solver."""
+        super().set_search_control(stop_flag, progress)
+        self._legacy_engine.stop_flag = stop_flag
+        self._legacy_engine.progress = progress
+        self._legacy_engine.endgame_solver.stop_flag = stop_flag
+    
+    def predict_reply(self, game):
+        """Expected move of the side to move: the transposition table's best move."""
+        from Reversi.BitboardGame import BitboardGame
+        from AI.TranspositionTable import NO_MOVE
+        
+        if not isinstance(game, BitboardGame):
+            bitboard_game = BitboardGame()
+            bitboard_game.import_game_state(game)
+            game = bitboard_game
+        
+        square = self._legacy_engine.hash_move(game)
+        return None if square == NO_MOVE else game.square_to_move(square)
+    
     def evaluate_position(self, game) -> float:
         """Evaluate position using advanced evaluator."""
         return self.evaluator.evaluate(game)
-
+    
+    def get_statistics(self):
+        """Statistics plus the kind of result behind the last move (exact/wld/heuristic)."""
+        stats = super().get_statistics()
+        stats.update(self._legacy_engine.get_search_result())
+        return stats
+    
+    def close(self):
+        """Release the worker pool lease of the parallel search."""
+        self._legacy_engine.close_pool()
@@ -0,0 +1,145 @@
+"""
+YBWC Engine
+
+Split-point parallel search (Young Brothers Wait Concept).
+Wrapper around AI/YBWCBitboardMinimaxEngine.py.
+
+Version: 3.2.0
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from AI.base.engine import Engine
+from AI.base.engine_metadata import EngineMetadata
+from AI.factory.engine_registry import EngineRegistry
+
+
+@EngineRegistry.register('ybwc', EngineMetadata(
+    name='ybwc',
+    display_name='YBWC Parallel',
+    description='Bitboard alpha-beta split between processes at internal nodes (YBWC)',
+    complexity='very_high',
+    speed='fast',
+    strength='strong',
+    features=['bitboard', 'alpha_beta', 'parallel', 'ybwc', 'shared_tt'],
+    parameters={'num_workers': None, 'split_depth': 4, 'tt_size_mb': 16,
+                'backend': 'process'}
+))
+class YBWCEngine(Engine):
+    """
+    Parallel bitboard engine with Young Brothers Wait Concept splitting.
+    
+    Features:
+    - Nodes are split between worker processes only after their first
+      move (eldest brother) has been searched
+    - Helpers start with the alpha bound the eldest brother established
+      and are aborted on a beta cutoff
+    - Transposition table in shared memory for all processes (one
+      in-process table with worker threads, backend='thread')
+    
+    Wrapper around AI/YBWCBitboardMinimaxEngine.py.
+    """
+    
+    supports_time_control = True
+    
+    def __init__(self, config=None):
+        """
+        Initialize YBWC engine.
+        
+        Args:
+            config: Optional configuration (evaluator, num_workers,
+                    split_depth, tt_size_mb, backend, selectivity,
+                    reductions)
+        """
+        super().__init__("YBWC", config)
+        
+        # Get evaluator
+        if config and 'evaluator' in config:
+            self.evaluator = config['evaluator']
+        else:
+            from AI.StandardEvaluator import StandardEvaluator
+            self.evaluator = StandardEvaluator()
+        
+        # Use legacy YBWC engine
+        from AI.YBWCBitboardMinimaxEngine import YBWCBitboardMinimaxEngine, SPLIT_MIN_DEPTH
+        from AI.BitboardMinimaxEngine import DEFAULT_TT_MB
+        from AI.WorkerPool import BACKEND_PROCESS
+        config = config or {}
+        self._legacy_engine = YBWCBitboardMinimaxEngine(
+            evaluator=self.evaluator,
+            num_workers=config.get('num_workers'),
+            tt_size_mb=config.get('tt_size_mb', DEFAULT_TT_MB),
+            split_depth=config.get('split_depth', SPLIT_MIN_DEPTH),
+            backend=config.get('backend', BACKEND_PROCESS)
+        )
+        self._legacy_engine.set_selectivity(config.get('selectivity'))
+        self._legacy_engine.set_reductions(config.get('reductions'))
+    
+    def get_best_move(self, game, depth: int, **kwargs):
+        """
+        Find best move using YBWC parallel search.
+        
+        Args:
+            game: Game state
+            depth: Search depth (maximum depth with a time/node budget)
+            **kwargs: Additional parameters (player_name, time_ms, node_limit)
+        
+        Returns:
+            Move: Best move
+        """
+        # Convert to BitboardGame if necessary
+        from Reversi.BitboardGame import BitboardGame
+        
+        if not isinstance(game, BitboardGame):
+            # Convert traditional Game to BitboardGame
+            bitboard_game = BitboardGame()
+            bitboard_game.import_game_state(game)
+            game_to_use = bitboard_game
+        else:
+            game_to_use = game
+        
+        move = self._legacy_engine.get_best_move(game_to_use, depth, **kwargs)
+        
+        # Update statistics
+        self.update_statistics(
+            nodes_evaluated=self._legacy_engine.nodes,
+            pruning_count=self._legacy_engine.pruning
+        )
+        
+        return move
+    
+    def set_search_control(self, stop_flag, progress):
+        """Hand the stop flag (which also aborts the helpers) and progress callback to the search."""
+        super().set_search_control(stop_flag, progress)
+        self._legacy_engine.stop_flag = stop_flag
+        self._legacy_engine.progress = progress
+    
+    def predict_reply(self, game):
+        """Expected move of the side to move: the transposition table's best move."""
+        from Reversi.BitboardGame import BitboardGame
+        from AI.TranspositionTable import NO_MOVE
+        
+        if not isinstance(game, BitboardGame):
+            bitboard_game = BitboardGame()
+            bitboard_game.import_game_state(game)
+            game = bitboard_game
+        
+        square = self._legacy_engine.hash_move(game)
+        return None if square == NO_MOVE else game.square_to_move(square)
+    
+    def evaluate_position(self, game) -> float:
+        """Evaluate position."""
+        return self.evaluator.evaluate(game)
+    
+    def get_statistics(self):
+        """Statistics plus the split points of the last search."""
+        stats = super().get_statistics()
+        stats['split_points'] = self._legacy_engine.splits
+        stats['split_aborts'] = self._legacy_engine.aborts
+        return stats
+    
+    def close(self):
+        """Release the worker pool lease."""
+        self._legacy_engine.close_pool()
@@ -55,6 +55,12 @@ class HeuristicEngine(Engine):
         
         return move
     
+    def score_moves(self, game, moves, depth: int, alpha=None):
+        """Score root moves with the move heuristics (see Engine.score_moves)."""
+        scores = [(move, self._legacy_engine._evaluate_move(move, game)) for move in moves]
+        self.update_statistics(nodes_evaluated=len(moves))
+        return scores
+    
     def evaluate_position(self, game) -> float:
         """Evaluate position using positional heuristics."""
         if hasattr(self._legacy_engine, 'evaluator'):
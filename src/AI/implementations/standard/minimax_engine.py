@@ -46,6 +46,7 @@ class MinimaxEngine(Engine):
         Args:
             config: Optional configuration dict
                 - evaluator: Custom evaluator instance
+                - tt_size_mb: Transposition table budget (MB)
         """
         super().__init__("Minimax", config)
         
@@ -59,7 +60,8 @@ class MinimaxEngine(Engine):
         
         # Use legacy MinimaxEngine for actual computation
         from AI.MinimaxEngine import MinimaxEngine as LegacyMinimaxEngine
-        self._legacy_engine = LegacyMinimaxEngine()
+        tt_size_mb = (config or {}).get('tt_size_mb', 16)
+        self._legacy_engine = LegacyMinimaxEngine(tt_size_mb=tt_size_mb)
         self._legacy_engine.evaluator = self.evaluator
     
     def get_best_move(self, game, depth: int, **kwargs):
@@ -85,6 +87,37 @@ class MinimaxEngine(Engine):
         
         return move
     
+    def score_moves(self, game, moves, depth: int, alpha=None):
+        """
+        Score root moves with the alpha-beta search (see Engine.score_moves).
+        
+        Each move is searched with the best score so far as bound, like
+        the root loop of the legacy engine.
+        """
+        from AI.MinimaxEngine import INFINITY
+        
+        legacy = self._legacy_engine
+        legacy.nodes = 0
+        legacy.pruning = 0
+        best = -INFINITY if alpha is None else alpha
+        
+        scores = []
+        for move in moves:
+            game.move(move)
+            score = -legacy.alfabeta(game, depth - 1, -INFINITY, -best)
+            game.undo_move()
+            scores.append((move, score))
+            best = max(best, score)
+        
+        self.update_statistics(nodes_evaluated=legacy.nodes, pruning_count=legacy.pruning)
+        return scores
+    
+    def set_search_control(self, stop_flag, progress):
+        """Hand the stop flag and progress callback to the alpha-beta search."""
+        super().set_search_control(stop_flag, progress)
+        self._legacy_engine.stop_flag = stop_flag
+        self._legacy_engine.progress = progress
+    
     def evaluate_position(self, game) -> float:
         """
         Evaluate position using configured evaluator.
@@ -10,12 +10,27 @@ Architecture: Strategy Pattern + Dependency Injection
 
 import sys
 import os
+import copy
+import time
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from Players.base.player import Player
 from AI.base.engine import Engine
+from AI.base.search_handle import SearchLimits
+from AI.features.iterative_deepening_decorator import IterativeDeepeningDecorator, supports_time_control
 from typing import Optional
 
+# UI frame interval while the engine searches in the background (60 FPS)
+FRAME_SECONDS = 1 / 60
+
+# A timed ponder search stops by itself after this many times the move budget
+PONDER_TIME_FACTOR = 4
+
+
+def position_key(game):
+    """Board and side to move, to recognize a pondered position"""
+    return game.export_str(), game.get_turn()
+
 
 class AIPlayer(Player):
     """
@@ -44,6 +59,12 @@ class AIPlayer(Player):
             .with_parallel_search(threads=8)
             .build())
         player = AIPlayer(engine, depth=9, name="Grandmaster")
+        
+        # Time control instead of fixed depth (iterative deepening)
+        player = AIPlayer(engine, time_ms=2000)
+        
+        # Keep searching on the opponent's time
+        player = AIPlayer(engine, time_ms=2000, ponder=True)
     """
     
     PLAYER_METADATA = {
@@ -60,11 +81,21 @@ class AIPlayer(Player):
                 'max': 12,
                 'default': 6,
                 'description': 'Search depth (higher = stronger but slower)'
+            },
+            {
+                'name': 'time_ms',
+                'display_name': 'Time per Move (ms)',
+                'type': 'int',
+                'min': 0,
+                'max': 600000,
+                'default': 0,
+                'description': 'Time budget per move; 0 = fixed depth search'
             }
         ]
     }
     
-    def __init__(self, engine: Engine, depth: int = 6, name: Optional[str] = None):
+    def __init__(self, engine: Engine, depth: Optional[int] = None, name: Optional[str] = None,
+                 time_ms: Optional[int] = None, ponder: bool = False):
         """
         Create AI player with injected engine.
         
@@ -72,12 +103,24 @@ class AIPlayer(Player):
         
         Args:
             engine: Game engine (ANY Engine implementation)
-            depth: Search depth
+            depth: Search depth (default 6); with time_ms, the maximum
+                   depth (default: no limit)
             name: Optional custom name (defaults to engine name + depth)
+            time_ms: Optional time budget per move in milliseconds
+                     (iterative deepening instead of a fixed depth)
+            ponder: Search on the opponent's time (see start_pondering)
         """
+        time_ms = time_ms or None
+        if depth is None and time_ms is None:
+            depth = 6
+        
+        # Engines without native time control get iterative deepening
+        if time_ms is not None and not supports_time_control(engine):
+            engine = IterativeDeepeningDecorator(engine)
+        
         # Use custom name or generate from engine
         if name is None:
-            name = f"{engine.get_name()}-{depth}"
+            name = f"{engine.get_name()}-{time_ms}ms" if time_ms else f"{engine.get_name()}-{depth}"
         
         super().__init__(name)
         
@@ -85,31 +128,132 @@ class AIPlayer(Player):
         self.engine = engine
         self.depth = depth
         self.deep = depth  # Backward compatibility
+        self.time_ms = time_ms
+        
+        # Pondering: the running ponder search, the position it searches
+        # for us (None = the opponent's position, all replies) and the
+        # number of correctly / wrongly predicted replies
+        self.ponder = ponder
+        self._ponder_handle = None
+        self._ponder_key = None
+        self.ponder_hits = 0
+        self.ponder_misses = 0
     
     def get_move(self, game, move_list, control):
         """
         Get best move from injected engine.
         
+        The engine searches in a background thread while this loop keeps
+        handling the board control's events at 60 FPS (redraw on resize,
+        pause, quit). A pause or quit request stops the search at once.
+        
+        If the position is the one pondered on (ponder hit), the ponder
+        search goes on with the move's budget; otherwise it is stopped
+        and a new search started.
+        
         Args:
             game: Game state
             move_list: Valid moves
-            control: Board control
+            control: Board control (None = just wait for the search)
         
         Returns:
-            Move: Best move from engine
+            Move: Best move from engine, or None if the search was
+                  interrupted by a pause or quit request
         """
         if not move_list:
             return None
         
         # Delegate to injected engine
-        move = self.engine.get_best_move(
-            game,
-            depth=self.depth,
-            player_name=self.name
-        )
+        handle = self._take_ponder_search(game)
+        deadline = None
+        if handle is None:
+            handle = self.engine.start_search(game, SearchLimits(self.depth, self.time_ms),
+                                              player_name=self.name)
+        elif self.time_ms:
+            deadline = time.perf_counter() + self.time_ms / 1000.0
         
+        move = self._wait_for(handle, control, deadline)
+        if move is not None and self.ponder:
+            self.start_pondering(game, move)
         return move
     
+    def _wait_for(self, handle, control, deadline=None):
+        """
+        Result of a running search, handling the control's events
+        meanwhile; the search is stopped at the deadline (perf_counter
+        time, if any). None if a pause or quit request stopped it.
+        """
+        if control is None or not hasattr(control, 'check_events'):
+            if deadline is not None and not handle.wait(max(0.0, deadline - time.perf_counter())):
+                handle.stop()
+            return handle.result()
+        
+        while not handle.wait(FRAME_SECONDS):
+            control.check_events()
+            if control.should_exit or control.should_pause:
+                handle.stop()
+                handle.wait()
+                return None
+            if deadline is not None and time.perf_counter() >= deadline:
+                handle.stop()
+        
+        return handle.result()
+    
+    def start_pondering(self, game, move):
+        """
+        Search on the opponent's time after playing `move` in `game`.
+        
+        The engine's predicted reply (see Engine.predict_reply) is
+        played too and our next position searched with this player's
+        limits; a timed search runs at most PONDER_TIME_FACTOR times the
+        budget. Without a prediction the opponent's position is searched
+        instead, filling the transposition table for all replies.
+        
+        Args:
+            game: Game state before `move` (not modified)
+            move: Our move
+        """
+        self.stop_pondering()
+        position = copy.deepcopy(game)
+        position.move(move)
+        if position.is_finish():
+            return
+        
+        key = None
+        if not position.get_move_list():
+            position.pass_turn()
+            key = position_key(position)
+        else:
+            reply = self.engine.predict_reply(position)
+            if reply is not None:
+                position.move(reply)
+                key = position_key(position)
+        
+        time_ms = self.time_ms * PONDER_TIME_FACTOR if self.time_ms else None
+        self._ponder_handle = self.engine.start_search(position, SearchLimits(self.depth, time_ms),
+                                                       player_name=f"{self.name} (pondering)")
+        self._ponder_key = key
+    
+    def stop_pondering(self):
+        """Stop the ponder search, if any, and wait for it to end."""
+        if self._ponder_handle is not None:
+            self._ponder_handle.stop()
+            self._ponder_handle.wait()
+            self._ponder_handle = None
+    
+    def _take_ponder_search(self, game):
+        """The ponder search if it searches this position (ponder hit), else None (stopped)"""
+        handle = self._ponder_handle
+        if handle is None:
+            return None
+        if self._ponder_key is not None and self._ponder_key == position_key(game):
+            self._ponder_handle = None
+            self.ponder_hits += 1
+            return handle
+        self.stop_pondering()
+        self.ponder_misses += 1
+        return None
+    
     def get_engine(self) -> Engine:
         """
         Get the injected engine.
@@ -137,6 +281,11 @@ class AIPlayer(Player):
         """
         return self.engine.get_statistics()
     
+    def close(self):
+        """Stop pondering and release the engine's external resources (e.g. its worker pool lease)."""
+        self.stop_pondering()
+        self.engine.close()
+    
     def set_depth(self, depth: int):
         """
         Change search depth.
@@ -147,6 +296,22 @@ class AIPlayer(Player):
         self.depth = depth
         self.deep = depth
     
+    def set_time_ms(self, time_ms: Optional[int]):
+        """
+        Change time budget per move (None or 0 = fixed depth).
+        
+        Args:
+            time_ms: New time budget in milliseconds
+        """
+        self.time_ms = time_ms or None
+        if self.time_ms and not supports_time_control(self.engine):
+            self.engine = IterativeDeepeningDecorator(self.engine)
+        if not self.time_ms and self.depth is None:
+            self.set_depth(6)
+    
     def __repr__(self):
+        if self.time_ms:
+            return (f"AIPlayer(engine={self.engine}, depth={self.depth}, "
+                    f"time_ms={self.time_ms}, name='{self.name}')")
         return f"AIPlayer(engine={self.engine}, depth={self.depth}, name='{self.name}')"
 
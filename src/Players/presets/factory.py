@@ -16,7 +16,9 @@ import AI.implementations.standard.greedy_engine
 import AI.implementations.standard.heuristic_engine
 import AI.implementations.random.random_engine
 import AI.implementations.bitboard.bitboard_engine
+import AI.implementations.bitboard.mtdf_engine
 import AI.implementations.grandmaster.grandmaster_engine
+import AI.implementations.parallel.ybwc_engine
 
 
 class PresetFactory:
@@ -32,6 +34,12 @@ class PresetFactory:
         # With custom depth
         player = PresetFactory.create('Grandmaster', depth=12)
         
+        # With time control (iterative deepening, 2 seconds per move)
+        player = PresetFactory.create('Apocalypse', time_ms=2000)
+        
+        # Searching on the opponent's time as well
+        player = PresetFactory.create('Apocalypse', time_ms=2000, ponder=True)
+        
         # With all parameters
         player = PresetFactory.create('Ultimate AI', depth=10, threads=8)
     """
@@ -43,7 +51,11 @@ class PresetFactory:
         
         Args:
             preset_name: Name of the preset (e.g., 'Grandmaster')
-            **kwargs: Override default parameters (e.g., depth=10)
+            **kwargs: Override default parameters (e.g., depth=10,
+                      time_ms=2000 for a time budget instead of a depth,
+                      ponder=True to search on the opponent's time,
+                      selectivity=None to turn Multi-ProbCut off,
+                      reductions=None to turn late move reductions off)
         
         Returns:
             Configured AIPlayer instance
@@ -64,6 +76,9 @@ class PresetFactory:
         # Extract configuration
         engine_type = preset['engine_type']
         depth = kwargs.get('depth', preset.get('default_depth', 5))
+        time_ms = kwargs.get('time_ms', preset.get('default_time_ms')) or None
+        if time_ms and 'depth' not in kwargs:
+            depth = None  # Time control replaces the default depth
         name = kwargs.get('name', preset['name'])
         features = preset.get('features', [])
         engine_config = preset.get('engine_config', {})
@@ -83,7 +98,9 @@ class PresetFactory:
         return AIPlayer(
             engine=engine,
             depth=depth,
-            name=name
+            name=name,
+            time_ms=time_ms,
+            ponder=kwargs.get('ponder', False)
         )
     
     @staticmethod
@@ -143,6 +160,23 @@ class PresetFactory:
         if config.get('transposition_table_mb'):
             builder.with_transposition_table(size_mb=config['transposition_table_mb'])
         
+        selectivity = kwargs.get('selectivity', config.get('selectivity'))
+        if selectivity is not None:
+            builder.with_probcut(selectivity)
+        
+        reductions = kwargs.get('reductions', config.get('reductions'))
+        if reductions is not None:
+            builder.with_late_move_reductions(reductions)
+        
+        if config.get('endgame_solver'):
+            builder.with_endgame_solver(config.get('endgame_empties', 12),
+                                        wld_trigger=config.get('wld_empties'),
+                                        workers=kwargs.get('threads',
+                                                           config.get('parallel_threads', 1)))
+        
+        if config.get('iterative_deepening'):
+            builder.with_iterative_deepening()
+        
         return builder.build()
     
     @staticmethod
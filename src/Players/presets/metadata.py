@@ -196,7 +196,7 @@ PLAYER_PRESETS = {
     
     'Quantum Mind': {
         'engine_type': 'bitboard',
-        'default_depth': 9,
+        'default_depth': 10,
         'name': 'Quantum Mind',
         'description': '🌌 Explores infinite possibilities - Thinks in parallel dimensions. Calculates 16 futures simultaneously!',
         'difficulty': 'expert',
@@ -204,20 +204,23 @@ PLAYER_PRESETS = {
         'strength': 'master',
         'enabled': True,
         'icon': '🌌',
-        'features': ['bitboard', 'parallel', 'transposition_table', 'move_ordering'],
+        'features': ['bitboard', 'parallel', 'transposition_table', 'move_ordering',
+                     'late_move_reductions'],
         'play_style': 'analytical',
         'specialty': 'Multi-threaded deep search, impossible calculations',
         'engine_config': {
             'use_bitboard': True,
             'parallel_threads': 16,
             'transposition_table_mb': 256,
-            'move_ordering': True
+            'move_ordering': True,
+            'selectivity': 1.5,
+            'reductions': 'standard'
         },
         'parameters': [
             {
                 'name': 'depth',
                 'type': 'int',
-                'default': 9,
+                'default': 10,
                 'min': 5,
                 'max': 12,
                 'description': 'Quantum depth (dimensions explored)'
@@ -255,11 +258,12 @@ PLAYER_PRESETS = {
             'transposition_table',
             'advanced_eval',
             'move_ordering',
-            'killer_moves',
+            'history_heuristic',
             'endgame_solver',
             'aspiration_windows',
             'iterative_deepening',
-            'null_move_pruning'
+            'null_move_pruning',
+            'late_move_reductions'
         ],
         'play_style': 'ANNIHILATION',
         'specialty': 'Everything. Everywhere. All at once. Total domination.',
@@ -271,11 +275,15 @@ PLAYER_PRESETS = {
             'transposition_table_mb': 1024,
             'advanced_evaluator': True,
             'move_ordering': True,
-            'killer_moves': True,
+            'history_heuristic': True,
             'endgame_solver': True,
+            'endgame_empties': 14,
+            'wld_empties': 16,
             'aspiration_windows': True,
             'iterative_deepening': True,
-            'null_move_pruning': True
+            'null_move_pruning': True,
+            'selectivity': 1.8,
+            'reductions': 'standard'
         },
         'parameters': [
             {
@@ -286,6 +294,14 @@ PLAYER_PRESETS = {
                 'max': 15,
                 'description': '⚠️  WARNING: Depth >12 may take MINUTES per move!'
             },
+            {
+                'name': 'time_ms',
+                'type': 'int',
+                'default': 0,
+                'min': 0,
+                'max': 600000,
+                'description': 'Time per move in ms (iterative deepening); 0 = use depth'
+            },
             {
                 'name': 'threads',
                 'type': 'int',
@@ -7,6 +7,89 @@
 #------------------------------------------------------------------------
 
 from Reversi.Game import Move
+from Reversi.BitboardTables import (
+    ZOBRIST_BLACK, ZOBRIST_WHITE, ZOBRIST_WHITE_TO_MOVE,
+    ZOBRIST_FLIP_BYTES, zobrist_board, zobrist_key,
+    FLIP_RAYS_UP, FLIP_RAYS_DOWN, NOT_EDGE_FILES
+)
+
+FULL_BOARD = 0xFFFFFFFFFFFFFFFF
+
+
+def popcount(board):
+    """Count number of set bits (population count)"""
+    return bin(board).count('1')
+
+
+def get_flips(square, player, opponent):
+    """
+    Discs flipped by `player` playing on `square` (0 if the move is illegal).
+    
+    Walks the precomputed rays of the square: along each ray the nearest
+    non-opponent square is found with a single bit scan, and the run of
+    opponent discs before it flips if that square holds a player disc.
+    """
+    flips = 0
+    
+    for ray in FLIP_RAYS_UP[square]:
+        blockers = ray & ~opponent
+        # Nearest blocker is the lowest bit
+        first = blockers & -blockers
+        if first & player:
+            flips |= ray & (first - 1)
+    
+    for ray in FLIP_RAYS_DOWN[square]:
+        blockers = ray & ~opponent
+        if blockers:
+            # Nearest blocker is the highest bit
+            first = 1 << (blockers.bit_length() - 1)
+            if first & player:
+                flips |= ray & -(first << 1)
+    
+    return flips
+
+
+def squares(board):
+    """Yield the square index (0-63) of every set bit, lowest first"""
+    while board:
+        low = board & -board
+        yield low.bit_length() - 1
+        board ^= low
+
+
+def get_moves(player, opponent):
+    """
+    Bitboard of legal moves for `player`.
+    
+    Parallel-prefix (Kogge-Stone) fill: each direction needs three
+    propagation steps instead of a six-step loop.
+    """
+    empty = ~(player | opponent) & FULL_BOARD
+    inner = opponent & NOT_EDGE_FILES  # no wrap across the A/H files
+    moves = 0
+    
+    # Horizontal (1), diagonals (7, 9) and vertical (8)
+    for shift, mask in ((1, inner), (7, inner), (9, inner), (8, opponent)):
+        double = shift << 1
+        
+        # Towards higher squares
+        flood = mask & (player << shift)
+        flood |= mask & (flood << shift)
+        pairs = mask & (mask << shift)
+        flood |= pairs & (flood << double)
+        flood |= pairs & (flood << double)
+        moves |= flood << shift
+        
+        # Towards lower squares
+        flood = mask & (player >> shift)
+        flood |= mask & (flood >> shift)
+        pairs = mask & (mask >> shift)
+        flood |= pairs & (flood >> double)
+        flood |= pairs & (flood >> double)
+        moves |= flood >> shift
+    
+    return moves & empty
+
 
 class BitboardGame:
     """
@@ -18,22 +101,6 @@ class BitboardGame:
     - O(1) copy and undo operations
     """
     
-    # Pre-computed masks and shift tables
-    # Directions: N, NE, E, SE, S, SW, W, NW
-    # NOTE: Masks are applied BEFORE shift to prevent edge wrapping
-    # For left shifts (+): mask out bits that would go beyond board (right/bottom edges)
-    # For right shifts (-): mask out bits that would come from beyond board (left/top edges)
-    DIRECTIONS = [
-        (-8, 0xFFFFFFFFFFFFFF00),  # North: mask row 1 (bits 0-7)
-        (-7, 0xFEFEFEFEFEFEFE00),  # NE: mask row 1 AND col H
-        (1,  0x7F7F7F7F7F7F7F7F),  # East: mask col H
-        (9,  0x007F7F7F7F7F7F7F),  # SE: mask row 8 AND col H  
-        (8,  0x00FFFFFFFFFFFFFF),  # South: mask row 8 (bits 56-63)
-        (7,  0x00FEFEFEFEFEFEFE),  # SW: mask row 8 AND col A
-        (-1, 0xFEFEFEFEFEFEFEFE),  # West: mask col A
-        (-9, 0xFEFEFEFEFEFEFE00),  # NW: mask row 1 AND col A
-    ]
-    
     @classmethod
     def create_empty(cls):
         """Create an empty BitboardGame without initializing to starting position"""
@@ -50,7 +117,13 @@ class BitboardGame:
         instance.white_cnt = 0
         instance.limit = 9
         instance.corner = ((1, 2), (8, 7))
-        instance.matrix = [['.' for _ in range(10)] for _ in range(10)]
+        instance.zobrist = 0
+        instance._generation = 0
+        instance._matrix_cache = None
+        instance._matrix_generation = -1
+        instance._mobility_generation = -1
+        instance._black_moves = None
+        instance._white_moves = None
         return instance
     
     def __init__(self):
@@ -81,37 +154,53 @@ class BitboardGame:
         self.limit = self.size + 1
         self.corner = ((1, 2), (self.size, self.size - 1))
         
-        # Create virtual matrix for evaluator compatibility
-        self._create_virtual_matrix()
+        # Zobrist key, maintained incrementally by move/undo/pass
+        self.zobrist = zobrist_key(self.black, self.white, self.turn)
+        
+        # Derived data is cached per position: every state change bumps
+        # _generation, and the virtual matrix (for evaluator compatibility)
+        # and the move bitboards of both colors are only recomputed when
+        # read after such a change.
+        self._generation = 0
+        self._matrix_cache = None
+        self._matrix_generation = -1
+        self._mobility_generation = -1
+        self._black_moves = None
+        self._white_moves = None
+    
+    @property
+    def matrix(self):
+        """Matrix representation of the board (for evaluator compatibility).
+        
+        Built on first access after a state change and cached until the
+        next move/undo/pass, so pure-bitboard search never allocates it.
+        """
+        if self._matrix_generation != self._generation:
+            self._create_virtual_matrix()
+            self._matrix_generation = self._generation
+        return self._matrix_cache
     
     def _create_virtual_matrix(self):
         """Create matrix representation from bitboards (for evaluator compatibility)"""
         # Create 10x10 matrix with borders (like original Game)
-        self.matrix = [['.' for _ in range(10)] for _ in range(10)]
+        matrix = [['.' for _ in range(10)] for _ in range(10)]
         
         # Fill borders with '.'
         # Fill actual board from bitboards
+        black = self.black
+        white = self.white
         for bit in range(64):
-            row = bit // 8
-            col = bit % 8
             mask = 1 << bit
             
             # Matrix uses 1-indexed with borders, so offset by 1
-            if self.black & mask:
-                self.matrix[row + 1][col + 1] = 'B'
-            elif self.white & mask:
-                self.matrix[row + 1][col + 1] = 'W'
-            else:
-                self.matrix[row + 1][col + 1] = '.'
+            if black & mask:
+                matrix[(bit >> 3) + 1][(bit & 7) + 1] = 'B'
+            elif white & mask:
+                matrix[(bit >> 3) + 1][(bit & 7) + 1] = 'W'
+        
+        self._matrix_cache = matrix
     
-    @staticmethod
-    def _count_bits(n):
-        """Count number of set bits (population count)"""
-        count = 0
-        while n:
-            count += 1
-            n &= n - 1  # Clear lowest bit
-        return count
+    _count_bits = staticmethod(popcount)
     
     @staticmethod
     def _coord_to_bit(x, y):
@@ -143,65 +232,40 @@ class BitboardGame:
         else:
             return self.white, self.black
     
-    def _shift(self, board, direction, mask):
-        """Shift bitboard in a direction with edge wrapping prevention
-        
-        IMPORTANT: Mask must be applied BEFORE shift to prevent edge wrap.
-        """
-        shift_amount, edge_mask = direction
-        if shift_amount > 0:
-            return (board & edge_mask) << shift_amount
+    def _color_moves(self, color):
+        """Move bitboard of `color`, generated at most once per position"""
+        if self._mobility_generation != self._generation:
+            self._mobility_generation = self._generation
+            self._black_moves = None
+            self._white_moves = None
+        
+        if color == 'B':
+            moves = self._black_moves
+            if moves is None:
+                moves = self._black_moves = get_moves(self.black, self.white)
         else:
-            return (board & edge_mask) >> -shift_amount
+            moves = self._white_moves
+            if moves is None:
+                moves = self._white_moves = get_moves(self.white, self.black)
+        return moves
     
     def get_valid_moves(self):
-        """
-        Generate all valid moves using shift and mask algorithm.
-        The mask must be applied to the source BEFORE shifting to prevent wrap-around.
-        """
-        player, opponent = self._get_player_boards()
-        empty = ~(player | opponent) & 0xFFFFFFFFFFFFFFFF
-        
-        valid_moves = 0
-        
-        # For each of the 8 directions
-        for shift_amount, edge_mask in self.DIRECTIONS:
-            # Find opponent pieces next to our pieces in this direction
-            # IMPORTANT: Apply mask BEFORE shift to prevent edge wrap
-            if shift_amount > 0:
-                flip_candidates = opponent & ((player & edge_mask) << shift_amount)
-            else:
-                flip_candidates = opponent & ((player & edge_mask) >> -shift_amount)
-            
-            # Propagate through consecutive opponent pieces
-            for _ in range(5):  # Max 6 opponents in a row
-                if shift_amount > 0:
-                    flip_candidates |= opponent & ((flip_candidates & edge_mask) << shift_amount)
-                else:
-                    flip_candidates |= opponent & ((flip_candidates & edge_mask) >> -shift_amount)
-            
-            # Valid moves are empty squares one step beyond the flip line
-            if shift_amount > 0:
-                valid_moves |= empty & ((flip_candidates & edge_mask) << shift_amount)
-            else:
-                valid_moves |= empty & ((flip_candidates & edge_mask) >> -shift_amount)
-        
-        return valid_moves
+        """Generate all valid moves as a bitboard (memoized per position)"""
+        return self._color_moves(self.turn)
+    
+    def get_opponent_moves(self):
+        """Move bitboard of the side not to move (memoized per position)"""
+        return self._color_moves('W' if self.turn == 'B' else 'B')
+    
+    def get_mobility(self):
+        """(player_moves, opponent_moves) bitboards for the side to move"""
+        if self.turn == 'B':
+            return self._color_moves('B'), self._color_moves('W')
+        return self._color_moves('W'), self._color_moves('B')
     
     def get_move_list(self):
         """Convert bitboard of valid moves to Move objects"""
-        valid_moves = self.get_valid_moves()
-        moves = []
-        
-        bit = 0
-        while valid_moves:
-            if valid_moves & 1:
-                x, y = self._bit_to_coord(bit)
-                moves.append(Move(x, y))
-            valid_moves >>= 1
-            bit += 1
-        
-        return moves
+        return [Move((bit & 7) + 1, (bit >> 3) + 1) for bit in squares(self.get_valid_moves())]
     
     def valid_move(self, move):
         """Check if a move is valid"""
@@ -215,63 +279,154 @@ class BitboardGame:
         player, opponent = self._get_player_boards()
         
         # Save state for undo
-        self.move_stack.append((self.black, self.white, self.turn, self.history))
+        self.move_stack.append((self.black, self.white, self.turn, self.history, self.zobrist))
         
-        # Calculate flips
-        flips = 0
+        # Calculate flips (precomputed ray tables)
+        flips = get_flips(bit, player, opponent)
         move_bit = 1 << bit
-        
-        for direction in self.DIRECTIONS:
-            flip_line = 0
-            test = self._shift(move_bit, direction, direction[1])
-            
-            # Scan through opponent pieces
-            while test and (test & opponent):
-                flip_line |= test
-                test = self._shift(test, direction, direction[1])
-            
-            # Valid if ended on player piece
-            if test & player:
-                flips |= flip_line
+        flipped = popcount(flips)
         
         # Apply move and flips
+        # Zobrist: placed disc + flipped discs (both colors) + side to move
+        zobrist = self.zobrist ^ zobrist_board(flips, ZOBRIST_FLIP_BYTES) ^ ZOBRIST_WHITE_TO_MOVE
         if self.turn == 'B':
             self.black |= move_bit | flips
             self.white &= ~flips
             self.history += str(move).upper()
+            self.zobrist = zobrist ^ ZOBRIST_BLACK[bit]
         else:
             self.white |= move_bit | flips
             self.black &= ~flips
             self.history += str(move).lower()
+            self.zobrist = zobrist ^ ZOBRIST_WHITE[bit]
         
         # Update counts
-        self.black_cnt = self._count_bits(self.black)
-        self.white_cnt = self._count_bits(self.white)
+        if self.turn == 'B':
+            self.black_cnt += flipped + 1
+            self.white_cnt -= flipped
+        else:
+            self.white_cnt += flipped + 1
+            self.black_cnt -= flipped
         
         self.turn_cnt += 1
         self.switch_player()
         
-        # Update virtual matrix for evaluator compatibility
-        self._create_virtual_matrix()
+        # Invalidate virtual matrix
+        self._generation += 1
     
     def undo_move(self):
         """Undo last move - O(1) operation!"""
         if not self.move_stack:
             return
         
-        self.black, self.white, self.turn, self.history = self.move_stack.pop()
-        self.black_cnt = self._count_bits(self.black)
-        self.white_cnt = self._count_bits(self.white)
+        self.black, self.white, self.turn, self.history, self.zobrist = self.move_stack.pop()
+        self.black_cnt = popcount(self.black)
+        self.white_cnt = popcount(self.white)
         self.turn_cnt -= 1
         
-        # Update virtual matrix
-        self._create_virtual_matrix()
+        # Invalidate virtual matrix
+        self._generation += 1
     
     def pass_turn(self):
         """Pass turn when no moves available"""
-        self.move_stack.append((self.black, self.white, self.turn, self.history))
+        self.move_stack.append((self.black, self.white, self.turn, self.history, self.zobrist))
         self.switch_player()
         self.turn_cnt += 1
+        self.zobrist ^= ZOBRIST_WHITE_TO_MOVE
+        self._generation += 1
+    
+    #--------------------------------------------------------------------
+    #    Low-level search API
+    #
+    #    Integer squares (0-63) instead of Move objects, no history string
+    #    and no move_stack snapshot: the caller keeps (square, flips) and
+    #    hands them back to unmake(). Move objects are only needed at the
+    #    engine boundary (see square_to_move / move_to_square).
+    #--------------------------------------------------------------------
+    
+    @staticmethod
+    def square_to_move(square):
+        """Convert square index (0-63) to a Move"""
+        return Move((square & 7) + 1, (square >> 3) + 1)
+    
+    @staticmethod
+    def move_to_square(move):
+        """Convert a Move to its square index (0-63)"""
+        return (move.y - 1) * 8 + (move.x - 1)
+    
+    def legal_squares(self):
+        """Iterate legal moves as square indices (pops the lowest set bit)"""
+        return squares(self.get_valid_moves())
+    
+    def make(self, square):
+        """
+        Play `square` for the side to move and return the flip mask.
+        
+        Undo with unmake(square, flips). Does not touch history or
+        move_stack.
+        """
+        bit = 1 << square
+        if self.turn == 'B':
+            flips = get_flips(square, self.black, self.white)
+            self.black |= bit | flips
+            self.white ^= flips
+            flipped = popcount(flips)
+            self.black_cnt += flipped + 1
+            self.white_cnt -= flipped
+            self.zobrist ^= (zobrist_board(flips, ZOBRIST_FLIP_BYTES) ^
+                             ZOBRIST_BLACK[square] ^ ZOBRIST_WHITE_TO_MOVE)
+            self.turn = 'W'
+        else:
+            flips = get_flips(square, self.white, self.black)
+            self.white |= bit | flips
+            self.black ^= flips
+            flipped = popcount(flips)
+            self.white_cnt += flipped + 1
+            self.black_cnt -= flipped
+            self.zobrist ^= (zobrist_board(flips, ZOBRIST_FLIP_BYTES) ^
+                             ZOBRIST_WHITE[square] ^ ZOBRIST_WHITE_TO_MOVE)
+            self.turn = 'B'
+        self.turn_cnt += 1
+        self._generation += 1
+        return flips
+    
+    def unmake(self, square, flips):
+        """Take back make(square) given the flip mask it returned"""
+        bit = 1 << square
+        flipped = popcount(flips)
+        if self.turn == 'W':
+            # Black made the move
+            self.black ^= bit | flips
+            self.white |= flips
+            self.black_cnt -= flipped + 1
+            self.white_cnt += flipped
+            self.zobrist ^= (zobrist_board(flips, ZOBRIST_FLIP_BYTES) ^
+                             ZOBRIST_BLACK[square] ^ ZOBRIST_WHITE_TO_MOVE)
+            self.turn = 'B'
+        else:
+            self.white ^= bit | flips
+            self.black |= flips
+            self.white_cnt -= flipped + 1
+            self.black_cnt += flipped
+            self.zobrist ^= (zobrist_board(flips, ZOBRIST_FLIP_BYTES) ^
+                             ZOBRIST_WHITE[square] ^ ZOBRIST_WHITE_TO_MOVE)
+            self.turn = 'W'
+        self.turn_cnt -= 1
+        self._generation += 1
+    
+    def make_pass(self):
+        """Pass for the side to move (undo with unmake_pass)"""
+        self.turn = 'W' if self.turn == 'B' else 'B'
+        self.zobrist ^= ZOBRIST_WHITE_TO_MOVE
+        self.turn_cnt += 1
+        self._generation += 1
+    
+    def unmake_pass(self):
+        """Take back make_pass()"""
+        self.turn = 'W' if self.turn == 'B' else 'B'
+        self.zobrist ^= ZOBRIST_WHITE_TO_MOVE
+        self.turn_cnt -= 1
+        self._generation += 1
     
     def is_finish(self):
         """Check if game is over"""
@@ -280,15 +435,7 @@ class BitboardGame:
             return True
         
         # Or if neither player has moves
-        player, opponent = self._get_player_boards()
-        if self.get_valid_moves() == 0:
-            # Switch and check opponent
-            self.switch_player()
-            opp_moves = self.get_valid_moves()
-            self.switch_player()
-            return opp_moves == 0
-        
-        return False
+        return not self.get_valid_moves() and not self.get_opponent_moves()
     
     def check_win(self):
         """Check if current player has won"""
@@ -366,9 +513,8 @@ class BitboardGame:
         print()
     
     def get_zobrist_hash(self):
-        """Get Zobrist hash for transposition table (to be implemented)"""
-        # For now, use simple hash
-        return hash((self.black, self.white, self.turn))
+        """Get 64-bit Zobrist key of the position - O(1), kept up to date by move/undo/pass"""
+        return self.zobrist
     
     def import_game_state(self, game):
         """
@@ -404,8 +550,29 @@ class BitboardGame:
         self.black_cnt = self._count_bits(self.black)
         self.white_cnt = self._count_bits(self.white)
         
-        # Update virtual matrix
-        self._create_virtual_matrix()
+        # Recompute Zobrist key from scratch
+        self.zobrist = zobrist_key(self.black, self.white, self.turn)
+        
+        # Invalidate virtual matrix
+        self._generation += 1
+    
+    def set_position(self, black, white, turn):
+        """
+        Load a bare position (used to reuse one game object per worker).
+        
+        Move history is dropped; the turn counter is derived from the
+        number of discs.
+        """
+        self.black = black
+        self.white = white
+        self.turn = turn
+        self.black_cnt = popcount(black)
+        self.white_cnt = popcount(white)
+        self.turn_cnt = self.black_cnt + self.white_cnt - 4
+        self.history = ""
+        self.move_stack = []
+        self.zobrist = zobrist_key(black, white, turn)
+        self._generation += 1
     
     def clone(self):
         """Create a copy of the game state - O(1) with bitboards!"""
@@ -417,6 +584,7 @@ class BitboardGame:
         new_game.black_cnt = self.black_cnt
         new_game.white_cnt = self.white_cnt
         new_game.history = self.history
+        new_game.zobrist = self.zobrist
         new_game.move_stack = self.move_stack.copy()
         return new_game
     
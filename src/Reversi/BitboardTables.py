@@ -0,0 +1,159 @@
+#------------------------------------------------------------------------
+#    Copyright (C) 2025 Luca Amore <luca.amore at gmail.com>
+#    Precomputed Bitboard Tables
+#
+#    Lookup tables shared by BitboardGame and the bitboard engines.
+#    Generated once at import with a fixed seed, so every process
+#    (and every pool worker) builds bit-identical tables.
+#------------------------------------------------------------------------
+
+import random
+
+#------------------------------------------------------------------------
+#    Zobrist hashing
+#------------------------------------------------------------------------
+
+_rng = random.Random(42)  # Deterministic, independent of the global RNG
+
+# Random 64-bit key per (color, square)
+ZOBRIST_BLACK = tuple(_rng.getrandbits(64) for _ in range(64))
+ZOBRIST_WHITE = tuple(_rng.getrandbits(64) for _ in range(64))
+
+# XORed into the key when White is to move
+ZOBRIST_WHITE_TO_MOVE = _rng.getrandbits(64)
+
+del _rng
+
+
+def _byte_tables(square_keys):
+    """
+    Build 8 tables of 256 entries: table[i][b] is the XOR of the keys of
+    the squares set in byte value b at byte position i of a bitboard.
+    """
+    tables = []
+    for byte_index in range(8):
+        base = byte_index * 8
+        table = [0] * 256
+        for value in range(1, 256):
+            low = value & -value
+            # Extend the entry of (value without its lowest bit)
+            table[value] = table[value ^ low] ^ square_keys[base + low.bit_length() - 1]
+        tables.append(tuple(table))
+    return tuple(tables)
+
+
+# Per-byte tables: hash a whole bitboard with 8 lookups
+ZOBRIST_BLACK_BYTES = _byte_tables(ZOBRIST_BLACK)
+ZOBRIST_WHITE_BYTES = _byte_tables(ZOBRIST_WHITE)
+
+# A flipped disc changes color, toggling both its black and white keys
+ZOBRIST_FLIP_BYTES = _byte_tables(tuple(b ^ w for b, w in zip(ZOBRIST_BLACK, ZOBRIST_WHITE)))
+
+
+def zobrist_board(board, byte_tables):
+    """XOR of the keys of every square set in `board` (8 table lookups)"""
+    t0, t1, t2, t3, t4, t5, t6, t7 = byte_tables
+    return (t0[board & 0xFF] ^ t1[(board >> 8) & 0xFF] ^
+            t2[(board >> 16) & 0xFF] ^ t3[(board >> 24) & 0xFF] ^
+            t4[(board >> 32) & 0xFF] ^ t5[(board >> 40) & 0xFF] ^
+            t6[(board >> 48) & 0xFF] ^ t7[board >> 56])
+
+
+def zobrist_key(black, white, turn):
+    """Full Zobrist key of a position (used on import, incremental otherwise)"""
+    key = zobrist_board(black, ZOBRIST_BLACK_BYTES) ^ zobrist_board(white, ZOBRIST_WHITE_BYTES)
+    if turn == 'W':
+        key ^= ZOBRIST_WHITE_TO_MOVE
+    return key
+
+
+#------------------------------------------------------------------------
+#    Flip rays
+#------------------------------------------------------------------------
+
+# (d_col, d_row) for the 8 directions: N, NE, E, SE, S, SW, W, NW
+RAY_DIRECTIONS = ((0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+
+
+def _ray_mask(square, d_col, d_row):
+    """Mask of the squares from `square` (excluded) to the board edge"""
+    col, row = square & 7, square >> 3
+    mask = 0
+    col += d_col
+    row += d_row
+    while 0 <= col < 8 and 0 <= row < 8:
+        mask |= 1 << (row * 8 + col)
+        col += d_col
+        row += d_row
+    return mask
+
+
+# RAYS[square][direction]: all 8 rays of every square (empty rays included)
+RAYS = tuple(
+    tuple(_ray_mask(square, d_col, d_row) for d_col, d_row in RAY_DIRECTIONS)
+    for square in range(64)
+)
+
+# Rays that can hold a flip (2+ squares), split by walking direction.
+# Along an "up" ray square numbers grow, so the disc nearest to the
+# origin is the lowest set bit; along a "down" ray it is the highest.
+FLIP_RAYS_UP = tuple(
+    tuple(ray for ray, (d_col, d_row) in zip(RAYS[square], RAY_DIRECTIONS)
+          if d_row * 8 + d_col > 0 and ray & (ray - 1))
+    for square in range(64)
+)
+FLIP_RAYS_DOWN = tuple(
+    tuple(ray for ray, (d_col, d_row) in zip(RAYS[square], RAY_DIRECTIONS)
+          if d_row * 8 + d_col < 0 and ray & (ray - 1))
+    for square in range(64)
+)
+
+# Opponent masks that stop propagation from wrapping across the A/H files
+NOT_EDGE_FILES = 0x7E7E7E7E7E7E7E7E
+
+# Corners, used by move ordering and evaluation
+CORNER_MASK = 0x8100000000000081
+
+
+#------------------------------------------------------------------------
+#    Board regions (endgame solver)
+#------------------------------------------------------------------------
+
+FILE_A = 0x0101010101010101
+FILE_H = 0x8080808080808080
+RANK_1 = 0x00000000000000FF
+RANK_8 = 0xFF00000000000000
+EDGE_MASK = FILE_A | FILE_H | RANK_1 | RANK_8
+
+# Squares adjacent to each square (a move needs an adjacent opponent disc)
+NEIGHBORS = tuple(
+    sum(1 << (r * 8 + c)
+        for r in range(max(0, sq // 8 - 1), min(8, sq // 8 + 2))
+        for c in range(max(0, sq % 8 - 1), min(8, sq % 8 + 2))
+        if r * 8 + c != sq)
+    for sq in range(64)
+)
+
+# 4x4 quadrants: parity of the empty squares in each region drives
+# endgame move ordering (play into odd regions first)
+QUADRANT_MASKS = (0x000000000F0F0F0F, 0x00000000F0F0F0F0,
+                  0x0F0F0F0F00000000, 0xF0F0F0F000000000)
+
+
+def _line_masks(d_col, d_row):
+    """All maximal lines of the board along one direction"""
+    lines = []
+    for square in range(64):
+        col, row = square & 7, square >> 3
+        # Start only from squares whose predecessor is off the board
+        if 0 <= col - d_col < 8 and 0 <= row - d_row < 8:
+            continue
+        lines.append(RAYS[square][RAY_DIRECTIONS.index((d_col, d_row))] | (1 << square))
+    return tuple(lines)
+
+
+# Lines per direction: rows, columns, diagonals (a1-h8) and anti-diagonals (h1-a8)
+LINES_HORIZONTAL = _line_masks(1, 0)
+LINES_VERTICAL = _line_masks(0, 1)
+LINES_DIAGONAL = _line_masks(1, 1)
+LINES_ANTI_DIAGONAL = _line_masks(-1, 1)
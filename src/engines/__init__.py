@@ -15,7 +15,9 @@ from .factory.engine_builder import EngineBuilder
 try:
     from .implementations.standard.minimax_engine import MinimaxEngine
     from .implementations.bitboard.bitboard_engine import BitboardEngine
+    from .implementations.bitboard.mtdf_engine import MTDfEngine
     from .implementations.grandmaster.grandmaster_engine import GrandmasterEngine
+    from .implementations.parallel.ybwc_engine import YBWCEngine
     from .implementations.random.random_engine import RandomEngine
     from .implementations.standard.greedy_engine import GreedyEngine
     from .implementations.standard.heuristic_engine import HeuristicEngine
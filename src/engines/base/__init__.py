@@ -9,6 +9,7 @@ Architecture: Strategy Pattern + Dependency Injection
 
 from .engine import Engine
 from .engine_metadata import EngineMetadata
+from .search_handle import SearchHandle, SearchLimits
 
-__all__ = ['Engine', 'EngineMetadata']
+__all__ = ['Engine', 'EngineMetadata', 'SearchHandle', 'SearchLimits']
 
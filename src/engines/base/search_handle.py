@@ -0,0 +1,176 @@
+"""
+Background Search
+
+Runs an engine's search in a worker thread so that the caller (the UI
+loop) stays responsive: poll for the result, stop the search, follow
+its progress.
+
+Version: 3.2.0
+"""
+
+import copy
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Callable, Dict, Any
+
+
+@dataclass
+class SearchLimits:
+    """
+    Limits of one search.
+
+    Attributes:
+        depth: Search depth; with a budget, the maximum depth (None = no limit)
+        time_ms: Time budget in milliseconds (None = fixed depth)
+        node_limit: Node budget (None = no limit)
+    """
+
+    depth: Optional[int] = None
+    time_ms: Optional[int] = None
+    node_limit: Optional[int] = None
+
+    @classmethod
+    def of(cls, limits) -> 'SearchLimits':
+        """SearchLimits from a SearchLimits, a dict of its fields, a depth or None."""
+        if limits is None:
+            return cls()
+        if isinstance(limits, cls):
+            return limits
+        if isinstance(limits, int):
+            return cls(depth=limits)
+        return cls(**limits)
+
+    def budget_kwargs(self) -> Dict[str, Any]:
+        """get_best_move() keyword arguments of the budget."""
+        kwargs = {}
+        if self.time_ms:
+            kwargs['time_ms'] = self.time_ms
+        if self.node_limit:
+            kwargs['node_limit'] = self.node_limit
+        return kwargs
+
+
+class StopSignal:
+    """
+    Stop request of a background search, readable as `.value` like the
+    shared stop flags the bitboard engines already check mid-tree.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    @property
+    def value(self) -> bool:
+        return self._event.is_set()
+
+    def set(self):
+        self._event.set()
+
+
+class SearchHandle:
+    """
+    A search running in a worker thread (see Engine.start_search()).
+
+    The engine searches a copy of the game, so the caller may keep
+    using its own. stop() asks the engine to stop: engines that check
+    the stop flag (minimax, bitboard, grandmaster, YBWC, endgame
+    solver) abort mid-tree and return the best move found so far (None
+    if no move was completed); others finish their current search.
+
+    Example:
+        handle = engine.start_search(game, SearchLimits(depth=8))
+        while not handle.poll():
+            control.check_events()
+        move = handle.result()
+    """
+
+    def __init__(self, engine, game, limits=None,
+                 progress: Optional[Callable[[Dict[str, Any]], None]] = None, **kwargs):
+        """
+        Start searching.
+
+        Args:
+            engine: Engine to search with (one search at a time)
+            game: Position to search (copied)
+            limits: SearchLimits (or dict / depth, see SearchLimits.of)
+            progress: Optional callback, called from the worker thread
+                      with a dict (depth, move, value, nodes, elapsed_ms)
+                      whenever the engine reports progress
+            **kwargs: Further get_best_move() arguments (player_name, ...)
+        """
+        self.engine = engine
+        self.limits = SearchLimits.of(limits)
+        self.progress = progress
+        self.stop_signal = StopSignal()
+
+        self._game = copy.deepcopy(game)
+        self._kwargs = kwargs
+        self._move = None
+        self._error = None
+        self._done = threading.Event()
+        self._time_start = time.perf_counter()
+        self._time_end = None
+
+        self._thread = threading.Thread(target=self._run, name=f"search-{engine.get_name()}",
+                                        daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """Worker thread: the search, with the stop flag and progress attached"""
+        self.engine.set_search_control(self.stop_signal, self._report)
+        try:
+            self._move = self.engine.get_best_move(self._game, self.limits.depth,
+                                                   **self.limits.budget_kwargs(), **self._kwargs)
+        except BaseException as error:  # handed to the caller in result()
+            self._error = error
+        finally:
+            self.engine.set_search_control(None, None)
+            self._time_end = time.perf_counter()
+            self._done.set()
+
+    def _report(self, info: Dict[str, Any]):
+        """Engine progress, passed on with the elapsed time"""
+        if self.progress is not None:
+            self.progress(dict(info, elapsed_ms=self.elapsed_ms))
+
+    @property
+    def elapsed_ms(self) -> int:
+        """Search time so far (total time once done)"""
+        end = self._time_end if self._time_end is not None else time.perf_counter()
+        return int((end - self._time_start) * 1000)
+
+    @property
+    def stopped(self) -> bool:
+        """Whether stop() was called"""
+        return self.stop_signal.value
+
+    def poll(self) -> bool:
+        """Whether the search is done (never blocks)."""
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Wait up to timeout seconds (None = until done); returns poll()."""
+        return self._done.wait(timeout)
+
+    def result(self, timeout: Optional[float] = None):
+        """
+        The move found, waiting up to timeout seconds for it.
+
+        Raises:
+            TimeoutError: If the search is still running after timeout
+            Exception: Whatever the engine's search raised
+        """
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Search still running after {timeout}s")
+        if self._error is not None:
+            raise self._error
+        return self._move
+
+    def stop(self):
+        """Ask the engine to stop as soon as possible (does not wait)."""
+        self.stop_signal.set()
+
+    def __repr__(self):
+        state = 'done' if self.poll() else 'stopping' if self.stopped else 'running'
+        return f"SearchHandle(engine='{self.engine.get_name()}', {state}, {self.elapsed_ms} ms)"
@@ -11,6 +11,8 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from typing import Optional, Any, Dict
+from AI.ProbCut import PROBCUT_SELECTIVITY
+from AI.LateMoveReductions import LMR_SCHEDULE
 from engines.base.engine import Engine
 
 
@@ -57,6 +59,16 @@ class EngineBuilder:
         self._engine_type = 'grandmaster'
         return self
     
+    def use_ybwc(self):
+        """Use YBWC split-point parallel engine."""
+        self._engine_type = 'ybwc'
+        return self
+    
+    def use_mtdf(self):
+        """Use MTD(f) zero-window bitboard engine."""
+        self._engine_type = 'mtdf'
+        return self
+    
     def use_random(self):
         """Use random move engine."""
         self._engine_type = 'random'
@@ -126,6 +138,59 @@ class EngineBuilder:
         self._features.append(('parallel', {'threads': threads}))
         return self
     
+    def with_search_backend(self, backend: str = 'thread'):
+        """
+        Select the worker backend of parallel search and endgame solving.
+        
+        Threads share one transposition table and the precomputed
+        tables; they are used only where the GIL is disabled at runtime
+        (free-threaded CPython), processes otherwise.
+        
+        Args:
+            backend: 'thread' or 'process'
+        """
+        from AI.WorkerPool import BACKENDS
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown search backend '{backend}' (expected one of {BACKENDS})")
+        self._config['backend'] = backend
+        return self
+    
+    def with_probcut(self, selectivity: float = PROBCUT_SELECTIVITY):
+        """
+        Enable Multi-ProbCut selective search (bitboard engines).
+        
+        Nodes are cut when shallow searches predict the deep result
+        outside the window; the prediction comes from the calibration
+        of the engine's evaluation (AI/probcut.json).
+        
+        Args:
+            selectivity: Confidence of a cut in standard deviations
+                         (lower = faster and riskier; None or 0 = off)
+        """
+        self._config['selectivity'] = selectivity
+        return self
+    
+    def with_late_move_reductions(self, schedule=LMR_SCHEDULE):
+        """
+        Enable late move reductions (bitboard engines).
+        
+        Late, non-corner, non-hash moves are searched shallower with a
+        null window and re-searched at full depth only if they beat
+        alpha.
+        
+        Args:
+            schedule: Name of a schedule in AI/LateMoveReductions.py
+                      ('conservative', 'standard', 'aggressive'), a dict
+                      of ReductionSchedule arguments, or None (off)
+        
+        Raises:
+            ValueError: If the schedule name is unknown
+        """
+        from AI.LateMoveReductions import reduction_schedule
+        reduction_schedule(schedule)  # Fail here, not in the engine
+        self._config['reductions'] = schedule
+        return self
+    
     def with_transposition_table(self, size_mb: int = 64):
         """
         Add transposition table (memoization).
@@ -136,19 +201,33 @@ class EngineBuilder:
         self._features.append(('ttable', {'size_mb': size_mb}))
         return self
     
-    def with_endgame_solver(self, depth_trigger: int = 12):
+    def with_endgame_solver(self, depth_trigger: int = 12, wld_trigger: Optional[int] = None,
+                            workers: int = 1):
         """
         Add perfect endgame solver.
         
         Args:
             depth_trigger: Depth at which to trigger perfect solver
+            wld_trigger: Depth at which to start win/loss/draw solving
+                         (None = exact solver only)
+            workers: Workers for parallel solves (1 = sequential)
         """
-        self._features.append(('endgame', {'trigger': depth_trigger}))
+        self._features.append(('endgame', {'trigger': depth_trigger,
+                                           'wld_trigger': wld_trigger,
+                                           'workers': workers}))
         return self
     
-    def with_iterative_deepening(self):
-        """Add iterative deepening search."""
-        self._features.append(('iterative_deepening', {}))
+    def with_iterative_deepening(self, time_ms: Optional[int] = None,
+                                 node_limit: Optional[int] = None):
+        """
+        Add iterative deepening search.
+        
+        Args:
+            time_ms: Default time budget per move in milliseconds
+            node_limit: Default node budget per move
+        """
+        self._features.append(('iterative_deepening',
+                               {'time_ms': time_ms, 'node_limit': node_limit}))
         return self
     
     # ========== Configuration ==========
@@ -215,6 +294,14 @@ class EngineBuilder:
             from engines.implementations.grandmaster.grandmaster_engine import GrandmasterEngine
             return GrandmasterEngine(config=self._config)
         
+        elif self._engine_type == 'ybwc':
+            from engines.implementations.parallel.ybwc_engine import YBWCEngine
+            return YBWCEngine(config=self._config)
+        
+        elif self._engine_type == 'mtdf':
+            from engines.implementations.bitboard.mtdf_engine import MTDfEngine
+            return MTDfEngine(config=self._config)
+        
         elif self._engine_type == 'random':
             from engines.implementations.random.random_engine import RandomEngine
             return RandomEngine(config=self._config)
@@ -250,7 +337,8 @@ class EngineBuilder:
         
         elif feature_name == 'parallel':
             from engines.features.parallel_search_decorator import ParallelSearchDecorator
-            return ParallelSearchDecorator(engine, threads=config.get('threads', 4))
+            return ParallelSearchDecorator(engine, threads=config.get('threads', 4),
+                                           backend=self._config.get('backend', 'process'))
         
         elif feature_name == 'ttable':
             from engines.features.transposition_table_decorator import TranspositionTableDecorator
@@ -258,11 +346,15 @@ class EngineBuilder:
         
         elif feature_name == 'endgame':
             from engines.features.endgame_solver_decorator import EndgameSolverDecorator
-            return EndgameSolverDecorator(engine, trigger=config.get('trigger', 12))
+            return EndgameSolverDecorator(engine, trigger=config.get('trigger', 12),
+                                          wld_trigger=config.get('wld_trigger'),
+                                          workers=config.get('workers', 1),
+                                          backend=self._config.get('backend', 'process'))
         
         elif feature_name == 'iterative_deepening':
             from engines.features.iterative_deepening_decorator import IterativeDeepeningDecorator
-            return IterativeDeepeningDecorator(engine)
+            return IterativeDeepeningDecorator(engine, time_ms=config.get('time_ms'),
+                                               node_limit=config.get('node_limit'))
         
         else:
             # Unknown feature - skip with warning
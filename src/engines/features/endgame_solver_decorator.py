@@ -11,30 +11,51 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from engines.base.engine import Engine
+from typing import Optional
 
 
 class EndgameSolverDecorator(Engine):
     """
     Decorator Pattern: Wraps engine with perfect endgame solver.
     
-    When few empty squares remain, solves game perfectly.
+    When few empty squares remain, solves game perfectly with the
+    bitboard EndgameSolver (exact final disc differential). With a
+    wld_trigger, positions a few empties earlier are solved for
+    win/loss/draw only; a proven loss is left to the wrapped engine.
+    With workers > 1, large solves are split over the shared worker
+    pool (ParallelEndgameSolver), so the triggers can be set higher.
     
     Example:
         base_engine = MinimaxEngine()
-        engine = EndgameSolverDecorator(base_engine, trigger=12)
+        engine = EndgameSolverDecorator(base_engine, trigger=12, wld_trigger=14)
     """
     
-    def __init__(self, wrapped_engine: Engine, trigger: int = 12):
+    def __init__(self, wrapped_engine: Engine, trigger: int = 12,
+                 wld_trigger: Optional[int] = None, workers: int = 1,
+                 backend: str = 'process'):
         """
         Wrap engine with endgame solver.
         
         Args:
             wrapped_engine: Base engine
             trigger: Empty squares threshold for perfect solve
+            wld_trigger: Empty squares threshold for win/loss/draw solve
+                         (None = exact solve only)
+            workers: Workers for parallel solves (1 = sequential)
+            backend: Pool backend of parallel solves ('process', or
+                     'thread' where the GIL is disabled)
         """
         super().__init__(name=f"{wrapped_engine.name}+Endgame")
         self.engine = wrapped_engine
         self.trigger = trigger
+        self.wld_trigger = wld_trigger
+        self.workers = workers
+        self.backend = backend
+        self.solver = None  # Created on first endgame
+        
+        # Kind of result behind the last move: 'exact', 'wld' or 'heuristic'
+        self.result_kind = 'heuristic'
+        self.result_value = None
     
     def get_best_move(self, game, depth: int, **kwargs):
         """
@@ -50,10 +71,24 @@ class EndgameSolverDecorator(Engine):
         """
         # Count empty squares
         empty_count = self._count_empty(game)
+        self.result_kind = 'heuristic'
+        self.result_value = None
         
         # If endgame threshold reached, solve perfectly
-        if empty_count <= self.trigger:
-            return self._solve_endgame(game)
+        if empty_count <= max(self.trigger, self.wld_trigger or 0):
+            # With a time budget, keep half of it for the fallback search
+            time_ms = kwargs.get('time_ms')
+            solver_time_ms = time_ms / 2 if time_ms else None
+            node_limit = kwargs.get('node_limit')
+            move = self._solve_endgame(game, solver_time_ms, node_limit,
+                                       exact=empty_count <= self.trigger)
+            if move is not None:
+                return move
+            # The fallback search gets what the solver left of both budgets
+            if time_ms:
+                kwargs['time_ms'] = time_ms - solver_time_ms
+            if node_limit:
+                kwargs['node_limit'] = max(1, node_limit - self.solver.nodes)
         
         # Otherwise use wrapped engine
         return self.engine.get_best_move(game, depth, **kwargs)
@@ -62,6 +97,19 @@ class EndgameSolverDecorator(Engine):
         """Delegate to wrapped engine."""
         return self.engine.evaluate_position(game)
     
+    def get_statistics(self):
+        """Statistics plus the kind of result behind the last move."""
+        stats = super().get_statistics()
+        stats['result_kind'] = self.result_kind
+        stats['result_value'] = self.result_value
+        return stats
+    
+    def close(self):
+        """Release the parallel solver's pool lease and close the wrapped engine."""
+        if self.solver is not None and hasattr(self.solver, 'close_pool'):
+            self.solver.close_pool()
+        super().close()
+    
     def _count_empty(self, game) -> int:
         """Count empty squares on board."""
         try:
@@ -70,15 +118,49 @@ class EndgameSolverDecorator(Engine):
         except:
             return 64  # Fallback
     
-    def _solve_endgame(self, game):
+    def _solve_endgame(self, game, time_ms=None, node_limit=None, exact=True):
         """
-        Perfect endgame solver (simple exhaustive search).
+        Perfect endgame solve on bitboards.
         
-        For production, this should use optimized algorithms like:
-        - NegaScout with deep endgame optimizations
-        - Bitboard operations
-        - Move ordering heuristics
+        Args:
+            game: Game state (converted to BitboardGame if needed)
+            time_ms: Optional time budget (milliseconds)
+            node_limit: Optional node budget
+            exact: Exact disc differential, or win/loss/draw only
+        
+        Returns:
+            Move: Perfect move, or None if the budget ran out (or no move,
+                  or a proven loss in win/loss/draw mode)
         """
-        # For now, delegate to engine with maximum depth
-        return self.engine.get_best_move(game, depth=20)
+        from AI.EndgameSolver import EndgameSolver, RESULT_EXACT, RESULT_WLD, LOSS
+        from AI.ParallelEndgameSolver import ParallelEndgameSolver
+        from Reversi.BitboardGame import BitboardGame
+        
+        if not isinstance(game, BitboardGame):
+            bitboard_game = BitboardGame()
+            bitboard_game.import_game_state(game)
+            game = bitboard_game
+        
+        if self.solver is None:
+            if self.workers > 1:
+                self.solver = ParallelEndgameSolver(num_workers=self.workers, backend=self.backend)
+            else:
+                self.solver = EndgameSolver()
+        
+        self.solver.stop_flag = self.search_stop
+        if exact:
+            result = self.solver.solve(game, time_ms=time_ms, node_limit=node_limit)
+        else:
+            result = self.solver.solve_wld(game, time_ms=time_ms, node_limit=node_limit)
+        self.update_statistics(nodes_evaluated=self.solver.nodes)
+        if result is None or result[0] is None:
+            return None
+        
+        square, value = result
+        self.result_kind = RESULT_EXACT if exact else RESULT_WLD
+        self.result_value = value
+        if not exact and value == LOSS:
+            return None
+        
+        return game.square_to_move(square)
 
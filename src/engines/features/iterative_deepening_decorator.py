@@ -0,0 +1,124 @@
+"""
+Iterative Deepening Decorator
+
+Decorator Pattern: Adds time/node budgeted iterative deepening.
+
+Version: 3.2.0
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
+
+from engines.base.engine import Engine
+from typing import Optional
+
+# Deepest iteration when only a budget is given
+MAX_DEPTH = 60
+
+# Share of the time budget after which no new iteration is started
+NEXT_ITERATION_TIME_SHARE = 0.4
+
+
+def supports_time_control(engine: Engine) -> bool:
+    """
+    Check whether an engine (or an engine it decorates) accepts
+    time_ms/node_limit in get_best_move().
+    """
+    while engine is not None:
+        if getattr(engine, 'supports_time_control', False):
+            return True
+        engine = getattr(engine, 'engine', None)
+    return False
+
+
+class IterativeDeepeningDecorator(Engine):
+    """
+    Decorator Pattern: Wraps engine with iterative deepening.
+    
+    Searches with a per-move time budget (and/or node budget) instead
+    of a fixed depth; `depth` becomes the maximum depth (None = no limit).
+    
+    - Engines with native time control (bitboard, grandmaster) receive
+      the budget directly: they abort mid-iteration and return the last
+      completed iteration.
+    - Other engines are called at depth 1, 2, ... until the budget is
+      spent; an iteration is never interrupted, so the budget is soft.
+    
+    Example:
+        base_engine = BitboardEngine()
+        engine = IterativeDeepeningDecorator(base_engine, time_ms=2000)
+    """
+    
+    supports_time_control = True
+    
+    def __init__(self, wrapped_engine: Engine, time_ms: Optional[int] = None,
+                 node_limit: Optional[int] = None):
+        """
+        Wrap engine with iterative deepening.
+        
+        Args:
+            wrapped_engine: Base engine to wrap
+            time_ms: Default time budget per move (milliseconds)
+            node_limit: Default node budget per move
+        """
+        super().__init__(name=f"{wrapped_engine.name}+ID")
+        self.engine = wrapped_engine
+        self.time_ms = time_ms
+        self.node_limit = node_limit
+    
+    def get_best_move(self, game, depth: Optional[int], **kwargs):
+        """
+        Get best move within the time/node budget.
+        
+        Args:
+            game: Game state
+            depth: Maximum search depth (None = no limit)
+            **kwargs: Additional parameters; time_ms/node_limit override
+                      the defaults of this decorator
+        
+        Returns:
+            Move: Best move of the last completed iteration
+        """
+        time_ms = kwargs.pop('time_ms', None) or self.time_ms
+        node_limit = kwargs.pop('node_limit', None) or self.node_limit
+        
+        # No budget: plain fixed-depth search
+        if not time_ms and not node_limit:
+            return self.engine.get_best_move(game, depth, **kwargs)
+        
+        if supports_time_control(self.engine):
+            return self.engine.get_best_move(game, depth, time_ms=time_ms,
+                                             node_limit=node_limit, **kwargs)
+        
+        return self._iterate(game, depth, time_ms, node_limit, **kwargs)
+    
+    def _iterate(self, game, max_depth, time_ms, node_limit, **kwargs):
+        """Generic iterative deepening over whole get_best_move() calls."""
+        time_start = time.perf_counter()
+        nodes_start = self.engine.get_statistics().get('nodes_evaluated', 0)
+        best_move = None
+        
+        for depth in range(1, (max_depth or MAX_DEPTH) + 1):
+            best_move = self.engine.get_best_move(game, depth, **kwargs)
+            
+            elapsed_ms = (time.perf_counter() - time_start) * 1000
+            nodes = self.engine.get_statistics().get('nodes_evaluated', 0) - nodes_start
+            if time_ms and elapsed_ms >= time_ms * NEXT_ITERATION_TIME_SHARE:
+                break
+            if node_limit and nodes >= node_limit:
+                break
+        
+        self.update_statistics(time_spent_ms=int((time.perf_counter() - time_start) * 1000))
+        return best_move
+    
+    def evaluate_position(self, game) -> float:
+        """Delegate to wrapped engine."""
+        return self.engine.evaluate_position(game)
+    
+    def get_statistics(self):
+        """Combine statistics of decorator and wrapped engine."""
+        stats = self.engine.get_statistics()
+        stats['time_spent_ms'] += self._statistics['time_spent_ms']
+        return stats
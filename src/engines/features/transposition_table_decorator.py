@@ -11,7 +11,7 @@ import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../..'))
 
 from engines.base.engine import Engine
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Tuple, Any, Union
 
 
 class TranspositionTableDecorator(Engine):
@@ -39,7 +39,7 @@ class TranspositionTableDecorator(Engine):
         self.size_mb = size_mb
         
         # Transposition table: position_hash -> (depth, score, best_move)
-        self.table: Dict[str, Tuple[int, float, Any]] = {}
+        self.table: Dict[Union[int, str], Tuple[int, float, Any]] = {}
         self.max_entries = (size_mb * 1024 * 1024) // 128  # Estimate
     
     def get_best_move(self, game, depth: int, **kwargs):
@@ -54,6 +54,10 @@ class TranspositionTableDecorator(Engine):
         Returns:
             Move: Best move
         """
+        # Budgeted searches have no fixed depth to cache against
+        if depth is None or kwargs.get('time_ms') or kwargs.get('node_limit'):
+            return self.engine.get_best_move(game, depth, **kwargs)
+        
         # Generate position hash
         position_hash = self._hash_position(game)
         
@@ -87,7 +91,7 @@ class TranspositionTableDecorator(Engine):
         
         return self.engine.evaluate_position(game)
     
-    def _hash_position(self, game) -> str:
+    def _hash_position(self, game) -> Union[int, str]:
         """
         Generate hash for game position.
         
@@ -95,12 +99,13 @@ class TranspositionTableDecorator(Engine):
             game: Game state
         
         Returns:
-            str: Position hash
+            int: Zobrist key for BitboardGame (maintained incrementally)
+            str: Board string for other games
         """
         try:
-            # Try Zobrist hash if available (BitboardGame)
+            # Use the Zobrist key kept by BitboardGame
             if hasattr(game, 'get_zobrist_hash'):
-                return str(game.get_zobrist_hash())
+                return game.get_zobrist_hash()
             
             # Fallback to string export
             return game.export_str() + game.get_turn()
@@ -108,7 +113,7 @@ class TranspositionTableDecorator(Engine):
             # Last resort: string representation
             return str(game)
     
-    def _store(self, position_hash: str, depth: int, score: float, move):
+    def _store(self, position_hash: Union[int, str], depth: int, score: float, move):
         """Store position in transposition table."""
         # Evict old entries if table is full
         if len(self.table) >= self.max_entries:
@@ -7,6 +7,7 @@ Version: 3.2.0
 """
 
 from .bitboard_engine import BitboardEngine
+from .mtdf_engine import MTDfEngine
 
-__all__ = ['BitboardEngine']
+__all__ = ['BitboardEngine', 'MTDfEngine']
 
@@ -38,6 +38,8 @@ class BitboardEngine(Engine):
     Wrapper around AI/BitboardMinimaxEngine.py.
     """
     
+    supports_time_control = True
+    
     def __init__(self, config=None):
         """
         Initialize bitboard engine.
@@ -55,9 +57,12 @@ class BitboardEngine(Engine):
             self.evaluator = StandardEvaluator()
         
         # Use legacy bitboard engine
-        from AI.BitboardMinimaxEngine import BitboardMinimaxEngine
-        self._legacy_engine = BitboardMinimaxEngine()
+        from AI.BitboardMinimaxEngine import BitboardMinimaxEngine, DEFAULT_TT_MB
+        tt_size_mb = (config or {}).get('tt_size_mb', DEFAULT_TT_MB)
+        self._legacy_engine = BitboardMinimaxEngine(tt_size_mb=tt_size_mb)
         self._legacy_engine.evaluator = self.evaluator
+        self._legacy_engine.set_selectivity((config or {}).get('selectivity'))
+        self._legacy_engine.set_reductions((config or {}).get('reductions'))
     
     def get_best_move(self, game, depth: int, **kwargs):
         """
@@ -65,8 +70,8 @@ class BitboardEngine(Engine):
         
         Args:
             game: Game state
-            depth: Search depth
-            **kwargs: Additional parameters
+            depth: Search depth (maximum depth with a time/node budget)
+            **kwargs: Additional parameters (player_name, time_ms, node_limit)
         
         Returns:
             Move: Best move
@@ -81,6 +86,50 @@ class BitboardEngine(Engine):
         
         return move
     
+    def score_moves(self, game, moves, depth: int, alpha=None):
+        """
+        Score root moves with the bitboard alpha-beta search
+        (see Engine.score_moves).
+        """
+        from AI.BitboardMinimaxEngine import INFINITY
+        
+        legacy = self._legacy_engine
+        legacy.nodes = 0
+        legacy.pruning = 0
+        legacy.start_budget()
+        best = -INFINITY if alpha is None else alpha
+        
+        scores = []
+        for move in moves:
+            square = game.move_to_square(move)
+            flips = game.make(square)
+            score = -legacy.alphabeta(game, depth - 1, -INFINITY, -best)
+            game.unmake(square, flips)
+            scores.append((move, score))
+            best = max(best, score)
+        
+        self.update_statistics(nodes_evaluated=legacy.nodes, pruning_count=legacy.pruning)
+        return scores
+    
+    def set_search_control(self, stop_flag, progress):
+        """Hand the stop flag and progress callback to the bitboard search."""
+        super().set_search_control(stop_flag, progress)
+        self._legacy_engine.stop_flag = stop_flag
+        self._legacy_engine.progress = progress
+    
+    def predict_reply(self, game):
+        """Expected move of the side to move: the transposition table's best move."""
+        from Reversi.BitboardGame import BitboardGame
+        from AI.TranspositionTable import NO_MOVE
+        
+        if not isinstance(game, BitboardGame):
+            bitboard_game = BitboardGame()
+            bitboard_game.import_game_state(game)
+            game = bitboard_game
+        
+        square = self._legacy_engine.hash_move(game)
+        return None if square == NO_MOVE else game.square_to_move(square)
+    
     def evaluate_position(self, game) -> float:
         """Evaluate position."""
         return self.evaluator.evaluate(game)
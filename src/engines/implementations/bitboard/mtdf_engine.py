@@ -0,0 +1,122 @@
+"""
+MTD(f) Engine
+
+Bitboard search driven by MTD(f) zero-window passes.
+Wrapper around AI/MTDfBitboardMinimaxEngine.py.
+
+Version: 3.2.0
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../..'))
+
+from engines.base.engine import Engine
+from engines.base.engine_metadata import EngineMetadata
+from engines.factory.engine_registry import EngineRegistry
+
+
+@EngineRegistry.register('mtdf', EngineMetadata(
+    name='mtdf',
+    display_name='MTD(f)',
+    description='Bitboard search converging with zero-window passes (MTD(f))',
+    complexity='high',
+    speed='fast',
+    strength='strong',
+    features=['bitboard', 'alpha_beta', 'mtdf', 'iterative_deepening', 'transposition_table'],
+    parameters={'tt_size_mb': 16}
+))
+class MTDfEngine(Engine):
+    """
+    Bitboard engine searching with MTD(f).
+    
+    Features:
+    - Zero-window alpha-beta passes converge on the value, each one
+      seeded by the previous bound
+    - Iterative deepening, every depth seeded with an earlier
+      iteration's score
+    - Bounded transposition table kept across passes and moves
+    
+    Wrapper around AI/MTDfBitboardMinimaxEngine.py.
+    """
+    
+    supports_time_control = True
+    
+    def __init__(self, config=None):
+        """
+        Initialize MTD(f) engine.
+        
+        Args:
+            config: Optional configuration (evaluator, tt_size_mb, selectivity,
+                    reductions)
+        """
+        super().__init__("MTDf", config)
+        
+        # Get evaluator
+        if config and 'evaluator' in config:
+            self.evaluator = config['evaluator']
+        else:
+            from AI.StandardEvaluator import StandardEvaluator
+            self.evaluator = StandardEvaluator()
+        
+        # Use legacy MTD(f) engine
+        from AI.MTDfBitboardMinimaxEngine import MTDfBitboardMinimaxEngine
+        from AI.BitboardMinimaxEngine import DEFAULT_TT_MB
+        config = config or {}
+        self._legacy_engine = MTDfBitboardMinimaxEngine(
+            evaluator=self.evaluator,
+            tt_size_mb=config.get('tt_size_mb', DEFAULT_TT_MB)
+        )
+        self._legacy_engine.set_selectivity(config.get('selectivity'))
+        self._legacy_engine.set_reductions(config.get('reductions'))
+    
+    def get_best_move(self, game, depth: int, **kwargs):
+        """
+        Find best move using MTD(f).
+        
+        Args:
+            game: Game state
+            depth: Search depth (maximum depth with a time/node budget)
+            **kwargs: Additional parameters (player_name, time_ms, node_limit)
+        
+        Returns:
+            Move: Best move
+        """
+        move = self._legacy_engine.get_best_move(game, depth, **kwargs)
+        
+        # Update statistics
+        self.update_statistics(
+            nodes_evaluated=self._legacy_engine.nodes,
+            pruning_count=self._legacy_engine.pruning
+        )
+        
+        return move
+    
+    def set_search_control(self, stop_flag, progress):
+        """Hand the stop flag and progress callback to the MTD(f) search."""
+        super().set_search_control(stop_flag, progress)
+        self._legacy_engine.stop_flag = stop_flag
+        self._legacy_engine.progress = progress
+    
+    def predict_reply(self, game):
+        """Expected move of the side to move: the transposition table's best move."""
+        from Reversi.BitboardGame import BitboardGame
+        from AI.TranspositionTable import NO_MOVE
+        
+        if not isinstance(game, BitboardGame):
+            bitboard_game = BitboardGame()
+            bitboard_game.import_game_state(game)
+            game = bitboard_game
+        
+        square = self._legacy_engine.hash_move(game)
+        return None if square == NO_MOVE else game.square_to_move(square)
+    
+    def evaluate_position(self, game) -> float:
+        """Evaluate position."""
+        return self.evaluator.evaluate(game)
+    
+    def get_statistics(self):
+        """Statistics plus the zero-window passes of the last search."""
+        stats = super().get_statistics()
+        stats['mtdf_passes'] = self._legacy_engine.passes
+        return stats
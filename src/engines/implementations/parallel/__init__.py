@@ -0,0 +1,11 @@
+"""
+Parallel Engine Implementations
+
+Multi-process search engines.
+
+Version: 3.2.0
+"""
+
+from .ybwc_engine import YBWCEngine
+
+__all__ = ['YBWCEngine']
@@ -75,6 +75,17 @@ class GreedyEngine(Engine):
         
         return best_move
     
+    def score_moves(self, game, moves, depth: int, alpha=None):
+        """Score root moves by the position after each (see Engine.score_moves)."""
+        scores = []
+        for move in moves:
+            game_copy = game.copy() if hasattr(game, 'copy') else self._copy_game(game)
+            game_copy.move(move)
+            scores.append((move, self.evaluator.evaluate(game_copy)))
+        
+        self.update_statistics(nodes_evaluated=len(moves))
+        return scores
+    
     def evaluate_position(self, game) -> float:
         """Evaluate position (piece count)."""
         return self.evaluator.evaluate(game)
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Parallel Endgame Solver Benchmark
+
+Measures the speedup curve of the parallel exact endgame solver: wall
+time and node count on random-play positions with the given number of
+empty squares for 2, 4, 8 and 16 workers, relative to the sequential
+EndgameSolver (1 worker).
+
+Speedup only shows with at least as many idle cores as workers; on
+fewer cores the curve measures the parallel overhead instead. Python
+solves of 20+ empties take minutes per position sequentially, so start
+with fewer empties (and positions) to calibrate.
+
+Usage:
+    python endgame_benchmark.py [empties] [positions] [workers ...]
+"""
+
+import sys
+import os
+import time
+import random
+from multiprocessing import cpu_count
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AI.EndgameSolver import EndgameSolver
+from AI.ParallelEndgameSolver import ParallelEndgameSolver, PARALLEL_MIN_EMPTIES
+from AI.WorkerPool import get_pool_manager
+from Reversi.BitboardGame import BitboardGame, popcount
+
+WORKER_COUNTS = [2, 4, 8, 16]
+
+
+def endgame_positions(empties, count, seed=0):
+    """Random-play positions with `empties` empty squares (game not over)"""
+    positions = []
+    while len(positions) < count:
+        rnd = random.Random(seed)
+        seed += 1
+        game = BitboardGame()
+        while 64 - popcount(game.black | game.white) > empties and not game.is_finish():
+            move_list = game.get_move_list()
+            if not move_list:
+                game.pass_turn()
+                continue
+            game.move(rnd.choice(move_list))
+        if not game.is_finish():
+            positions.append(game)
+    return positions
+
+
+def run_suite(num_workers, positions, empties):
+    """Solve every position with a fresh solver: (seconds, nodes, scores)"""
+    if num_workers > 1:
+        solver = ParallelEndgameSolver(num_workers=num_workers,
+                                       parallel_empties=min(empties, PARALLEL_MIN_EMPTIES))
+        get_pool_manager().resize(num_workers)
+        solver._get_lease()  # pool start-up is not timed
+    else:
+        solver = EndgameSolver()
+    seconds = 0.0
+    nodes = 0
+    scores = []
+    try:
+        for game in positions:
+            start = time.perf_counter()
+            scores.append(solver.solve(game)[1])
+            seconds += time.perf_counter() - start
+            nodes += solver.nodes
+    finally:
+        if num_workers > 1:
+            solver.close_pool()
+    return seconds, nodes, scores
+
+
+def run_benchmark(empties=18, count=4, worker_counts=WORKER_COUNTS):
+    """Print the speedup curve; returns {workers: (seconds, nodes)}"""
+    positions = endgame_positions(empties, count)
+
+    print("="*80)
+    print(f"PARALLEL ENDGAME SOLVER BENCHMARK ({count} positions, {empties} empties, "
+          f"{cpu_count()} CPU cores)")
+    print("="*80)
+    print(f"{'Workers':<10}{'Time(s)':>10}{'Nodes':>14}{'Speedup':>10}"
+          f"{'Efficiency':>12}{'Node overhead':>16}")
+    print("-"*80)
+
+    results = {}
+    base_seconds, base_nodes, base_scores = results[1] = run_suite(1, positions, empties)
+    print(f"{1:<10}{base_seconds:>10.2f}{base_nodes:>14,}{1.0:>9.2f}x{1.0:>11.0%}{0.0:>15.0%}")
+
+    for workers in worker_counts:
+        seconds, nodes, scores = results[workers] = run_suite(workers, positions, empties)
+        assert scores == base_scores, "parallel solve disagrees with the sequential solver"
+        speedup = base_seconds / seconds
+        print(f"{workers:<10}{seconds:>10.2f}{nodes:>14,}{speedup:>9.2f}x"
+              f"{speedup / workers:>11.0%}{nodes / base_nodes - 1:>15.0%}")
+
+    print("-"*80)
+    print("Speedup curve:")
+    for workers in [1] + list(worker_counts):
+        speedup = base_seconds / results[workers][0]
+        print(f"  {workers:>3} {'#' * max(1, round(speedup * 10))} {speedup:.2f}x")
+    if cpu_count() < max(worker_counts) + 1:
+        print(f"Note: {cpu_count()} core(s) here; a speedup with N workers "
+              f"needs N + 1 cores (workers and master)")
+    print("="*80)
+    return {workers: (seconds, nodes) for workers, (seconds, nodes, _) in results.items()}
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 18,
+                  int(sys.argv[2]) if len(sys.argv) > 2 else 4,
+                  [int(arg) for arg in sys.argv[3:]] or WORKER_COUNTS)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Late Move Reductions Self-Play
+
+Plays an engine with a late move reduction schedule (AI/LateMoveReductions.py)
+against the same engine without reductions: every seeded random opening
+is played twice, colors swapped, with a fresh pair of engines per game.
+Reports the score of the reduced engine, its disc margin, and the nodes
+and time per move of both sides.
+
+The reduced engine can search deeper than its opponent to compare at
+about equal time: a schedule is worth it if it holds its own at the same
+depth and wins with the depth it saves.
+
+Usage:
+    python lmr_selfplay.py [schedule] [games] [depth] [plain_depth] [profile]
+
+    profile: 'StandardEvaluator' (bitboard engine) or 'grandmaster'
+"""
+
+import sys
+import os
+import io
+import time
+import random
+import contextlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AI.BitboardMinimaxEngine import BitboardMinimaxEngine
+from AI.GrandmasterEngine import GrandmasterEngine
+from AI.LateMoveReductions import LMR_SCHEDULE, reduction_schedule
+from Reversi.BitboardGame import BitboardGame
+
+# Engines by evaluation profile (as in probcut_calibration.py)
+PROFILES = {
+    'StandardEvaluator': lambda: BitboardMinimaxEngine(),
+    'grandmaster': lambda: GrandmasterEngine(num_workers=1),
+}
+
+# Random plies of an opening
+OPENING_PLIES = 8
+
+
+def opening(seed):
+    """BitboardGame after OPENING_PLIES seeded random moves"""
+    rnd = random.Random(seed)
+    game = BitboardGame()
+    for _ in range(OPENING_PLIES):
+        moves = list(game.legal_squares())
+        if not moves:
+            game.make_pass()
+            continue
+        game.make(rnd.choice(moves))
+    return game
+
+
+def play_game(game, engines, depths, stats):
+    """
+    Play `game` to the end, engines[0] black; stats[i] collects the
+    (nodes, seconds) of engine i. Returns black's disc margin.
+    """
+    while not game.is_finish():
+        side = 0 if game.turn == 'B' else 1
+        if not game.get_valid_moves():
+            game.make_pass()
+            continue
+        engine = engines[side]
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            move = engine.iterative_deepening(game.clone(), depths[side])
+        stats[side][0] += engine.nodes
+        stats[side][1] += time.perf_counter() - start
+        stats[side][2] += 1
+        game.make(BitboardGame.move_to_square(move))
+    return game.black_cnt - game.white_cnt
+
+
+def self_play(schedule=LMR_SCHEDULE, games=20, depth=6, plain_depth=None,
+              profile='StandardEvaluator'):
+    """Play the games; returns (score of the reduced engine, games played)"""
+    plain_depth = plain_depth or depth
+    reductions = reduction_schedule(schedule)
+    print("="*80)
+    print(f"LMR SELF-PLAY ({profile}, {reductions} at depth {depth} "
+          f"vs no reductions at depth {plain_depth}, {games} games)")
+    print("="*80)
+
+    score = 0.0
+    margin = 0
+    stats = [[0, 0.0, 0], [0, 0.0, 0]]  # reduced, plain: nodes, seconds, moves
+    for index in range(games):
+        with contextlib.redirect_stdout(io.StringIO()):
+            reduced, plain = PROFILES[profile](), PROFILES[profile]()
+        reduced.set_reductions(reductions)
+        reduced_black = index % 2 == 0
+        if reduced_black:
+            engines, depths, sides = (reduced, plain), (depth, plain_depth), stats
+        else:
+            engines, depths, sides = (plain, reduced), (plain_depth, depth), stats[::-1]
+        black_margin = play_game(opening(index // 2), engines, depths, sides)
+        result = black_margin if reduced_black else -black_margin
+        margin += result
+        score += 1.0 if result > 0 else 0.5 if result == 0 else 0.0
+        print(f"  game {index + 1:>3} ({'black' if reduced_black else 'white'}): "
+              f"{result:+3d}, score {score:.1f}/{index + 1}", flush=True)
+
+    print("-"*80)
+    print(f"Score: {score:.1f}/{games} ({score / games:.0%}), "
+          f"average margin {margin / games:+.1f} discs")
+    for label, (nodes, seconds, moves) in zip(('Reduced', 'Plain'), stats):
+        print(f"{label + ':':<10}{nodes / moves:>10,.0f} nodes/move {seconds / moves:>7.2f} s/move")
+    print("="*80)
+    return score, games
+
+
+if __name__ == "__main__":
+    self_play(sys.argv[1] if len(sys.argv) > 1 else LMR_SCHEDULE,
+              int(sys.argv[2]) if len(sys.argv) > 2 else 20,
+              int(sys.argv[3]) if len(sys.argv) > 3 else 6,
+              int(sys.argv[4]) if len(sys.argv) > 4 else None,
+              sys.argv[5] if len(sys.argv) > 5 else 'StandardEvaluator')
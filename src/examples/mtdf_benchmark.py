@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+MTD(f) Head-to-Head Benchmark
+
+Compares MTD(f) (MTDfBitboardMinimaxEngine) with GrandmasterEngine
+(PVS + aspiration windows) on the search_benchmark positions: nodes
+and time of an iterative deepening search to the same depth, with a
+fresh engine per position.
+
+MTD(f) is a root driver over an alpha-beta search. The MTD(f) engine
+drives the bitboard search (its evaluation and move ordering), so the
+bitboard alpha-beta engine is listed as its baseline, and the same
+driver over Grandmaster's search as Grandmaster's. Each pair must agree
+on every move.
+
+Usage:
+    python mtdf_benchmark.py [depth]
+"""
+
+import sys
+import os
+import io
+import time
+import contextlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AI.BitboardMinimaxEngine import BitboardMinimaxEngine
+from AI.GrandmasterEngine import GrandmasterEngine
+from AI.MTDfBitboardMinimaxEngine import MTDfBitboardMinimaxEngine
+from examples.search_benchmark import position_set
+
+
+class MTDfGrandmasterEngine(MTDfBitboardMinimaxEngine, GrandmasterEngine):
+    """MTD(f) root driver over Grandmaster's alpha-beta and evaluation"""
+
+    def __init__(self):
+        super().__init__()
+        self.num_workers = 1
+
+
+# (label, engine factory); pairs of (baseline, same search under MTD(f))
+ENGINES = [
+    ('Grandmaster', lambda: GrandmasterEngine(num_workers=1)),
+    ('GM + MTD(f)', MTDfGrandmasterEngine),
+    ('Bitboard a-b', BitboardMinimaxEngine),
+    ('MTD(f)', MTDfBitboardMinimaxEngine),
+]
+
+
+def search(factory, game, depth):
+    """Iterative deepening to `depth` with a fresh engine: (move, nodes, seconds, engine)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = factory()
+        start = time.perf_counter()
+        move = engine.iterative_deepening(game, depth)
+    return move, engine.nodes, time.perf_counter() - start, engine
+
+
+def run_benchmark(depth=7):
+    """Print nodes and time of every engine on every position"""
+    print("="*80)
+    print(f"MTD(f) HEAD-TO-HEAD (iterative deepening to depth {depth})")
+    print("="*80)
+    print(f"{'Position':<24}" + ''.join(f"{label:>15}" for label, _ in ENGINES))
+    print("-"*80)
+
+    nodes_total = [0] * len(ENGINES)
+    time_total = [0.0] * len(ENGINES)
+    passes = 0
+    for name, game in position_set():
+        results = [search(factory, game, depth) for _, factory in ENGINES]
+        for baseline, mtdf in ((0, 1), (2, 3)):
+            assert str(results[baseline][0]) == str(results[mtdf][0]), \
+                f"{name}: {ENGINES[mtdf][0]} {results[mtdf][0]} != {results[baseline][0]}"
+        passes += results[3][3].passes
+
+        row = f"{name:<24}"
+        for i, (_, nodes, seconds, _) in enumerate(results):
+            nodes_total[i] += nodes
+            time_total[i] += seconds
+            row += f"{nodes:>8,} {seconds:>5.1f}s"
+        print(row)
+
+    print("-"*80)
+    print(f"{'Total':<24}" + ''.join(f"{nodes:>8,} {seconds:>5.1f}s"
+                                     for nodes, seconds in zip(nodes_total, time_total)))
+    print(f"{'Nodes vs Grandmaster':<24}" + ''.join(f"{nodes / nodes_total[0]:>14.1%} "
+                                                   for nodes in nodes_total))
+    print(f"MTD(f) engine zero-window passes: {passes}")
+    print("="*80)
+    return nodes_total, time_total
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 7)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Multi-ProbCut Calibration
+
+Fits the shallow-vs-deep regressions used by Multi-ProbCut (AI/ProbCut.py)
+for one evaluation profile and stores them in the calibration file.
+
+Positions come from self-play games of the engine (a depth 2 search with
+some random moves for variety). Each position is searched with a full
+window at every depth up to the maximum; for each deep depth the value
+is fitted against the value at its shallow depth, per game phase:
+
+    deep = a * shallow + b,  error deviation sigma
+
+Python searches take seconds from depth 8 on, so start with fewer
+positions (or a lower maximum depth) to calibrate the run time. Deeper
+nodes reuse the deepest calibrated pair of the same parity.
+
+Usage:
+    python probcut_calibration.py [profile] [positions] [max_depth] [output]
+
+    profile: 'StandardEvaluator' (bitboard, YBWC, parallel engines) or
+             'grandmaster'
+"""
+
+import sys
+import os
+import io
+import math
+import time
+import random
+import contextlib
+from collections import defaultdict
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AI.BitboardMinimaxEngine import BitboardMinimaxEngine, INFINITY
+from AI.GrandmasterEngine import GrandmasterEngine
+from AI.ProbCut import (PROBCUT_FILE, PROBCUT_MIN_DEPTH, PROBCUT_VALUE_LIMIT, PHASE_EMPTIES,
+                        shallow_depth, phase_of, save_probcut)
+from Reversi.BitboardGame import BitboardGame
+
+# Engines by evaluation profile (their evaluation_profile())
+PROFILES = {
+    'StandardEvaluator': lambda: BitboardMinimaxEngine(),
+    'grandmaster': lambda: GrandmasterEngine(num_workers=1),
+}
+
+# Sampled positions: empties range (the endgame solvers take over below)
+# and the plies between two samples of a game
+MIN_EMPTIES = 12
+MAX_EMPTIES = 54
+SAMPLE_EVERY = 3
+
+# Self-play: share of random moves, depth of the other moves
+RANDOM_MOVE_SHARE = 0.25
+PLAY_DEPTH = 2
+
+# Phases with fewer samples are left out (the nearest phase is used)
+MIN_SAMPLES = 12
+
+
+def self_play_positions(engine, count, seed=0):
+    """Positions (BitboardGame) sampled from self-play games of the engine"""
+    positions = []
+    rnd = random.Random(seed)
+    while len(positions) < count:
+        game = BitboardGame()
+        ply = rnd.randrange(SAMPLE_EVERY)
+        while not game.is_finish() and len(positions) < count:
+            moves = list(game.legal_squares())
+            if not moves:
+                game.make_pass()
+                continue
+            empties = 64 - game.black_cnt - game.white_cnt
+            if MIN_EMPTIES <= empties <= MAX_EMPTIES and ply % SAMPLE_EVERY == 0:
+                positions.append(game.clone())
+            ply += 1
+            if rnd.random() < RANDOM_MOVE_SHARE:
+                square = rnd.choice(moves)
+            else:
+                square = max(moves, key=lambda square: move_value(engine, game, square))
+            game.make(square)
+    return positions
+
+
+def move_value(engine, game, square):
+    """Value of a move by a shallow search (self-play)"""
+    flips = game.make(square)
+    value = -engine.alphabeta(game, PLAY_DEPTH - 1, -INFINITY, INFINITY)
+    game.unmake(square, flips)
+    return value
+
+
+def search_values(engine, game, max_depth):
+    """Full window values at depths 1..max_depth (fresh table, increasing depth)"""
+    engine.transposition_table.clear()
+    engine.start_budget()
+    return {depth: engine.alphabeta(game, depth, -INFINITY, INFINITY)
+            for depth in range(1, max_depth + 1)}
+
+
+def fit(samples):
+    """Least squares fit deep = a * shallow + b: (a, b, sigma, samples)"""
+    n = len(samples)
+    mean_x = sum(x for x, _ in samples) / n
+    mean_y = sum(y for _, y in samples) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in samples)
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in samples)
+    a = cov / var_x if var_x else 1.0
+    b = mean_y - a * mean_x
+    residuals = sum((y - a * x - b) ** 2 for x, y in samples)
+    sigma = math.sqrt(residuals / max(1, n - 2))
+    return a, b, sigma, n
+
+
+def calibrate(profile='StandardEvaluator', count=200, max_depth=8, path=PROBCUT_FILE,
+              seed=0):
+    """Fit and store the profile's regressions; returns the fits"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = PROFILES[profile]()
+    assert engine.evaluation_profile() == profile
+
+    print("="*80)
+    print(f"MULTI-PROBCUT CALIBRATION ({profile}, {count} positions, depths "
+          f"{PROBCUT_MIN_DEPTH}-{max_depth})")
+    print("="*80)
+
+    start = time.perf_counter()
+    positions = self_play_positions(engine, count, seed)
+    samples = defaultdict(list)  # (deep depth, phase) -> [(shallow value, deep value)]
+    for index, game in enumerate(positions, 1):
+        values = search_values(engine, game, max_depth)
+        phase = phase_of(64 - game.black_cnt - game.white_cnt, PHASE_EMPTIES)
+        for depth in range(PROBCUT_MIN_DEPTH, max_depth + 1):
+            shallow, deep = values[shallow_depth(depth)], values[depth]
+            if abs(shallow) < PROBCUT_VALUE_LIMIT and abs(deep) < PROBCUT_VALUE_LIMIT:
+                samples[depth, phase].append((shallow, deep))
+        if index % 10 == 0:
+            print(f"  {index}/{len(positions)} positions, {time.perf_counter() - start:.0f}s")
+
+    fits = {}
+    print(f"{'Depth':<8}{'Shallow':<9}{'Phase':<7}{'a':>8}{'b':>9}{'sigma':>9}{'Samples':>9}")
+    print("-"*80)
+    for (depth, phase), pairs in sorted(samples.items()):
+        if len(pairs) < MIN_SAMPLES:
+            continue
+        a, b, sigma, n = fit(pairs)
+        fits.setdefault(depth, (shallow_depth(depth), {}))[1][phase] = (a, b, sigma, n)
+        print(f"{depth:<8}{shallow_depth(depth):<9}{phase:<7}{a:>8.3f}{b:>9.2f}{sigma:>9.2f}{n:>9}")
+
+    save_probcut(profile, fits, path, PHASE_EMPTIES,
+                 description=f"{len(positions)} self-play positions ({MIN_EMPTIES}-{MAX_EMPTIES} "
+                             f"empties), depths {PROBCUT_MIN_DEPTH}-{max_depth}, seed {seed}")
+    print("-"*80)
+    print(f"Saved to {path} ({time.perf_counter() - start:.0f}s)")
+    print("="*80)
+    return fits
+
+
+if __name__ == "__main__":
+    calibrate(sys.argv[1] if len(sys.argv) > 1 else 'StandardEvaluator',
+              int(sys.argv[2]) if len(sys.argv) > 2 else 200,
+              int(sys.argv[3]) if len(sys.argv) > 3 else 8,
+              sys.argv[4] if len(sys.argv) > 4 else PROBCUT_FILE)
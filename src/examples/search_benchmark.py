@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Search Node-Count Benchmark
+
+Compares GrandmasterEngine node counts with and without Principal
+Variation Search and root aspiration windows on a fixed position set.
+Node counts are deterministic, so the comparison is independent of the
+machine; best values must agree between the variants.
+
+Usage:
+    python search_benchmark.py [depth]
+"""
+
+import sys
+import os
+import io
+import random
+import contextlib
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from Reversi.BitboardGame import BitboardGame
+from Reversi.Game import Move
+from AI.GrandmasterEngine import GrandmasterEngine, ASPIRATION_WINDOW
+
+# Opening lines plus seeded random-play midgame positions
+OPENING_LINES = [
+    ['F5', 'F6', 'E6', 'F4', 'C3'],
+    ['F5', 'D6', 'C3', 'D3', 'C4'],
+    ['F5', 'F4', 'E3', 'F6', 'D3'],
+    ['F5', 'D6', 'C5', 'F4', 'E3', 'F6'],
+]
+RANDOM_SEEDS = [1, 2, 3, 4]
+RANDOM_PLIES = 20
+
+# (label, use_pvs, aspiration_window)
+VARIANTS = [
+    ('alpha-beta', False, 0),
+    ('PVS', True, 0),
+    ('PVS+aspiration', True, ASPIRATION_WINDOW),
+]
+
+
+def position_set():
+    """Yield (name, BitboardGame) for the benchmark positions"""
+    for line in OPENING_LINES:
+        game = BitboardGame()
+        for name in line:
+            game.move(Move(ord(name[0]) - 64, int(name[1])))
+        yield '-'.join(line), game
+
+    for seed in RANDOM_SEEDS:
+        rnd = random.Random(seed)
+        game = BitboardGame()
+        for _ in range(RANDOM_PLIES):
+            move_list = game.get_move_list()
+            if not move_list:
+                game.pass_turn()
+                continue
+            game.move(rnd.choice(move_list))
+        yield f'random-{seed}', game
+
+
+def search(game, depth, use_pvs, aspiration_window):
+    """Iterative deepening to `depth` with a fresh engine: (nodes, value)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = GrandmasterEngine(num_workers=1)
+        engine.use_pvs = use_pvs
+        engine.aspiration_window = aspiration_window
+        root_squares = engine.order_root_moves(game, game.legal_squares())
+        nodes = 0
+        value = None
+        for iteration in range(1, depth + 1):
+            engine.nodes = 0
+            _, value = engine.search_root(game, iteration, root_squares, value)
+            nodes += engine.nodes
+    return nodes, value
+
+
+def run_benchmark(depth=6):
+    """Print the node counts of every variant on every position"""
+    print("="*80)
+    print(f"SEARCH NODE-COUNT BENCHMARK (iterative deepening to depth {depth})")
+    print("="*80)
+    header = f"{'Position':<28}" + ''.join(f"{label:>17}" for label, _, _ in VARIANTS)
+    print(header)
+    print("-"*80)
+
+    totals = [0] * len(VARIANTS)
+    for name, game in position_set():
+        results = [search(game, depth, use_pvs, window) for _, use_pvs, window in VARIANTS]
+        values = {value for _, value in results}
+        assert len(values) == 1, f"{name}: variants disagree on the value {values}"
+
+        row = f"{name:<28}"
+        for i, (nodes, _) in enumerate(results):
+            totals[i] += nodes
+            row += f"{nodes:>17,}"
+        print(row)
+
+    print("-"*80)
+    print(f"{'Total':<28}" + ''.join(f"{total:>17,}" for total in totals))
+    print(f"{'vs alpha-beta':<28}" + ''.join(f"{total / totals[0]:>16.1%} " for total in totals))
+    print("="*80)
+    return totals
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 6)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+YBWC Speedup Benchmark
+
+Measures the speedup curve of the YBWC split-point engine: wall time
+and node count on the search benchmark's position set for 2, 4, 8 and
+16 workers, relative to the same search run sequentially (1 worker).
+
+Speedup only shows with at least as many idle cores as workers; on
+fewer cores the curve measures the parallel overhead instead. The node
+overhead column (extra nodes searched in parallel) is machine
+independent apart from timing noise in which helper finishes first.
+
+Usage:
+    python ybwc_benchmark.py [depth] [workers ...]
+"""
+
+import sys
+import os
+import io
+import time
+import contextlib
+from multiprocessing import cpu_count
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from AI.YBWCBitboardMinimaxEngine import YBWCBitboardMinimaxEngine
+from AI.WorkerPool import get_pool_manager
+from examples.search_benchmark import position_set
+
+WORKER_COUNTS = [2, 4, 8, 16]
+
+
+def run_suite(num_workers, depth):
+    """Search every position with a fresh engine: (seconds, nodes, moves)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        engine = YBWCBitboardMinimaxEngine(num_workers=num_workers)
+    if num_workers > 1:
+        get_pool_manager().resize(num_workers)
+        engine._get_lease()  # pool start-up is not timed
+    seconds = 0.0
+    nodes = 0
+    moves = []
+    try:
+        for _, game in position_set():
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                moves.append(engine.get_best_move(game, depth))
+                seconds += time.perf_counter() - start
+            nodes += engine.nodes
+    finally:
+        engine.close_pool()
+    return seconds, nodes, moves
+
+
+def run_benchmark(depth=6, worker_counts=WORKER_COUNTS):
+    """Print the speedup curve; returns {workers: (seconds, nodes)}"""
+    print("="*80)
+    print(f"YBWC SPEEDUP BENCHMARK (depth {depth}, {cpu_count()} CPU cores)")
+    print("="*80)
+    print(f"{'Workers':<10}{'Time(s)':>10}{'Nodes':>14}{'Speedup':>10}"
+          f"{'Efficiency':>12}{'Node overhead':>16}")
+    print("-"*80)
+
+    results = {}
+    base_seconds, base_nodes, _ = results[1] = run_suite(1, depth)
+    print(f"{1:<10}{base_seconds:>10.2f}{base_nodes:>14,}{1.0:>9.2f}x{1.0:>11.0%}{0.0:>15.0%}")
+
+    for workers in worker_counts:
+        seconds, nodes, _ = results[workers] = run_suite(workers, depth)
+        speedup = base_seconds / seconds
+        print(f"{workers:<10}{seconds:>10.2f}{nodes:>14,}{speedup:>9.2f}x"
+              f"{speedup / workers:>11.0%}{nodes / base_nodes - 1:>15.0%}")
+
+    print("-"*80)
+    print("Speedup curve:")
+    for workers in [1] + list(worker_counts):
+        speedup = base_seconds / results[workers][0]
+        print(f"  {workers:>3} {'#' * max(1, round(speedup * 10))} {speedup:.2f}x")
+    if cpu_count() < max(worker_counts) + 1:
+        print(f"Note: {cpu_count()} core(s) here; a speedup with N workers "
+              f"needs N + 1 cores (workers and master)")
+    print("="*80)
+    return {workers: (seconds, nodes) for workers, (seconds, nodes, _) in results.items()}
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 6,
+                  [int(arg) for arg in sys.argv[2:]] or WORKER_COUNTS)
@@ -279,75 +279,156 @@ def run_game(menu_result, loaded_game_data=None, view_class=None):
     running = True
     game_ended = False  # Track if game ended naturally
     
-    while running:
-        # Check if game is finished
-        if g.is_finish():
-            game_ended = True
-            break
-            
-        turn = g.get_turn()
-        player = players[turn]
-        
-        # Compact player notification (inline with move later)
-        # print(f"{player.get_name()} is moving...")  # Moved to be inline
-        
-        moves = g.get_move_list()
-        
-        if len(moves) > 0:
-            # Import board position
-            c.importModel(g.export_str())
-            
-            # Show all available moves (unified method - no duplication)
-            c.display_available_moves(g, moves, turn)
+    try:
+        while running:
+            # Check if game is finished
+            if g.is_finish():
+                game_ended = True
+                break
+                
+            turn = g.get_turn()
+            player = players[turn]
             
-            # Set current turn for indicator
-            c.setCurrentTurn(turn)
+            # Compact player notification (inline with move later)
+            # print(f"{player.get_name()} is moving...")  # Moved to be inline
             
-            # Render board
-            c.renderModel()
-            c.cursorWait()
+            moves = g.get_move_list()
             
-            # Compact game info on single line
-            from ui.implementations.terminal import TerminalBoardView
-            if isinstance(c.view, TerminalBoardView):
-                # Terminal mode: single-line info with extra newline after for spacing
-                if last_move:
-                    print(f"Last: {last_move}  |  History: {game_history if game_history else '(start)'}\n")
+            if len(moves) > 0:
+                # Import board position
+                c.importModel(g.export_str())
+                
+                # Show all available moves (unified method - no duplication)
+                c.display_available_moves(g, moves, turn)
+                
+                # Set current turn for indicator
+                c.setCurrentTurn(turn)
+                
+                # Render board
+                c.renderModel()
+                c.cursorWait()
+                
+                # Compact game info on single line
+                from ui.implementations.terminal import TerminalBoardView
+                if isinstance(c.view, TerminalBoardView):
+                    # Terminal mode: single-line info with extra newline after for spacing
+                    if last_move:
+                        print(f"Last: {last_move}  |  History: {game_history if game_history else '(start)'}\n")
+                    else:
+                        print(f"History: {game_history if game_history else '(start)'}\n")
                 else:
-                    print(f"History: {game_history if game_history else '(start)'}\n")
-            else:
-                # Pygame mode: compact single-line info
-                if last_move and game_history:
-                    print(f"Move: {last_move}  |  History: {game_history}")
-                elif game_history:
-                    print(f"History: {game_history}")
-                elif last_move:
-                    print(f"Move: {last_move}")
+                    # Pygame mode: compact single-line info
+                    if last_move and game_history:
+                        print(f"Move: {last_move}  |  History: {game_history}")
+                    elif game_history:
+                        print(f"History: {game_history}")
+                    elif last_move:
+                        print(f"Move: {last_move}")
+                    
+                    # Instructions for cursor navigation (pygame only)
+                    if isinstance(player, HumanPlayer):
+                        print("\nControls:")
+                        print("- Click to select a move")
+                        print("- Press 'C' to toggle cursor navigation mode")
+                        print("- Arrow keys: Move cursor (in cursor mode)")
+                        print("- ENTER or SPACE: Select move at cursor")
+                        print("- ESC: Pause menu (save/load), Q: Quit")
                 
-                # Instructions for cursor navigation (pygame only)
-                if isinstance(player, HumanPlayer):
-                    print("\nControls:")
-                    print("- Click to select a move")
-                    print("- Press 'C' to toggle cursor navigation mode")
-                    print("- Arrow keys: Move cursor (in cursor mode)")
-                    print("- ENTER or SPACE: Select move at cursor")
-                    print("- ESC: Pause menu (save/load), Q: Quit")
-            
-            # Get move
-            from ui.implementations.terminal import TerminalHumanPlayer
-            is_terminal_human = isinstance(player, TerminalHumanPlayer)
+                # Get move
+                from ui.implementations.terminal import TerminalHumanPlayer
+                is_terminal_human = isinstance(player, TerminalHumanPlayer)
+                
+                if not is_terminal_human:
+                    # For non-terminal players, show player name and move
+                    print(f"[{player.get_name()}]", end=" ", flush=True)
+                
+                move = player.get_move(g, moves, c)
+                
+                if not is_terminal_human:
+                    # For non-terminal players, print move (terminal human already printed it)
+                    print(f"{move}", end="  ")
+                
+                # Check if player requested pause
+                if c.should_pause:
+                    c.should_pause = False  # Reset flag
+                    pause_menu = PauseMenu()
+                    pause_result = pause_menu.run()
+                    
+                    # Handle pause menu action
+                    continue_game, action_result, game_history = handle_pause_menu_action(
+                        pause_result, g, c, game_history, players
+                    )
+                    
+                    if not continue_game:
+                        if action_result == "load":
+                            # Return to main to reload game
+                            return ("load", game_history)
+                        else:
+                            return action_result
+                    
+                    # Re-render board after pause menu actions
+                    c.view.refresh()  # Clear screen and redraw grid
+                    c.importModel(g.export_str())
+                    moves = g.get_move_list()  # Refresh moves (may have changed due to undo)
+                    
+                    # Show moves (unified method)
+                    c.display_available_moves(g, moves, g.get_turn())
+                    
+                    c.renderModel()
+                    continue  # Go back to get move again
+                
+                # Check if player wants to exit or return to menu
+                if move is None:
+                    if c.should_return_to_menu:
+                        print("Returning to main menu...")
+                        return "menu"
+                    elif c.should_exit:
+                        print("Game exited by user.")
+                        return "exit"
+                    else:
+                        print("Game exited by user.")
+                        running = False
+                        break
+                
+                # Move
+                g.move(move)
+                
+                # Set last move indicator for visual display
+                c.setLastMove(move.get_x(), move.get_y())
+                
+                # Update game history
+                if turn == 'B':
+                    # is a black move
+                    last_move = str(move).upper()
+                else:
+                    # is a white move
+                    last_move = str(move).lower()
+                
+                game_history += last_move
+                
+                # Move already printed inline above with player name
+                # print(f"move: {move}")  # Removed - redundant
             
-            if not is_terminal_human:
-                # For non-terminal players, show player name and move
-                print(f"[{player.get_name()}]", end=" ", flush=True)
+            else:
+                g.pass_turn()
+                print(f"{player.get_name()} is passing")
+                
+                # Check if both players have no moves (game over)
+                next_moves = g.get_move_list()
+                if len(next_moves) == 0:
+                    print("No moves available for either player. Game over!")
+                    game_ended = True  # Mark as naturally ended
+                    break
             
-            move = player.get_move(g, moves, c)
+            # Check for pause/exit events during AI turns
+            c.check_events()
             
-            if not is_terminal_human:
-                # For non-terminal players, print move (terminal human already printed it)
-                print(f"{move}", end="  ")
+            # Don't exit if game just finished naturally
+            if c.should_exit and not g.is_finish():
+                print("Game exited by user during play.")
+                return "exit"
             
-            # Check if player requested pause
+            # Handle pause request
             if c.should_pause:
                 c.should_pause = False  # Reset flag
                 pause_menu = PauseMenu()
@@ -360,7 +441,6 @@ def run_game(menu_result, loaded_game_data=None, view_class=None):
                 
                 if not continue_game:
                     if action_result == "load":
-                        # Return to main to reload game
                         return ("load", game_history)
                     else:
                         return action_result
@@ -368,95 +448,21 @@ def run_game(menu_result, loaded_game_data=None, view_class=None):
                 # Re-render board after pause menu actions
                 c.view.refresh()  # Clear screen and redraw grid
                 c.importModel(g.export_str())
-                moves = g.get_move_list()  # Refresh moves (may have changed due to undo)
+                moves = g.get_move_list()
                 
                 # Show moves (unified method)
                 c.display_available_moves(g, moves, g.get_turn())
                 
                 c.renderModel()
-                continue  # Go back to get move again
-            
-            # Check if player wants to exit or return to menu
-            if move is None:
-                if c.should_return_to_menu:
-                    print("Returning to main menu...")
-                    return "menu"
-                elif c.should_exit:
-                    print("Game exited by user.")
-                    return "exit"
-                else:
-                    print("Game exited by user.")
-                    running = False
-                    break
-            
-            # Move
-            g.move(move)
-            
-            # Set last move indicator for visual display
-            c.setLastMove(move.get_x(), move.get_y())
-            
-            # Update game history
-            if turn == 'B':
-                # is a black move
-                last_move = str(move).upper()
-            else:
-                # is a white move
-                last_move = str(move).lower()
-            
-            game_history += last_move
             
-            # Move already printed inline above with player name
-            # print(f"move: {move}")  # Removed - redundant
-        
-        else:
-            g.pass_turn()
-            print(f"{player.get_name()} is passing")
-            
-            # Check if both players have no moves (game over)
-            next_moves = g.get_move_list()
-            if len(next_moves) == 0:
-                print("No moves available for either player. Game over!")
-                game_ended = True  # Mark as naturally ended
-                break
-        
-        # Check for pause/exit events during AI turns
-        c.check_events()
-        
-        # Don't exit if game just finished naturally
-        if c.should_exit and not g.is_finish():
-            print("Game exited by user during play.")
-            return "exit"
-        
-        # Handle pause request
-        if c.should_pause:
-            c.should_pause = False  # Reset flag
-            pause_menu = PauseMenu()
-            pause_result = pause_menu.run()
-            
-            # Handle pause menu action
-            continue_game, action_result, game_history = handle_pause_menu_action(
-                pause_result, g, c, game_history, players
-            )
+            # Removed duplicate check - already handled above
             
-            if not continue_game:
-                if action_result == "load":
-                    return ("load", game_history)
-                else:
-                    return action_result
-            
-            # Re-render board after pause menu actions
-            c.view.refresh()  # Clear screen and redraw grid
-            c.importModel(g.export_str())
-            moves = g.get_move_list()
-            
-            # Show moves (unified method)
-            c.display_available_moves(g, moves, g.get_turn())
-            
-            c.renderModel()
-        
-        # Removed duplicate check - already handled above
-        
-        clock.tick(60)  # Limit to 60 FPS
+            clock.tick(60)  # Limit to 60 FPS
+    finally:
+        # No more searching on the opponent's time, however the game is left
+        for player in players.values():
+            if hasattr(player, 'stop_pondering'):
+                player.stop_pondering()
     
     # Handle game finish
     if game_ended or g.is_finish():
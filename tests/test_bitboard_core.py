@@ -0,0 +1,227 @@
+#!/usr/bin/env python
+"""
+Test script for BitboardGame core operations
+
+Usage:
+    python test_bitboard_core.py
+"""
+
+import sys
+import os
+import random
+
+# Add src to path (now from tests/ subdirectory)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from Reversi.Game import Game
+from Reversi.BitboardGame import BitboardGame, get_moves
+from Reversi.BitboardTables import zobrist_key
+
+
+def _matrix_str(game):
+    """Flatten the 8x8 area of the virtual matrix into a string"""
+    return ''.join(game.matrix[y][x] for y in range(1, 9) for x in range(1, 9))
+
+
+def _random_games(count, seed=42):
+    """Yield (game, move, rnd) after every move of `count` random games"""
+    for n in range(count):
+        rnd = random.Random(seed + n)
+        game = BitboardGame()
+        while not game.is_finish():
+            move_list = game.get_move_list()
+            if not move_list:
+                game.pass_turn()
+                continue
+            move = rnd.choice(move_list)
+            game.move(move)
+            yield game, move, rnd
+
+
+def test_lazy_matrix():
+    """Virtual matrix is built on demand and follows move/undo"""
+    print("="*80)
+    print("TEST: Lazy Virtual Matrix")
+    print("="*80)
+
+    game = BitboardGame()
+    assert game._matrix_cache is None, "matrix built before first access"
+    assert _matrix_str(game) == game.export_str().replace('\n', '')
+
+    # Cached until the next state change
+    matrix = game.matrix
+    assert game.matrix is matrix
+
+    for game, move, rnd in _random_games(20):
+        assert _matrix_str(game) == game.export_str().replace('\n', '')
+        if rnd.random() < 0.3:
+            game.undo_move()
+            assert _matrix_str(game) == game.export_str().replace('\n', '')
+            game.move(move)
+
+    print("TEST PASSED ✓\n")
+
+
+def test_incremental_zobrist():
+    """Zobrist key kept by move/undo/pass matches a full recomputation"""
+    print("="*80)
+    print("TEST: Incremental Zobrist Hashing")
+    print("="*80)
+
+    game = BitboardGame()
+    assert game.get_zobrist_hash() == zobrist_key(game.black, game.white, game.turn)
+
+    seen = {}
+    for game, move, rnd in _random_games(20):
+        key = game.get_zobrist_hash()
+        assert key == zobrist_key(game.black, game.white, game.turn)
+        assert 0 <= key < 1 << 64
+        # Same key must always mean same position
+        position = (game.black, game.white, game.turn)
+        assert seen.setdefault(key, position) == position
+
+        # Pass toggles side to move only
+        game.pass_turn()
+        assert game.get_zobrist_hash() == zobrist_key(game.black, game.white, game.turn)
+        assert game.get_zobrist_hash() != key
+        game.undo_move()
+        assert game.get_zobrist_hash() == key
+
+        if rnd.random() < 0.3:
+            game.undo_move()
+            assert game.get_zobrist_hash() == zobrist_key(game.black, game.white, game.turn)
+            game.move(move)
+            assert game.get_zobrist_hash() == key
+
+    print("TEST PASSED ✓\n")
+
+
+def test_moves_match_reference():
+    """Ray-table move generation and flips agree with the array Game"""
+    print("="*80)
+    print("TEST: Move Generation vs Reference Game")
+    print("="*80)
+
+    for seed in range(50):
+        rnd = random.Random(seed)
+        standard = Game(8)
+        bitboard = BitboardGame()
+        while True:
+            expected = sorted(str(m) for m in standard.get_move_list())
+            assert sorted(str(m) for m in bitboard.get_move_list()) == expected
+            if not expected:
+                standard.switch_player()
+                bitboard.pass_turn()
+                if not standard.get_move_list():
+                    break
+                continue
+            move = rnd.choice(standard.get_move_list())
+            standard.move(move)
+            bitboard.move(move)
+            assert bitboard.export_str().replace('\n', '') == standard.export_str()
+            assert (bitboard.black_cnt, bitboard.white_cnt) == (standard.black_cnt, standard.white_cnt)
+        assert bitboard.is_finish()
+
+    print("TEST PASSED ✓\n")
+
+
+def test_make_unmake():
+    """Integer-square make/unmake agrees with move/undo_move"""
+    print("="*80)
+    print("TEST: Integer-Square make/unmake")
+    print("="*80)
+
+    for game, move, rnd in _random_games(20):
+        state = (game.black, game.white, game.turn, game.turn_cnt,
+                 game.black_cnt, game.white_cnt, game.zobrist, game.history)
+        stack_size = len(game.move_stack)
+
+        legal = list(game.legal_squares())
+        assert [game.square_to_move(sq) for sq in legal] == game.get_move_list()
+
+        for square in legal:
+            assert game.move_to_square(game.square_to_move(square)) == square
+
+            flips = game.make(square)
+            assert flips, "legal move must flip"
+            made = (game.black, game.white, game.turn, game.zobrist)
+            assert game.zobrist == zobrist_key(game.black, game.white, game.turn)
+            game.unmake(square, flips)
+
+            # Same result as the Move-based API
+            game.move(game.square_to_move(square))
+            assert (game.black, game.white, game.turn, game.zobrist) == made
+            game.undo_move()
+
+        game.make_pass()
+        game.unmake_pass()
+
+        assert (game.black, game.white, game.turn, game.turn_cnt,
+                game.black_cnt, game.white_cnt, game.zobrist, game.history) == state
+        assert len(game.move_stack) == stack_size
+
+    print("TEST PASSED ✓\n")
+
+
+def test_mobility_memo():
+    """Memoized move bitboards follow every state change"""
+    print("="*80)
+    print("TEST: Per-Position Mobility Memo")
+    print("="*80)
+
+    def fresh(game):
+        player, opponent = game._get_player_boards()
+        return get_moves(player, opponent), get_moves(opponent, player)
+
+    for game, move, rnd in _random_games(20):
+        assert game.get_mobility() == fresh(game)
+        assert game.get_valid_moves() == fresh(game)[0]
+        assert game.get_opponent_moves() == fresh(game)[1]
+
+        # Turn switches without a board change reuse the memo safely
+        game.switch_player()
+        assert game.get_mobility() == fresh(game)
+        game.switch_player()
+
+        square = next(game.legal_squares(), None)
+        if square is not None:
+            flips = game.make(square)
+            assert game.get_mobility() == fresh(game)
+            game.unmake(square, flips)
+            assert game.get_mobility() == fresh(game)
+
+        assert game.is_finish() == (not any(fresh(game)))
+
+    print("TEST PASSED ✓\n")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n" + "="*80)
+    print("BITBOARD CORE - TEST SUITE")
+    print("="*80 + "\n")
+
+    try:
+        test_moves_match_reference()
+        test_lazy_matrix()
+        test_incremental_zobrist()
+        test_make_unmake()
+        test_mobility_memo()
+
+        print("="*80)
+        print("ALL TESTS PASSED ✅")
+        print("="*80 + "\n")
+        return True
+
+    except Exception as e:
+        print("\n" + "="*80)
+        print(f"❌ TEST FAILED: {e}")
+        print("="*80 + "\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,1294 @@
+#!/usr/bin/env python
+"""
+Test script for the bitboard search engines and their search structures
+
+Usage:
+    python test_search_engines.py
+"""
+
+import sys
+import os
+import io
+import time
+import random
+import contextlib
+
+# Add src to path (now from tests/ subdirectory)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from Reversi.BitboardGame import BitboardGame, popcount, squares
+from Reversi.Game import Move
+from AI.BitboardMinimaxEngine import BitboardMinimaxEngine, INFINITY
+from AI.GrandmasterEngine import GrandmasterEngine
+from AI.TranspositionTable import (
+    TranspositionTable, SharedTranspositionTable, TT_EXACT, TT_LOWER, TT_UPPER, NO_MOVE
+)
+from AI.EndgameSolver import EndgameSolver, stable_discs, WIN, DRAW, LOSS
+
+
+def _position(moves=('F5', 'F6', 'E6', 'F4', 'C3')):
+    """BitboardGame after the given opening moves"""
+    game = BitboardGame()
+    for name in moves:
+        game.move(Move(ord(name[0]) - 64, int(name[1])))
+    return game
+
+
+def _endgame_position(seed, empties):
+    """Random-play BitboardGame with `empties` empty squares, game not over"""
+    while True:
+        rnd = random.Random(seed)
+        game = BitboardGame()
+        while 64 - popcount(game.black | game.white) > empties and not game.is_finish():
+            move_list = game.get_move_list()
+            if not move_list:
+                game.pass_turn()
+                continue
+            game.move(rnd.choice(move_list))
+        if not game.is_finish():
+            return game
+        seed += 1000
+
+
+def _minimax_score(game):
+    """Exact final disc differential by plain negamax (reference)"""
+    moves = game.get_valid_moves()
+    if not moves:
+        player, opponent = game._get_player_boards()
+        if not game.get_opponent_moves():
+            return popcount(player) - popcount(opponent)
+        game.make_pass()
+        score = -_minimax_score(game)
+        game.unmake_pass()
+        return score
+    best = None
+    for square in squares(moves):
+        flips = game.make(square)
+        score = -_minimax_score(game)
+        game.unmake(square, flips)
+        best = score if best is None else max(best, score)
+    return best
+
+
+def _quiet(func, *args, **kwargs):
+    """Call func with the engines' reasoning output suppressed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func(*args, **kwargs)
+
+
+def test_transposition_table():
+    """Packed entries round-trip and the table never grows"""
+    print("="*80)
+    print("TEST: Bounded Transposition Table")
+    print("="*80)
+
+    tt = TranspositionTable(size_mb=1)
+    entries = len(tt)
+    assert entries == 65536, f"1 MB should hold 65536 entries, got {entries}"
+
+    key = 0xDEADBEEFCAFEBABE
+    assert tt.probe(key) is None
+
+    tt.store(key, 5, -1234, TT_UPPER, 27)
+    assert tt.probe(key) == (5, -1234, TT_UPPER, 27)
+
+    # Storing without a move keeps the previous best move
+    tt.store(key, 6, 10000, TT_EXACT)
+    assert tt.probe(key) == (6, 10000, TT_EXACT, 27)
+
+    # Full-key verification: same bucket, different key
+    assert tt.probe(key ^ (1 << 63)) is None
+
+    # Fill far beyond capacity: size stays fixed
+    for i in range(entries * 2):
+        tt.store(i * 0x9E3779B97F4A7C15, i & 31, i & 0xFFF, TT_LOWER, i & 63)
+    assert len(tt) == entries
+    assert len(tt.keys) == entries and len(tt.data) == entries
+
+    print("TEST PASSED ✓\n")
+
+
+def test_replacement_policy():
+    """Depth-preferred slot keeps deep results; always-replace slot takes the rest"""
+    print("="*80)
+    print("TEST: Two-Tier Replacement Policy")
+    print("="*80)
+
+    tt = TranspositionTable(size_mb=1)
+    stride = tt.bucket_mask + 1  # keys differing only above the index bits
+    deep, shallow, newer = 5, 5 + stride, 5 + 2 * stride
+
+    tt.store(deep, 10, 1, TT_EXACT, 1)
+    tt.store(shallow, 2, 2, TT_EXACT, 2)
+    assert tt.probe(deep) == (10, 1, TT_EXACT, 1)
+    assert tt.probe(shallow) == (2, 2, TT_EXACT, 2)
+
+    # Another shallow entry evicts the always-replace slot only
+    tt.store(newer, 3, 3, TT_EXACT, 3)
+    assert tt.probe(deep) is not None
+    assert tt.probe(shallow) is None
+    assert tt.probe(newer) == (3, 3, TT_EXACT, 3)
+
+    # Next search: the deep entry is stale and may be replaced
+    tt.new_search()
+    tt.store(shallow, 1, 4, TT_LOWER, NO_MOVE)
+    assert tt.probe(shallow) == (1, 4, TT_LOWER, NO_MOVE)
+    assert tt.probe(deep) is not None, "old deep entry demoted, not lost"
+
+    print("TEST PASSED ✓\n")
+
+
+def test_table_persists_across_moves():
+    """Search results carry over to the next get_best_move"""
+    print("="*80)
+    print("TEST: Transposition Table Persistence")
+    print("="*80)
+
+    factories = (
+        lambda: BitboardMinimaxEngine(tt_size_mb=4),
+        lambda: _quiet(GrandmasterEngine, num_workers=1, tt_size_mb=4),
+    )
+    for factory in factories:
+        engine = factory()
+        first = _quiet(engine.get_best_move, _position(), 5)
+        first_nodes = engine.nodes
+        second = _quiet(engine.get_best_move, _position(), 5)
+        assert str(first) == str(second)
+        assert engine.nodes < first_nodes, \
+            f"{type(engine).__name__}: {engine.nodes} nodes >= {first_nodes}"
+
+        # A fresh engine agrees with the warm one
+        assert str(_quiet(factory().get_best_move, _position(), 5)) == str(first)
+
+    print("TEST PASSED ✓\n")
+
+
+def test_iterative_deepening():
+    """Budgeted search aborts cleanly and returns the last completed depth"""
+    print("="*80)
+    print("TEST: Iterative Deepening with Time/Node Budget")
+    print("="*80)
+
+    factories = (
+        lambda: BitboardMinimaxEngine(tt_size_mb=4),
+        lambda: _quiet(GrandmasterEngine, num_workers=1, tt_size_mb=4),
+    )
+    for factory in factories:
+        # Node budget: deterministic, cut in the middle of an iteration
+        engine = factory()
+        game = _position()
+        state = (game.black, game.white, game.turn, game.zobrist, len(game.move_stack))
+        move = _quiet(engine.get_best_move, game, None, node_limit=3000)
+        assert move is not None
+        assert (game.black, game.white, game.turn, game.zobrist, len(game.move_stack)) == state
+        assert engine.nodes < 3000 + 256, "budget checked too rarely"
+        depth = engine.completed_depth
+        assert depth >= 2
+
+        # As good as a fixed-depth search at the completed depth
+        def score(move):
+            checker = factory()
+            game = _position()
+            game.make(game.move_to_square(move))
+            return -checker.alphabeta(game, depth - 1, -INFINITY, INFINITY)
+        expected = _quiet(factory().get_best_move, _position(), depth)
+        assert score(move) == score(expected), f"{move} worse than {expected} at depth {depth}"
+
+        # Maximum depth caps the iterations
+        engine = factory()
+        _quiet(engine.get_best_move, _position(), 3, node_limit=10 ** 9)
+        assert engine.completed_depth == 3
+
+        # Time budget is honoured
+        engine = factory()
+        start = time.perf_counter()
+        move = _quiet(engine.get_best_move, _position(), None, time_ms=200)
+        elapsed = time.perf_counter() - start
+        assert move is not None and elapsed < 0.5, f"{elapsed:.2f}s for a 200 ms budget"
+
+    print("TEST PASSED ✓\n")
+
+
+def test_time_control_player():
+    """AIPlayer/presets accept time_ms in place of depth"""
+    print("="*80)
+    print("TEST: Time Control in AIPlayer and Presets")
+    print("="*80)
+
+    from Reversi.Game import Game
+    from Players.ai.ai_player import AIPlayer
+    from Players.presets import PresetFactory
+    from AI.features.iterative_deepening_decorator import IterativeDeepeningDecorator
+    from AI.implementations.standard.minimax_engine import MinimaxEngine
+    from AI.implementations.bitboard.bitboard_engine import BitboardEngine
+
+    # Default depth is unchanged
+    assert AIPlayer(MinimaxEngine()).depth == 6
+
+    # Native time control: engine used as is
+    player = AIPlayer(BitboardEngine(), time_ms=100)
+    assert isinstance(player.engine, BitboardEngine) and player.depth is None
+
+    # Generic engine: wrapped with iterative deepening
+    player = AIPlayer(MinimaxEngine(), time_ms=100)
+    assert isinstance(player.engine, IterativeDeepeningDecorator)
+
+    for player in (AIPlayer(BitboardEngine(), time_ms=100), player,
+                   _quiet(PresetFactory.create, 'Apocalypse', time_ms=100)):
+        game = Game(8)
+        move = _quiet(player.get_move, game, game.get_move_list(), None)
+        assert str(move) in [str(m) for m in game.get_move_list()]
+
+    print("TEST PASSED ✓\n")
+
+
+def test_endgame_solver():
+    """Exact solver agrees with plain negamax and plays the best move"""
+    print("="*80)
+    print("TEST: Exact Endgame Solver")
+    print("="*80)
+
+    solver = EndgameSolver(tt_size_mb=1)
+    for seed in range(12):
+        game = _endgame_position(seed, 6 + seed % 3)
+        state = (game.black, game.white, game.turn)
+        square, score = solver.solve(game)
+        assert (game.black, game.white, game.turn) == state
+        assert score == _minimax_score(game), f"seed {seed}: {score}"
+
+        # The chosen move achieves the score
+        flips = game.make(square)
+        assert -_minimax_score(game) == score
+        game.unmake(square, flips)
+
+    # Stable discs never flip for the rest of the game
+    for seed in range(20):
+        rnd = random.Random(seed)
+        game = BitboardGame()
+        marked = []
+        while not game.is_finish():
+            move_list = game.get_move_list()
+            if not move_list:
+                game.pass_turn()
+                continue
+            game.move(rnd.choice(move_list))
+            occupied = game.black | game.white
+            marked.append((stable_discs(game.black, occupied), 'B'))
+            marked.append((stable_discs(game.white, occupied), 'W'))
+            for stable, color in marked:
+                assert stable & ~(game.black if color == 'B' else game.white) == 0
+
+    print("TEST PASSED ✓\n")
+
+
+def test_endgame_trigger():
+    """GrandmasterEngine and the decorator hand endgames to the solver"""
+    print("="*80)
+    print("TEST: Endgame Solver Trigger")
+    print("="*80)
+
+    from Reversi.Game import Game
+    from AI.features.endgame_solver_decorator import EndgameSolverDecorator
+    from AI.implementations.standard.minimax_engine import MinimaxEngine
+
+    # Reference scores from a separate solver (checked against negamax above)
+    reference = EndgameSolver(tt_size_mb=1)
+
+    engine = _quiet(GrandmasterEngine, num_workers=1, endgame_empties=12)
+    for seed in range(4):
+        game = _endgame_position(100 + seed, 12)
+        move = _quiet(engine.get_best_move, game, 2)
+        _, best = reference.solve(game)
+        game.move(move)
+        assert -reference.solve(game)[1] == best, "Grandmaster missed the perfect move"
+
+    # Decorator works on the array Game too
+    decorated = EndgameSolverDecorator(MinimaxEngine(), trigger=10)
+    bitboard = _endgame_position(200, 9)
+    game = Game(8)
+    game.import_str(bitboard.export_str().replace('\n', ''))
+    game.turn = bitboard.turn
+    move = _quiet(decorated.get_best_move, game, 2)
+    assert str(move) in [str(m) for m in game.get_move_list()]
+
+    # A solve out of nodes leaves only the rest of the budget to the fallback
+    budgets = []
+    fallback = MinimaxEngine()
+    fallback.get_best_move = lambda game, depth, **kwargs: budgets.append(kwargs['node_limit'])
+    decorated = EndgameSolverDecorator(fallback, trigger=16)
+    _quiet(decorated.get_best_move, _endgame_position(210, 16), 2, node_limit=5000)
+    assert decorated.solver.nodes >= 5000 / 2, "Solver stopped far below its budget"
+    assert budgets == [max(1, 5000 - decorated.solver.nodes)], budgets
+
+    print("TEST PASSED ✓\n")
+
+
+def test_wld_solver():
+    """Win/loss/draw mode agrees with the exact score and is reported in statistics"""
+    print("="*80)
+    print("TEST: Win/Loss/Draw Solver Mode")
+    print("="*80)
+
+    def sign(score):
+        return WIN if score > 0 else LOSS if score < 0 else DRAW
+
+    solver = EndgameSolver(tt_size_mb=1)
+    reference = EndgameSolver(tt_size_mb=1)
+    for seed in range(10):
+        game = _endgame_position(300 + seed, 10 + seed % 3)
+        square, outcome = solver.solve_wld(game)
+        _, score = reference.solve(game)
+        assert outcome == sign(score), f"seed {seed}: {outcome} vs {score}"
+        assert solver.nodes <= reference.nodes
+
+        # The chosen move keeps the outcome
+        flips = game.make(square)
+        assert sign(-reference.solve(game)[1]) == outcome
+        game.unmake(square, flips)
+
+    # WLD before exact: kind of result exposed by the engine wrapper
+    from AI.implementations.grandmaster.grandmaster_engine import GrandmasterEngine as Wrapper
+    engine = _quiet(Wrapper, {'endgame_empties': 8, 'wld_empties': 12})
+    kinds = set()
+    for seed, empties in ((400, 12), (401, 12), (402, 8), (403, 14)):
+        game = _endgame_position(seed, empties)
+        _, score = reference.solve(game)
+        move = _quiet(engine.get_best_move, game, 2)
+        stats = engine.get_statistics()
+        kinds.add(stats['result_kind'])
+        if empties > 12:
+            assert stats['result_kind'] == 'heuristic' and stats['result_value'] is None
+        elif empties > 8:
+            assert stats['result_kind'] == 'wld' and stats['result_value'] == sign(score)
+            game.move(move)
+            assert score < 0 or sign(-reference.solve(game)[1]) == sign(score)
+        else:
+            assert stats['result_kind'] == 'exact' and stats['result_value'] == score
+    assert kinds == {'wld', 'exact', 'heuristic'}
+
+    print("TEST PASSED ✓\n")
+
+
+def test_parallel_endgame_solver():
+    """Split-point endgame solve agrees with the sequential solver"""
+    print("="*80)
+    print("TEST: Parallel Endgame Solver")
+    print("="*80)
+
+    from AI.ParallelEndgameSolver import ParallelEndgameSolver
+
+    reference = EndgameSolver(tt_size_mb=1)
+    solver = ParallelEndgameSolver(tt_size_mb=1, num_workers=3, parallel_empties=11,
+                                   split_empties=10)
+    try:
+        splits = 0
+        for seed in range(4):
+            game = _endgame_position(300 + seed, 12)
+            state = (game.black, game.white, game.turn)
+            square, score = solver.solve(game)
+            splits += solver.splits
+            assert (game.black, game.white, game.turn) == state
+            assert score == reference.solve(game)[1], f"seed {seed}: {score}"
+
+            # The chosen move achieves the score
+            flips = game.make(square)
+            assert -reference.solve(game)[1] == score
+            game.unmake(square, flips)
+
+            # Win/loss/draw: a proven win cancels the remaining siblings
+            _, outcome = solver.solve_wld(game)
+            assert outcome == (WIN if score > 0 else LOSS if score < 0 else DRAW)
+        assert splits > 0, "solves were split over the workers"
+        print(f"  {splits} split points")
+
+        # Below parallel_empties the sequential solver runs unchanged
+        solver.solve(_endgame_position(310, 9))
+        assert solver.splits == 0
+    finally:
+        solver.close_pool()
+    assert solver._lease is None
+
+    print("TEST PASSED ✓\n")
+
+
+def test_principal_variation_search():
+    """PVS and aspiration windows find the alpha-beta value with fewer nodes"""
+    print("="*80)
+    print("TEST: Principal Variation Search with Aspiration Windows")
+    print("="*80)
+
+    openings = (('F5', 'F6', 'E6', 'F4', 'C3'), ('F5', 'D6', 'C3', 'D3', 'C4'),
+                ('F5', 'D6', 'C5', 'F4', 'E3', 'F6'))
+    totals = {}
+    for use_pvs, window in ((False, 0), (True, 0), (True, 60)):
+        nodes = 0
+        values = []
+        for moves in openings:
+            engine = _quiet(GrandmasterEngine, num_workers=1, tt_size_mb=4)
+            engine.use_pvs = use_pvs
+            engine.aspiration_window = window
+            game = _position(moves)
+            root_squares = engine.order_root_moves(game, game.legal_squares())
+            value = None
+            for depth in range(1, 7):
+                engine.nodes = 0
+                _, value = engine.search_root(game, depth, root_squares, value)
+                nodes += engine.nodes
+            values.append(value)
+
+            # A window around a wrong guess still converges to the value
+            if window:
+                engine.nodes = 0
+                assert engine.search_root(game, 6, root_squares, value + 500)[1] == value
+                assert engine.search_root(game, 6, root_squares, value - 500)[1] == value
+        totals[use_pvs, window] = (nodes, values)
+
+    plain_nodes, plain_values = totals[False, 0]
+    for (use_pvs, window), (nodes, values) in totals.items():
+        assert values == plain_values, f"pvs={use_pvs} window={window}: {values} != {plain_values}"
+        print(f"   pvs={use_pvs!s:<5} window={window:<3} nodes={nodes:>7,}")
+    assert totals[True, 60][0] < plain_nodes
+
+    print("TEST PASSED ✓\n")
+
+
+def test_history_ordering():
+    """History and counter-move ordering: lookup order, same values, aging"""
+    print("="*80)
+    print("TEST: History and Counter-Move Ordering")
+    print("="*80)
+
+    import AI.GrandmasterEngine as grandmaster
+
+    # Hash move first, then the counter move, then by history score
+    engine = _quiet(GrandmasterEngine, num_workers=1, tt_size_mb=4)
+    game = _position()
+    moves = game.get_valid_moves()
+    legal = list(squares(moves))
+    hash_square, counter, top = legal[-1], legal[0], legal[1]
+    engine.previous_square = 20
+    engine.counter_moves[0 if game.turn == 'B' else 1][20] = counter
+    engine.history[0 if game.turn == 'B' else 1][top] = 10**6
+    ordered = engine.order_interior_moves(game, moves, 2, hash_square)
+    assert ordered[:3] == [hash_square, counter, top] and sorted(ordered) == sorted(legal)
+
+    # Same values as mobility-probe ordering at every node, fewer probes
+    values = {}
+    saved = grandmaster.MOBILITY_ORDER_DEPTH
+    try:
+        for threshold in (1, saved):
+            grandmaster.MOBILITY_ORDER_DEPTH = threshold
+            engine = _quiet(GrandmasterEngine, num_workers=1, tt_size_mb=4)
+            engine.aspiration_window = 0
+            root_squares = engine.order_root_moves(game, game.legal_squares())
+            values[threshold] = [engine.search_root(game, depth, root_squares)[1]
+                                 for depth in range(1, 7)]
+    finally:
+        grandmaster.MOBILITY_ORDER_DEPTH = saved
+    assert values[1] == values[saved], f"{values[1]} != {values[saved]}"
+    assert any(any(history) for history in engine.history), "cutoffs credited"
+    assert any(square != NO_MOVE for table in engine.counter_moves for square in table)
+
+    # Aging: halved once per new root position
+    score = max(engine.history[0] + engine.history[1])
+    root = (game.black, game.white, game.turn)
+    engine.new_root(root)
+    engine.new_root(root)
+    assert max(engine.history[0] + engine.history[1]) == score >> grandmaster.HISTORY_AGING_SHIFT
+    print(f"  values {values[saved]}, top history score {score}")
+
+    print("TEST PASSED ✓\n")
+
+
+def test_hash_move_iid_etc():
+    """Hash move first, internal iterative deepening and enhanced transposition cutoffs"""
+    print("="*80)
+    print("TEST: Hash Move, IID and Enhanced Transposition Cutoffs")
+    print("="*80)
+
+    import AI.BitboardMinimaxEngine as bitboard
+
+    game = _position()
+    legal = list(squares(game.get_valid_moves()))
+
+    # ETC: a child stored as an upper bound <= -beta refutes the node
+    engine = BitboardMinimaxEngine(tt_size_mb=4)
+    assert engine.enhanced_cutoff(game, game.get_valid_moves(), 4, 50) == NO_MOVE
+    square = legal[2]
+    flips = game.make(square)
+    engine.transposition_table.store(game.zobrist, 3, -60, TT_UPPER)
+    game.unmake(square, flips)
+    assert engine.enhanced_cutoff(game, game.get_valid_moves(), 4, 50) == square
+    assert engine.enhanced_cutoff(game, game.get_valid_moves(), 4, 70) == NO_MOVE
+    assert engine.enhanced_cutoff(game, game.get_valid_moves(), 5, 50) == NO_MOVE, "too shallow"
+    assert engine.alphabeta(game, 4, 40, 50) == 50
+
+    # IID: a shallower search of the node provides its hash move
+    engine = BitboardMinimaxEngine(tt_size_mb=4)
+    assert engine.hash_move(game) == NO_MOVE
+    assert engine.internal_iterative_deepening(game, 5, -INFINITY, INFINITY) in legal
+
+    # Same values and moves as without them, with fewer nodes
+    results = {}
+    saved = bitboard.IID_MIN_DEPTH, bitboard.ETC_MIN_DEPTH
+    try:
+        for enabled in (False, True):
+            bitboard.IID_MIN_DEPTH, bitboard.ETC_MIN_DEPTH = saved if enabled else (99, 99)
+            nodes = 0
+            values = []
+            for moves in (('F5', 'F6', 'E6', 'F4', 'C3'), ('F5', 'D6', 'C3', 'D3', 'C4')):
+                engine = BitboardMinimaxEngine(tt_size_mb=4)
+                values.append(engine.alphabeta(_position(moves), 6, -INFINITY, INFINITY))
+                nodes += engine.nodes
+            results[enabled] = nodes, values
+    finally:
+        bitboard.IID_MIN_DEPTH, bitboard.ETC_MIN_DEPTH = saved
+    assert results[True][1] == results[False][1]
+    assert results[True][0] < results[False][0]
+    print(f"  depth 6: {results[False][0]:,} -> {results[True][0]:,} nodes, "
+          f"values {results[True][1]}")
+
+    print("TEST PASSED ✓\n")
+
+
+def test_persistent_workers():
+    """Root-split workers keep their engine and table across tasks and turns"""
+    print("="*80)
+    print("TEST: Persistent Root-Split Workers")
+    print("="*80)
+
+    import pickle
+    from AI import ParallelBitboardMinimaxEngine as parallel
+
+    # Tasks are small tuples, not pickled games
+    game = _position()
+    tasks = parallel.root_tasks(game, list(game.legal_squares()), 5)
+    assert len(pickle.dumps(tasks[0])) < 100
+
+    # In-process worker: same values as a fresh engine, fewer nodes on a repeat
+    parallel.init_worker(tt_size_mb=4)
+    engine = parallel._worker.engine
+    first = [parallel.evaluate_move_worker(task) for task in tasks]
+    assert parallel._worker.engine is engine
+    repeat = [parallel.evaluate_move_worker(task) for task in tasks]
+    for task, (square, value, nodes, _, exact), again in zip(tasks, first, repeat):
+        reference = BitboardMinimaxEngine(tt_size_mb=4)
+        flips = game.make(square)
+        assert value == -reference.alphabeta(game, 4, -INFINITY, INFINITY) and exact
+        game.unmake(square, flips)
+        assert again[:2] == (square, value) and again[2] <= nodes
+    assert sum(r[2] for r in repeat) < sum(r[2] for r in first)
+
+    # Pool of persistent workers agrees with the sequential search
+    engine = _quiet(parallel.ParallelBitboardMinimaxEngine, num_workers=2, tt_size_mb=4)
+    try:
+        expected = _quiet(BitboardMinimaxEngine(tt_size_mb=4).get_best_move, _position(), 7)
+        assert str(_quiet(engine.get_best_move, _position(), 7)) == str(expected)
+        first_nodes = engine.nodes
+        assert str(_quiet(engine.get_best_move, _position(), 7)) == str(expected)
+        assert engine.nodes < first_nodes, "worker tables not kept between turns"
+    finally:
+        engine.close_pool()
+
+    print("TEST PASSED ✓\n")
+
+
+def test_shared_bound_root_split():
+    """Root split scouts against a shared bound and keeps sequential pruning"""
+    print("="*80)
+    print("TEST: Shared Alpha Bound in Root-Parallel Search")
+    print("="*80)
+
+    from multiprocessing import Value
+    from AI import ParallelBitboardMinimaxEngine as parallel
+
+    # In-process worker: exact above the shared bound, upper bound below it
+    game = _position()
+    tasks = parallel.root_tasks(game, list(game.legal_squares()), 4)
+    shared = Value('i', -INFINITY)
+    parallel.init_worker(4, shared)
+    exact = {square: value for square, value, _, _, _ in map(parallel.evaluate_move_worker, tasks)}
+    assert shared.value == max(exact.values())
+    for square, value, _, _, is_exact in map(parallel.evaluate_move_worker, tasks):
+        assert value <= shared.value and not is_exact, "scouted at the best value: upper bound"
+        if exact[square] == shared.value:
+            assert value == exact[square]
+    parallel.init_worker(4)
+
+    # Completion order: an upper bound tying the best value arrives before
+    # the exact result that raised the bound, and must not be played
+    square_exact, square_bound = list(game.legal_squares())[:2]
+    results = [(square_bound, 12, 10, 0, False), (square_exact, 12, 10, 0, True)]
+    for factory, select in (
+            (lambda: parallel.ParallelBitboardMinimaxEngine(num_workers=1, tt_size_mb=4),
+             lambda engine: engine._get_best_move_parallel(game, 4, None, [square_exact])),
+            (lambda: GrandmasterEngine(num_workers=1, tt_size_mb=4),
+             lambda engine: engine._get_best_move_parallel_ordered(game, 4, None, [square_exact]))):
+        engine = _quiet(factory)
+        try:
+            engine._get_lease()
+            engine.search_root_parallel = lambda game, depth, squares: results
+            move = _quiet(select, engine)
+            assert BitboardGame.move_to_square(move) == square_exact, \
+                f"{type(engine).__name__} played the upper bound {move}"
+        finally:
+            engine.close_pool()
+    assert parallel.improves_root_result(12, True, 12, 'C4')
+    assert not parallel.improves_root_result(12, False, 12, 'C4')
+
+    # Pool: same move as the pruned sequential search, similar node count
+    for factory in (lambda n: parallel.ParallelBitboardMinimaxEngine(num_workers=n, tt_size_mb=4),
+                    lambda n: GrandmasterEngine(num_workers=n, tt_size_mb=4)):
+        sequential = _quiet(factory, 1)
+        expected = _quiet(sequential.get_best_move, _position(), 7)
+        engine = _quiet(factory, 2)
+        try:
+            assert str(_quiet(engine.get_best_move, _position(), 7)) == str(expected)
+            assert engine.nodes < 1.5 * sequential.nodes, \
+                f"{type(engine).__name__}: {engine.nodes} vs {sequential.nodes} sequential"
+        finally:
+            engine.close_pool()
+
+    print("TEST PASSED ✓\n")
+
+
+def test_lazy_smp():
+    """Shared-memory table and Lazy SMP search for narrow roots"""
+    print("="*80)
+    print("TEST: Lazy SMP with Shared Transposition Table")
+    print("="*80)
+
+    from AI.ParallelBitboardMinimaxEngine import (
+        ParallelBitboardMinimaxEngine, SEARCH_ROOT_SPLIT, SEARCH_LAZY_SMP
+    )
+
+    # Shared table: visible through a second attachment, torn entries miss
+    table = SharedTranspositionTable(size_mb=1)
+    other = SharedTranspositionTable(size_mb=1, name=table.name)
+    try:
+        assert len(table) == 65536
+        key = 0x0123456789ABCDEF
+        table.store(key, 7, -321, TT_LOWER, 42)
+        assert other.probe(key) == (7, -321, TT_LOWER, 42)
+        other.new_search()
+        assert table.age == 1
+
+        # Data word rewritten without its key, as by a concurrent store
+        index = (key & table.bucket_mask) << 1
+        table.data[index] ^= 1 << 20
+        assert other.probe(key) is None, "torn entry must not verify"
+    finally:
+        other.close()
+        table.close()
+
+    # Mode selection: Lazy SMP where root splitting has too few moves
+    engine = _quiet(ParallelBitboardMinimaxEngine, num_workers=2)
+    assert engine.parallel_mode(6, 10) is None
+    assert engine.parallel_mode(7, 10) == SEARCH_ROOT_SPLIT
+    assert engine.parallel_mode(7, 3) == SEARCH_LAZY_SMP
+    assert engine.parallel_mode(7, 1) is None
+    engine.search_mode = SEARCH_LAZY_SMP
+    assert engine.parallel_mode(7, 10) == SEARCH_LAZY_SMP
+
+    # Lazy SMP search: helpers share the work, the game is left untouched
+    engine = _quiet(GrandmasterEngine, num_workers=2, tt_size_mb=4, search_mode=SEARCH_LAZY_SMP)
+    try:
+        game = _position()
+        state = (game.black, game.white, game.turn, game.zobrist)
+        move = _quiet(engine.get_best_move, game, 7)
+        assert (game.black, game.white, game.turn, game.zobrist) == state
+        assert str(move) in [str(m) for m in game.get_move_list()]
+        name = engine._shared_table.name
+    finally:
+        engine.close_pool()
+    try:
+        SharedTranspositionTable(size_mb=4, name=name)
+        assert False, "shared table not freed"
+    except FileNotFoundError:
+        pass
+
+    print("TEST PASSED ✓\n")
+
+
+def test_ybwc():
+    """YBWC split-point search: same value as sequential, helpers abort per split"""
+    print("="*80)
+    print("TEST: YBWC Split-Point Parallel Search")
+    print("="*80)
+
+    from multiprocessing import Value
+    from AI.YBWCBitboardMinimaxEngine import YBWCBitboardMinimaxEngine, SplitAbort
+    from AI.factory.engine_registry import EngineRegistry
+    import AI.implementations.parallel.ybwc_engine
+
+    # Abort flag: only helpers of the aborted split point stop
+    flag = Value('i', 0)
+    first, second = SplitAbort(flag, 1), SplitAbort(flag, 2)
+    assert not first.value and not second.value
+    flag.value = 1
+    assert first.value and not second.value
+
+    # Splits below the root; the chosen move scores the sequential value
+    engine = _quiet(YBWCBitboardMinimaxEngine, num_workers=2, tt_size_mb=4, split_depth=3)
+    try:
+        for moves in [('F5', 'F6', 'E6', 'F4', 'C3'), ('F5', 'D6', 'C3', 'D3', 'C4')]:
+            game = _position(moves)
+            state = (game.black, game.white, game.turn, game.zobrist)
+            move = _quiet(engine.get_best_move, game, 5)
+            assert (game.black, game.white, game.turn, game.zobrist) == state
+            assert engine.splits > 1, "internal nodes must be split"
+
+            reference = BitboardMinimaxEngine(tt_size_mb=4)
+            reference.nodes = reference.pruning = 0
+            _, best_value = reference.search_root(game, 5, list(squares(game.get_valid_moves())))
+            _, value = reference.search_root(game, 5, [game.move_to_square(move)])
+            assert value == best_value, f"{move} scores {value}, best is {best_value}"
+            print(f"  {'-'.join(moves)}: {move} ({value}), {engine.splits} splits")
+
+        # Budgeted search stops helpers with the master
+        move = _quiet(engine.get_best_move, game, None, time_ms=300)
+        assert str(move) in [str(m) for m in game.get_move_list()]
+    finally:
+        engine.close_pool()
+
+    assert 'ybwc' in EngineRegistry.list_engines()
+    assert 'parallel' in EngineRegistry.get_metadata('ybwc').features
+
+    print("TEST PASSED ✓\n")
+
+
+def test_pool_manager():
+    """Process-wide pool: leases share the workers, quotas split busy cores"""
+    print("="*80)
+    print("TEST: Shared Worker Pool Manager")
+    print("="*80)
+
+    from AI.WorkerPool import PoolManager, get_pool_manager
+    from AI import ParallelBitboardMinimaxEngine as parallel
+
+    manager = PoolManager(processes=4)
+    try:
+        first = manager.acquire(8, parallel.activate_worker, (4,))
+        second = manager.acquire(2, parallel.activate_worker, (4,))
+        assert first.quota == 4 and second.quota == 2, "quota capped by pool and request"
+
+        # While the second lease has work in the pool, the first gets half
+        busy = second.apply_async(time.sleep, 0.5)
+        assert first.quota == 2
+        busy.get()
+        assert first.quota == 4
+
+        # Leased tasks run in the lease's worker engine
+        game = _position()
+        tasks = parallel.root_tasks(game, list(game.legal_squares()), 3)
+        results = sorted(first.imap_unordered(parallel.evaluate_move_worker, tasks))
+        assert [r[0] for r in results] == sorted(game.legal_squares())
+
+        # Released slots are reused, the pool stays up
+        pool = manager.pool
+        second.release()
+        third = manager.acquire(1, parallel.activate_worker, (4,))
+        assert third.slot == second.slot and manager.pool is pool
+    finally:
+        manager.shutdown()
+    assert first.released and manager.pool is None
+
+    # Parallel engines lease from the singleton instead of owning pools
+    engines = [_quiet(GrandmasterEngine, num_workers=24, tt_size_mb=4) for _ in range(2)]
+    try:
+        for engine in engines:
+            _quiet(engine.get_best_move, _position(), 7)
+        leases = [engine._lease for engine in engines]
+        assert leases[0].manager is leases[1].manager is get_pool_manager()
+        assert leases[0].quota <= get_pool_manager().processes
+    finally:
+        for engine in engines:
+            engine.close_pool()
+    assert all(lease.released for lease in leases)
+
+    print("TEST PASSED ✓\n")
+
+
+def test_parallel_search_decorator():
+    """Any registered engine: root moves scored by its rebuilt copies in the pool"""
+    print("="*80)
+    print("TEST: Parallel Search Decorator")
+    print("="*80)
+
+    from Reversi.Game import Game
+    from AI.implementations.standard.minimax_engine import MinimaxEngine
+    from AI.implementations.standard.heuristic_engine import HeuristicEngine
+    from AI.features.parallel_search_decorator import ParallelSearchDecorator
+
+    game = Game(8)
+    for move in ('F5', 'F6', 'E6', 'F4', 'C3'):
+        game.move(Move(ord(move[0]) - 64, int(move[1])))
+
+    for engine_class in (MinimaxEngine, HeuristicEngine):
+        sequential = _quiet(engine_class)
+        expected = _quiet(sequential.get_best_move, game, 4)
+
+        decorated = ParallelSearchDecorator(_quiet(engine_class), threads=3)
+        try:
+            move = _quiet(decorated.get_best_move, game, 4)
+            stats = decorated.get_statistics()
+            assert decorated.lease is not None, "search ran in the worker pool"
+        finally:
+            decorated.close()
+        assert str(move) == str(expected), f"{engine_class.__name__}: {move} != {expected}"
+        assert stats['nodes_evaluated'] > 0, "worker statistics merged"
+        assert decorated.lease is None
+        print(f"  {engine_class.__name__}: {move}, {stats['nodes_evaluated']} nodes")
+
+    print("TEST PASSED ✓\n")
+
+
+def _worker_table_name(task):
+    """Pool task: name of the calling worker's transposition table"""
+    from AI import ParallelBitboardMinimaxEngine as parallel
+    time.sleep(0.05)
+    return parallel._worker.engine.transposition_table.name
+
+
+def test_thread_backend():
+    """Worker threads share one table; threads are used only without the GIL"""
+    print("="*80)
+    print("TEST: Thread Search Backend")
+    print("="*80)
+
+    from AI.WorkerPool import (PoolManager, BACKEND_PROCESS, BACKEND_THREAD,
+                               gil_enabled, resolve_backend, get_pool_manager)
+    from AI.TranspositionTable import local_table
+    from AI import ParallelBitboardMinimaxEngine as parallel
+    from AI.factory.engine_builder import EngineBuilder
+
+    # Threads only pay off without the GIL: otherwise processes
+    assert resolve_backend(BACKEND_PROCESS) == BACKEND_PROCESS
+    assert resolve_backend(BACKEND_THREAD) == (BACKEND_PROCESS if gil_enabled() else BACKEND_THREAD)
+    for bad in (lambda: resolve_backend('fiber'), lambda: EngineBuilder().with_search_backend('fiber')):
+        try:
+            bad()
+            assert False, "unknown backend accepted"
+        except ValueError:
+            pass
+
+    # A thread pool runs the same tasks; its workers share one table
+    game = _position()
+    tasks = parallel.root_tasks(game, list(game.legal_squares()), 4)
+    manager = PoolManager(processes=2, backend=BACKEND_THREAD)
+    try:
+        lease = manager.acquire(2, parallel.activate_worker, (4,))
+        results = []
+        for task in tasks:
+            lease.bound.value = -INFINITY  # exact values, no scouting
+            results.append(lease.apply(parallel.evaluate_move_worker, task))
+        names = set(lease.imap_unordered(_worker_table_name, range(4)))
+    finally:
+        manager.shutdown()
+    for square, value, _, _, _ in results:
+        flips = game.make(square)
+        assert value == -BitboardMinimaxEngine(tt_size_mb=4).alphabeta(game, 3, -INFINITY, INFINITY)
+        game.unmake(square, flips)
+    assert len(names) == 1 and local_table(names.pop()) is not None
+
+    # Engines forced onto threads: root split searches like the
+    # sequential engine, Lazy SMP shares an in-process table
+    expected = _quiet(BitboardMinimaxEngine(tt_size_mb=4).get_best_move, game, 7)
+    for search_mode in (parallel.SEARCH_ROOT_SPLIT, parallel.SEARCH_LAZY_SMP):
+        engine = _quiet(parallel.ParallelBitboardMinimaxEngine, num_workers=2, tt_size_mb=4,
+                        search_mode=search_mode, backend=BACKEND_THREAD)
+        engine.backend = BACKEND_THREAD
+        try:
+            move = _quiet(engine.get_best_move, game, 7)
+            assert engine._lease.manager is get_pool_manager(BACKEND_THREAD)
+            table = engine._shared_table
+        finally:
+            engine.close_pool()
+        if search_mode == parallel.SEARCH_ROOT_SPLIT:
+            assert str(move) == str(expected), f"{move} != {expected}"
+        else:
+            assert str(move) in [str(m) for m in game.get_move_list()]
+            assert not isinstance(table, SharedTranspositionTable)
+            assert local_table(table.name) is None, "table released"
+        print(f"  {search_mode}: {move}")
+    get_pool_manager(BACKEND_THREAD).shutdown()
+
+    print("TEST PASSED ✓\n")
+
+
+class _PauseControl:
+    """Board control stub: requests a pause after `frames` event checks"""
+
+    def __init__(self, frames):
+        self.frames = 0
+        self.pause_after = frames
+        self.should_exit = False
+        self.should_pause = False
+
+    def check_events(self):
+        self.frames += 1
+        self.should_pause = self.frames >= self.pause_after
+
+
+def test_background_search():
+    """start_search(): result, progress and a stop that aborts mid-tree"""
+    print("="*80)
+    print("TEST: Background Search")
+    print("="*80)
+
+    from Reversi.Game import Game
+    from Players.ai.ai_player import AIPlayer
+    from AI.base.search_handle import SearchLimits
+    from AI.implementations.standard.minimax_engine import MinimaxEngine
+    from AI.implementations.bitboard.bitboard_engine import BitboardEngine
+
+    assert SearchLimits.of(5) == SearchLimits(depth=5)
+    assert SearchLimits.of({'time_ms': 100}).budget_kwargs() == {'time_ms': 100}
+
+    game = Game(8)
+    for move in ('F5', 'F6', 'E6', 'F4', 'C3'):
+        game.move(Move(ord(move[0]) - 64, int(move[1])))
+
+    for engine_class, depth in ((BitboardEngine, 5), (MinimaxEngine, 3)):
+        engine = _quiet(engine_class)
+        expected = _quiet(engine.get_best_move, game, depth)
+
+        # Same move as the blocking search, with progress along the way
+        progress = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            handle = engine.start_search(game, SearchLimits(depth=depth), progress=progress.append)
+            move = handle.result(timeout=60)
+        assert str(move) == str(expected), f"{engine_class.__name__}: {move} != {expected}"
+        assert handle.poll() and progress and str(progress[-1]['move']) == str(move)
+        assert engine.search_stop is None, "stop flag detached after the search"
+
+        # stop() aborts a deep search mid-tree; one search at a time
+        with contextlib.redirect_stdout(io.StringIO()):
+            handle = engine.start_search(game, SearchLimits(depth=20))
+            try:
+                engine.start_search(game, 4)
+                assert False, "second search started"
+            except RuntimeError:
+                pass
+            time.sleep(0.2)
+            start = time.perf_counter()
+            handle.stop()
+            assert handle.wait(5), "search not stopped"
+        elapsed = time.perf_counter() - start
+        assert elapsed < 1.0, f"{elapsed:.2f}s to stop"
+        move = handle.result()
+        assert move is None or str(move) in [str(m) for m in game.get_move_list()]
+        print(f"  {engine_class.__name__}: {expected}, {len(progress)} progress reports, "
+              f"stopped in {elapsed * 1000:.0f} ms")
+
+    # AIPlayer keeps handling events while searching; a pause stops the search
+    control = _PauseControl(frames=10)
+    player = AIPlayer(BitboardEngine(), depth=20)
+    start = time.perf_counter()
+    move = _quiet(player.get_move, game, game.get_move_list(), control)
+    assert move is None and control.frames == 10
+    assert time.perf_counter() - start < 2.0
+
+    print("TEST PASSED ✓\n")
+
+
+def test_pondering():
+    """Predicted reply from the table; ponder hits continue, misses stop the search"""
+    print("="*80)
+    print("TEST: Pondering")
+    print("="*80)
+
+    from Reversi.Game import Game
+    from Players.ai.ai_player import AIPlayer, position_key
+    from AI.implementations.bitboard.bitboard_engine import BitboardEngine
+
+    game = Game(8)
+    for move in ('F5', 'F6', 'E6', 'F4', 'C3'):
+        game.move(Move(ord(move[0]) - 64, int(move[1])))
+
+    # The predicted reply is the opponent's best move one ply shallower
+    engine = BitboardEngine()
+    game.move(_quiet(engine.get_best_move, game, 4))
+    reply = engine.predict_reply(game)
+    assert str(reply) == str(_quiet(BitboardEngine().get_best_move, game, 3))
+    assert BitboardEngine().predict_reply(game) is None, "nothing searched yet"
+    game.undo_move()
+
+    for time_ms, depth in ((100, None), (None, 4)):
+        player = AIPlayer(BitboardEngine(), depth=depth, time_ms=time_ms, ponder=True)
+        try:
+            # After a move the engine searches the predicted position
+            with contextlib.redirect_stdout(io.StringIO()):
+                move = player.get_move(game, game.get_move_list(), None)
+            assert player._ponder_handle is not None and player._ponder_key is not None
+            game.move(move)
+            for reply in game.get_move_list():
+                game.move(reply)
+                if position_key(game) == player._ponder_key:
+                    break
+                game.undo_move()
+            assert position_key(game) == player._ponder_key
+
+            # Ponder hit: the same search goes on and answers
+            with contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                move = player.get_move(game, game.get_move_list(), None)
+            assert player.ponder_hits == 1 and player.ponder_misses == 0
+            assert str(move) in [str(m) for m in game.get_move_list()]
+            if time_ms:
+                assert time.perf_counter() - start < 0.5, "ponder hit keeps the move budget"
+            game.move(move)
+
+            # Ponder miss: the ponder search is stopped, a new one started
+            for reply in game.get_move_list():
+                game.move(reply)
+                if position_key(game) != player._ponder_key:
+                    break
+                game.undo_move()
+            pondering = player._ponder_handle
+            with contextlib.redirect_stdout(io.StringIO()):
+                move = player.get_move(game, game.get_move_list(), None)
+            assert player.ponder_misses == 1 and pondering.poll() and pondering.stopped
+            assert str(move) in [str(m) for m in game.get_move_list()]
+            for _ in range(4):
+                game.undo_move()
+        finally:
+            _quiet(player.close)
+        assert player._ponder_handle is None and player.engine.search_stop is None
+        print(f"  time_ms={time_ms}, depth={depth}: hit and miss handled")
+
+    print("TEST PASSED ✓\n")
+
+
+def test_probcut():
+    """Multi-ProbCut: calibration file, cut windows, fewer nodes, off by default"""
+    print("="*80)
+    print("TEST: Multi-ProbCut")
+    print("="*80)
+
+    import tempfile
+    from AI.ProbCut import (ProbCut, load_probcut, save_probcut, shallow_depth,
+                            PROBCUT_FILE, PROBCUT_MIN_DEPTH)
+
+    assert [shallow_depth(depth) for depth in range(3, 10)] == [1, 2, 3, 2, 3, 4, 5]
+
+    # Windows: deep = a * shallow + b, cut at selectivity * sigma
+    probcut = ProbCut({4: (2, {3: (1.0, 0.0, 10.0), 5: (2.0, 4.0, 8.0)})}, selectivity=1.5)
+    assert probcut.windows(4, 30, -20, 20) == (2, 35, -35)
+    assert probcut.windows(4, 52, -20, 20) == (2, 14, -18), "nearest phase, scaled"
+    assert probcut.windows(8, 30, -20, 20) == (6, 35, -35), "deeper: same depth gap"
+    assert probcut.windows(5, 30, -20, 20) is None, "no pair of that parity"
+    assert probcut.windows(4, 4, -20, 20) is None, "search reaches the end"
+
+    # Calibration file round trip, per evaluation profile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'probcut.json')
+        save_probcut('test', {4: (2, {3: (1.0, 0.0, 10.0, 50)})}, path)
+        assert load_probcut('test', 1.5, path).pairs == {4: (2, {3: (1.0, 0.0, 10.0)})}
+        assert _quiet(load_probcut, 'other', 1.5, path) is None
+
+    # The shipped calibration covers the bitboard and Grandmaster evaluations
+    for engine in (BitboardMinimaxEngine(), _quiet(GrandmasterEngine, num_workers=1)):
+        probcut = load_probcut(engine.evaluation_profile(), path=PROBCUT_FILE)
+        assert probcut is not None and probcut.check(PROBCUT_MIN_DEPTH, 40) is not None
+        assert probcut.check(12, 40) is not None, "deeper nodes extrapolated"
+
+    # Off unless configured; on, the same search visits fewer nodes
+    game = _position()
+    plain = BitboardMinimaxEngine()
+    assert plain.selectivity is None and plain.probcut is None
+    plain_move = _quiet(plain.get_best_move, game, 7)
+    selective = BitboardMinimaxEngine()
+    selective.set_selectivity(1.5)
+    move = _quiet(selective.get_best_move, game, 7)
+    assert move in game.get_move_list()
+    assert selective.nodes < plain.nodes, f"{selective.nodes} >= {plain.nodes}"
+    print(f"  depth 7: {plain.nodes} nodes -> {selective.nodes} with ProbCut "
+          f"({plain_move} / {move})")
+
+    # Through the builder, per preset
+    from AI.factory.engine_builder import EngineBuilder
+    from Players.presets.factory import PresetFactory
+    engine = EngineBuilder().use_bitboard().with_probcut(1.2).build()
+    assert engine._legacy_engine.selectivity == 1.2
+    assert EngineBuilder().use_bitboard().build()._legacy_engine.probcut is None
+    player = _quiet(PresetFactory.create, 'Quantum Mind', threads=1)
+    engine = player.engine
+    while hasattr(engine, 'engine'):  # decorators
+        engine = engine.engine
+    assert engine._legacy_engine.selectivity == 1.5
+    _quiet(player.close)
+
+    print("TEST PASSED ✓\n")
+
+
+def test_mtdf():
+    """MTD(f) finds the alpha-beta move and value with zero-window passes"""
+    print("="*80)
+    print("TEST: MTD(f)")
+    print("="*80)
+
+    from AI.MTDfBitboardMinimaxEngine import MTDfBitboardMinimaxEngine
+
+    # Same move and value as the full-window search, fewer nodes
+    nodes = {False: 0, True: 0}
+    for moves in (('F5', 'F6', 'E6', 'F4', 'C3'), ('F5', 'D6', 'C3', 'D3', 'C4')):
+        plain = _quiet(BitboardMinimaxEngine, tt_size_mb=4)
+        mtdf = _quiet(MTDfBitboardMinimaxEngine, tt_size_mb=4)
+        expected = _quiet(plain.iterative_deepening, _position(moves), 6)
+        move = _quiet(mtdf.get_best_move, _position(moves), 6)
+        assert str(move) == str(expected), f"{move} != {expected}"
+        assert mtdf.passes > 0 and set(mtdf.iteration_values) == set(range(1, 7))
+        assert mtdf.iteration_values[6] == plain.alphabeta(_position(moves), 6,
+                                                           -INFINITY, INFINITY)
+        nodes[False] += plain.nodes
+        nodes[True] += mtdf.nodes
+    assert nodes[True] < nodes[False], f"{nodes[True]} >= {nodes[False]}"
+    print(f"  depth 6: {nodes[False]:,} -> {nodes[True]:,} nodes with MTD(f)")
+
+    # Registered, and through the builder
+    from AI.factory.engine_registry import EngineRegistry
+    from AI.factory.engine_builder import EngineBuilder
+    import AI.implementations.bitboard.mtdf_engine  # noqa: F401 (registration)
+    assert EngineRegistry.is_registered('mtdf')
+    engine = _quiet(EngineBuilder().use_mtdf().build)
+    game = _position()
+    move = _quiet(engine.get_best_move, game, 3)
+    assert BitboardGame.move_to_square(move) in set(squares(game.get_valid_moves()))
+    assert engine.get_statistics()['mtdf_passes'] > 0
+
+    print("TEST PASSED ✓\n")
+
+
+def test_late_move_reductions():
+    """Late moves are searched shallower, verified at full depth when they beat alpha"""
+    print("="*80)
+    print("TEST: Late Move Reductions")
+    print("="*80)
+
+    import pickle
+    from AI.LateMoveReductions import LMR_SCHEDULES, ReductionSchedule, reduction_schedule
+
+    # Schedules: even reductions of late moves only, one ply kept
+    assert reduction_schedule(None) is None
+    for name in LMR_SCHEDULES:
+        schedule = reduction_schedule(name)
+        assert pickle.loads(pickle.dumps(schedule)) == schedule
+        for depth in range(1, 20):
+            for index in range(40):
+                reduction = schedule.reduction(depth, index)
+                assert reduction % 2 == 0 and depth - 1 - reduction >= 1 or reduction == 0
+                if depth < schedule.min_depth or index < schedule.full_moves:
+                    assert reduction == 0
+    assert reduction_schedule({'min_depth': 4, 'full_moves': 1, 'base': 2, 'divisor': 4}) == \
+        ReductionSchedule(4, 1, 2, 4)
+    try:
+        reduction_schedule('reckless')
+        assert False, "unknown schedule accepted"
+    except ValueError:
+        pass
+    for parameters in ({'min_depth': 0, 'full_moves': 3, 'base': 0.25, 'divisor': 2.5},
+                       {'min_depth': 4, 'full_moves': -1, 'base': 0.25, 'divisor': 2.5}):
+        try:
+            reduction_schedule(parameters)
+            assert False, f"invalid schedule accepted: {parameters}"
+        except ValueError:
+            pass
+
+    # Corners and the hash move are never reduced
+    engine = BitboardMinimaxEngine(tt_size_mb=4)
+    engine.set_reductions('aggressive')
+    assert engine.late_move_reduction(8, 10, 0, NO_MOVE) == 0, "corner"
+    assert engine.late_move_reduction(8, 10, 20, 20) == 0, "hash move"
+    assert engine.late_move_reduction(8, 10, 20, NO_MOVE) > 0
+
+    # Fewer nodes, few verification re-searches, a legal move
+    for engine_class in (BitboardMinimaxEngine, lambda **kw: GrandmasterEngine(num_workers=1, **kw)):
+        nodes = []
+        for schedule in (None, 'standard'):
+            engine = _quiet(engine_class, tt_size_mb=4)
+            engine.set_reductions(schedule)
+            game = _position()
+            move = _quiet(engine.iterative_deepening, game, 7)
+            assert BitboardGame.move_to_square(move) in set(squares(game.get_valid_moves()))
+            nodes.append(engine.nodes)
+        assert engine.reduced > 0 and engine.re_searches < engine.reduced
+        assert nodes[1] < nodes[0], f"{nodes[1]} >= {nodes[0]}"
+        print(f"  {type(engine).__name__} depth 7: {nodes[0]:,} -> {nodes[1]:,} nodes, "
+              f"{engine.re_searches}/{engine.reduced} re-searched")
+
+    # Self-play against the same engine without reductions
+    from examples.lmr_selfplay import self_play
+    score, games = _quiet(self_play, 'standard', 2, 4)
+    assert 0 <= score <= games
+
+    # Through the builder, per preset
+    from AI.factory.engine_builder import EngineBuilder
+    from Players.presets.factory import PresetFactory
+    engine = EngineBuilder().use_bitboard().with_late_move_reductions('conservative').build()
+    assert engine._legacy_engine.reductions == reduction_schedule('conservative')
+    assert EngineBuilder().use_bitboard().build()._legacy_engine.reductions is None
+    try:
+        EngineBuilder().with_late_move_reductions('reckless')
+        assert False, "unknown schedule accepted"
+    except ValueError:
+        pass
+    player = _quiet(PresetFactory.create, 'Quantum Mind', threads=1)
+    engine = player.engine
+    while hasattr(engine, 'engine'):  # decorators
+        engine = engine.engine
+    assert engine._legacy_engine.reductions == reduction_schedule('standard')
+    _quiet(player.close)
+
+    print("TEST PASSED ✓\n")
+
+
+def run_all_tests():
+    """Run all tests"""
+    print("\n" + "="*80)
+    print("SEARCH ENGINES - TEST SUITE")
+    print("="*80 + "\n")
+
+    try:
+        test_transposition_table()
+        test_replacement_policy()
+        test_table_persists_across_moves()
+        test_iterative_deepening()
+        test_time_control_player()
+        test_endgame_solver()
+        test_endgame_trigger()
+        test_wld_solver()
+        test_parallel_endgame_solver()
+        test_principal_variation_search()
+        test_history_ordering()
+        test_hash_move_iid_etc()
+        test_mtdf()
+        test_persistent_workers()
+        test_shared_bound_root_split()
+        test_lazy_smp()
+        test_ybwc()
+        test_pool_manager()
+        test_parallel_search_decorator()
+        test_thread_backend()
+        test_background_search()
+        test_pondering()
+        test_probcut()
+        test_late_move_reductions()
+
+        print("="*80)
+        print("ALL TESTS PASSED ✅")
+        print("="*80 + "\n")
+        return True
+
+    except Exception as e:
+        print("\n" + "="*80)
+        print(f"❌ TEST FAILED: {e}")
+        print("="*80 + "\n")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)
@@ -346,6 +346,12 @@ class Tournament:
         
         self.games.append(game_stat)
         
+        # Players are rebuilt for every game: give their worker pool
+        # leases back now rather than whenever they are garbage collected
+        for player in (black_player, white_player):
+            if hasattr(player, 'close'):
+                player.close()
+        
         return game_stat
     
     def run(self):